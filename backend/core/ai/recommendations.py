@@ -1,8 +1,11 @@
 from typing import List, Dict, Optional
 import logging
+import numpy as np
 from django.conf import settings
 import anthropic
 
+from core.social.columnar import WEEKDAYS, group_means
+
 logger = logging.getLogger(__name__)
 
 anthropic_client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY) if hasattr(settings, 'ANTHROPIC_API_KEY') else None
@@ -33,38 +36,25 @@ class RecommendationEngine:
                 "confidence": 0.3,
             }
         
-        # Aggregate performance by day and hour
-        day_performance = {}
-        hour_performance = {}
-        
-        for post in historical_data:
-            posted_at = post["posted_at"]
-            engagement = post["engagement_rate"]
-            
-            day = posted_at.strftime("%A").lower()
-            hour = posted_at.hour
-            
-            if day not in day_performance:
-                day_performance[day] = []
-            day_performance[day].append(engagement)
-            
-            if hour not in hour_performance:
-                hour_performance[hour] = []
-            hour_performance[hour].append(engagement)
-        
-        # Calculate averages
-        day_avg = {day: sum(rates) / len(rates) for day, rates in day_performance.items()}
-        hour_avg = {hour: sum(rates) / len(rates) for hour, rates in hour_performance.items()}
+        # Average engagement by weekday and hour, vectorized
+        n = len(historical_data)
+        days = np.fromiter((post["posted_at"].weekday() for post in historical_data), dtype=np.int64, count=n)
+        hours = np.fromiter((post["posted_at"].hour for post in historical_data), dtype=np.int64, count=n)
+        engagement = np.fromiter(
+            (post["engagement_rate"] for post in historical_data), dtype=np.float64, count=n
+        )
+        day_avg, day_counts = group_means(days, engagement, 7)
+        hour_avg, hour_counts = group_means(hours, engagement, 24)
         
-        # Get top performers
-        best_days = sorted(day_avg.items(), key=lambda x: x[1], reverse=True)[:3]
-        best_hours = sorted(hour_avg.items(), key=lambda x: x[1], reverse=True)[:3]
+        # Get top performers (only slots that have posts)
+        best_days = [d for d in np.argsort(-day_avg, kind="stable") if day_counts[d]][:3]
+        best_hours = [h for h in np.argsort(-hour_avg, kind="stable") if hour_counts[h]][:3]
         
         confidence = min(len(historical_data) / 50, 1.0)  # More data = higher confidence
         
         return {
-            "best_days": [day for day, _ in best_days],
-            "best_hours": [hour for hour, _ in best_hours],
+            "best_days": [WEEKDAYS[d] for d in best_days],
+            "best_hours": [int(h) for h in best_hours],
             "confidence": confidence,
             "analysis": f"Based on {len(historical_data)} posts",
         }
@@ -2,7 +2,8 @@ import logging
 from datetime import datetime, timedelta
 from django.utils import timezone
 
-from core.social.models import SocialAccount, MetricsSnapshot, FollowerChange
+from core.social.follower_changes import daily_count_bound
+from core.social.models import SocialAccount, LatestMetrics, FollowerChange
 from core.content_studio.models import ContentBrief, ContentVariant
 from core.posts.models import Post
 
@@ -59,6 +60,13 @@ class AutomationExecutor:
         
         since = timezone.now() - timedelta(minutes=since_minutes)
         
+        # The per-day counters cover the whole window, so they bound the count from
+        # above: skip the exact count when even they stay below the threshold.
+        # Without a counter row for every day (not backfilled yet) count exactly.
+        bound = daily_count_bound(account_id, FollowerChange.TYPE_NEW_FOLLOWER, since)
+        if bound is not None and bound < threshold:
+            return False, {}
+        
         new_followers_count = FollowerChange.objects.filter(
             social_account_id=account_id,
             change_type=FollowerChange.TYPE_NEW_FOLLOWER,
@@ -86,6 +94,13 @@ class AutomationExecutor:
         
         since = timezone.now() - timedelta(minutes=since_minutes)
         
+        # The per-day counters cover the whole window, so they bound the count from
+        # above: skip the exact count when even they stay below the threshold.
+        # Without a counter row for every day (not backfilled yet) count exactly.
+        bound = daily_count_bound(account_id, FollowerChange.TYPE_UNFOLLOWER, since)
+        if bound is not None and bound < threshold:
+            return False, {}
+        
         unfollowers_count = FollowerChange.objects.filter(
             social_account_id=account_id,
             change_type=FollowerChange.TYPE_UNFOLLOWER,
@@ -112,8 +127,8 @@ class AutomationExecutor:
         if not all([account_id, metric, operator, threshold]):
             return False, {}
         
-        # Get latest snapshot
-        snapshot = MetricsSnapshot.objects.filter(social_account_id=account_id).first()
+        # Get latest metrics (primary key lookup instead of scanning every snapshot partition)
+        snapshot = LatestMetrics.objects.filter(social_account_id=account_id).first()
         
         if not snapshot:
             return False, {}
@@ -2,17 +2,27 @@ from celery import Celery
 from celery.schedules import crontab
 import os
 
+from core.celery_queues import configure as configure_queues
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
 app = Celery("core")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
+# Queues per workload class and platform (see core/celery_queues.py)
+configure_queues(app)
+
 # Periodic tasks schedule
 app.conf.beat_schedule = {
-    'sync-metrics-every-15min': {
-        'task': 'core.social.tasks.sync_all_accounts_metrics',
-        'schedule': crontab(minute='*/15'),
+    # Adaptive per-account intervals: each tick syncs the accounts whose next_sync_at is due
+    'sync-due-metrics-every-5min': {
+        'task': 'core.social.tasks.sync_due_accounts_metrics',
+        'schedule': crontab(minute='*/5'),
+    },
+    'rollup-metrics-every-15min': {
+        'task': 'core.social.tasks.rollup_metrics_snapshots',
+        'schedule': crontab(minute='5,20,35,50'),  # after the metrics sync
     },
     'detect-follower-changes-every-30min': {
         'task': 'core.social.tasks.detect_all_follower_changes',
@@ -27,6 +37,14 @@ app.conf.beat_schedule = {
         'task': 'core.social.tasks.update_all_top_content',
         'schedule': crontab(hour=2, minute=0),
     },
+    'maintain-partitions-daily': {
+        'task': 'core.social.tasks.maintain_partitions',
+        'schedule': crontab(hour=4, minute=0),
+    },
+    'apply-data-retention-daily': {
+        'task': 'core.social.tasks.apply_data_retention',
+        'schedule': crontab(hour=4, minute=30),
+    },
     'fetch-audience-insights-weekly': {
         'task': 'core.social.tasks.fetch_all_audience_insights',
         'schedule': crontab(day_of_week=1, hour=3, minute=0),
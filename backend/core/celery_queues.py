@@ -0,0 +1,82 @@
+"""Celery queue topology: one queue per workload class, per-platform sub-queues.
+
+Workload classes:
+
+- ``realtime``: automation checks and runs
+- ``metrics``: the adaptive metrics sync, rollups, follower change detection
+- ``bulk``: nightly/weekly backfills (top content, audience insights,
+  identity follower syncs, retention, partitions)
+
+Per-account work of the ``metrics`` and ``bulk`` classes is published to
+``<class>.<platform>`` (``platform_queue``), so a throttled platform only
+backs up its own queue. Each class gets its own worker pool, e.g.::
+
+    celery -A core worker -Q realtime -c 4
+    celery -A core worker -Q metrics,metrics.instagram,metrics.x,metrics.tiktok,metrics.linkedin -c 8
+    celery -A core worker -Q bulk,bulk.instagram,bulk.x,bulk.tiktok,bulk.linkedin -c 4
+
+Tasks not listed in TASK_ROUTES go to DEFAULT_QUEUE.
+"""
+
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional
+
+REALTIME = "realtime"
+METRICS = "metrics"
+BULK = "bulk"
+DEFAULT_QUEUE = "default"
+
+WORKLOAD_CLASSES = (REALTIME, METRICS, BULK)
+# SocialAccount.PLATFORM_* (not imported: this module is loaded before Django apps)
+PLATFORMS = ("instagram", "x", "tiktok", "linkedin")
+PLATFORM_SPLIT_CLASSES = (METRICS, BULK)
+
+# First matching pattern wins (same glob semantics as Celery's task_routes).
+TASK_ROUTES: Dict[str, Dict[str, str]] = {
+    "core.automations.tasks.*": {"queue": REALTIME},
+    "core.social.tasks.sync_all_accounts_metrics": {"queue": METRICS},
+    "core.social.tasks.sync_due_accounts_metrics": {"queue": METRICS},
+    "core.social.tasks.sync_accounts_metrics_batch": {"queue": METRICS},
+    "core.social.tasks.sync_account_metrics": {"queue": METRICS},
+    "core.social.tasks.rollup_metrics_snapshots": {"queue": METRICS},
+    "core.social.tasks.detect_*follower_changes": {"queue": METRICS},
+    "core.social.tasks.update_*top_content": {"queue": BULK},
+    "core.social.tasks.fetch_*audience_insights": {"queue": BULK},
+    "core.social.tasks.sync_*x_followers_identities": {"queue": BULK},
+    "core.social.tasks.run_account_chunk": {"queue": BULK},
+    "core.social.tasks.apply_data_retention": {"queue": BULK},
+    "core.social.tasks.maintain_partitions": {"queue": BULK},
+}
+
+
+def queue_names() -> List[str]:
+    names = [DEFAULT_QUEUE, *WORKLOAD_CLASSES]
+    names += [f"{c}.{p}" for c in PLATFORM_SPLIT_CLASSES for p in PLATFORMS]
+    return names
+
+
+def queue_for(task_name: str, platform: Optional[str] = None) -> str:
+    """Queue a task is published to, with its per-platform sub-queue when ``platform`` is given."""
+    queue = DEFAULT_QUEUE
+    for pattern, route in TASK_ROUTES.items():
+        if fnmatchcase(task_name, pattern):
+            queue = route["queue"]
+            break
+    if platform is not None and queue in PLATFORM_SPLIT_CLASSES:
+        return platform_queue(queue, platform)
+    return queue
+
+
+def platform_queue(workload: str, platform: str) -> str:
+    return f"{workload}.{platform}" if platform in PLATFORMS else workload
+
+
+def configure(app) -> None:
+    """Declare the queues and routes on the Celery app."""
+    from kombu import Queue
+
+    app.conf.task_queues = [Queue(name, routing_key=name) for name in queue_names()]
+    app.conf.task_default_queue = DEFAULT_QUEUE
+    app.conf.task_routes = TASK_ROUTES
@@ -4,4 +4,5 @@ from . import views
 urlpatterns = [
     path('test_total/', views.test_total, name='test_total'),
     path('health/', views.health_check, name='health_check'),
+    path('http_pool/', views.http_pool_stats, name='http_pool_stats'),
 ]
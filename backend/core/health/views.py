@@ -422,6 +422,23 @@ def test_models():
         }
 
 
+def http_pool_stats(request):
+    """
+    Connection pool statistics of the shared platform API HTTP session
+    (this process only: hits, new connections, wait time per host).
+
+    Usage:
+        curl http://localhost:8000/api/health/http_pool/
+    """
+    from core.social.http_pool import pool_stats
+
+    return JsonResponse({
+        "pid": os.getpid(),
+        "hosts": pool_stats(),
+        "timestamp": datetime.now().isoformat(),
+    })
+
+
 def health_check(request):
     """
     Simple health check endpoint (faster than test_total).
@@ -187,6 +187,81 @@ CELERY_TASK_ACKS_LATE = True
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_TASK_REJECT_ON_WORKER_LOST = True
 
+# Shared HTTP connection pool for platform API clients (connections per host, per process)
+SOCIAL_HTTP_POOL_DEFAULT_SIZE = int(os.environ.get('SOCIAL_HTTP_POOL_DEFAULT_SIZE', '10'))
+SOCIAL_HTTP_POOL_SIZES = {
+    'graph.facebook.com': int(os.environ.get('SOCIAL_HTTP_POOL_SIZE_INSTAGRAM', '20')),
+    'api.x.com': int(os.environ.get('SOCIAL_HTTP_POOL_SIZE_X', '20')),
+    'api.twitter.com': int(os.environ.get('SOCIAL_HTTP_POOL_SIZE_X', '20')),
+}
+
+# Metrics sync: accounts per batch task and concurrent requests per platform within a batch
+METRICS_SYNC_BATCH_SIZE = int(os.environ.get('METRICS_SYNC_BATCH_SIZE', '200'))
+METRICS_SYNC_CONCURRENCY = {
+    'instagram': int(os.environ.get('METRICS_SYNC_CONCURRENCY_INSTAGRAM', '50')),
+    'tiktok': int(os.environ.get('METRICS_SYNC_CONCURRENCY_TIKTOK', '50')),
+    'linkedin': int(os.environ.get('METRICS_SYNC_CONCURRENCY_LINKEDIN', '50')),
+    'x': int(os.environ.get('METRICS_SYNC_CONCURRENCY_X', '50')),
+}
+# Use platform bulk lookups (X GET /2/users?ids=, 100 accounts per request) in batch syncs
+METRICS_SYNC_BULK_LOOKUP = os.environ.get('METRICS_SYNC_BULK_LOOKUP', 'True') == 'True'
+# Unchanged metrics are not re-inserted until this many seconds after the last snapshot (0: write every sync).
+# Rollup buckets without a snapshot get carried-forward rows (core.social.rollups).
+METRICS_SNAPSHOT_HEARTBEAT = int(os.environ.get('METRICS_SNAPSHOT_HEARTBEAT', '3600'))
+
+# Adaptive metrics sync (core.social.sync_schedule): (floor, ceiling) interval in seconds per SocialAccount.sync_tier
+SYNC_TIERS = {
+    'priority': (5 * 60, 60 * 60),
+    'standard': (15 * 60, 6 * 60 * 60),
+    'economy': (60 * 60, 24 * 60 * 60),
+}
+
+# Beat fan-out (core.social.fanout): accounts per chunk message, seconds each run is spread over, random jitter
+FANOUT_CHUNK_SIZE = int(os.environ.get('FANOUT_CHUNK_SIZE', '50'))
+FANOUT_WINDOWS = {
+    'metrics': int(os.environ.get('FANOUT_WINDOW_METRICS', '600')),  # manual full sync
+    'metrics_due': int(os.environ.get('FANOUT_WINDOW_METRICS_DUE', '240')),  # beat every 5 min
+    'top_content': int(os.environ.get('FANOUT_WINDOW_TOP_CONTENT', '3600')),
+    'audience_insights': int(os.environ.get('FANOUT_WINDOW_AUDIENCE_INSIGHTS', '3600')),
+}
+FANOUT_JITTER = float(os.environ.get('FANOUT_JITTER', '5'))
+# Redis redelivers unacked messages (ETA messages included; acks_late) after visibility_timeout: it must
+# exceed the longest fan-out countdown plus the task time limit, or late chunks run twice
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'visibility_timeout': int(os.environ.get(
+        'CELERY_VISIBILITY_TIMEOUT',
+        max(FANOUT_WINDOWS.values()) + FANOUT_JITTER + CELERY_TASK_TIME_LIMIT + 30 * 60,
+    )),
+}
+
+# Identity-level follower sync
+FOLLOWER_SNAPSHOT_HISTORY = int(os.environ.get('FOLLOWER_SNAPSHOT_HISTORY', '5'))  # versions kept per account
+
+# Platform API rate governor (Redis token buckets shared by all workers)
+SOCIAL_RATE_GOVERNOR_ENABLED = os.environ.get('SOCIAL_RATE_GOVERNOR_ENABLED', 'True') == 'True'
+# Overrides of core.social.rate_governor.DEFAULT_LIMITS: {platform: {'app'|'user'|'endpoint': (requests/sec, burst)}}
+SOCIAL_RATE_LIMITS = {}
+
+# Data retention (days, 0 = keep forever); see core.social.retention
+DATA_RETENTION_DAYS = {
+    'metrics_snapshots': int(os.environ.get('RETENTION_METRICS_SNAPSHOTS_DAYS', '90')),  # raw, once rolled up
+    'metrics_rollups_hour': int(os.environ.get('RETENTION_METRICS_ROLLUPS_HOUR_DAYS', '180')),
+    'metrics_rollups_day': int(os.environ.get('RETENTION_METRICS_ROLLUPS_DAY_DAYS', '730')),
+    'follower_changes': int(os.environ.get('RETENTION_FOLLOWER_CHANGES_DAYS', '365')),
+    # never shorter than follower_changes (the policy clamps it)
+    'follower_change_daily_counts': int(os.environ.get('RETENTION_FOLLOWER_CHANGE_COUNTS_DAYS', '365')),
+    'automation_runs': int(os.environ.get('RETENTION_AUTOMATION_RUNS_DAYS', '90')),
+}
+DATA_RETENTION_BATCH_SIZE = int(os.environ.get('DATA_RETENTION_BATCH_SIZE', '5000'))  # rows per DELETE
+DATA_RETENTION_BATCH_PAUSE = float(os.environ.get('DATA_RETENTION_BATCH_PAUSE', '0.1'))  # seconds between batches
+
+# Monthly partitions created ahead for partitioned time-series tables (core.social.partitioning)
+PARTITION_MONTHS_AHEAD = int(os.environ.get('PARTITION_MONTHS_AHEAD', '3'))
+
+# Analytics endpoint response cache (core.social.response_cache); TTL bounds staleness from untracked writes
+ANALYTICS_CACHE_ENABLED = os.environ.get('ANALYTICS_CACHE_ENABLED', 'True') == 'True'
+ANALYTICS_CACHE_TTL = int(os.environ.get('ANALYTICS_CACHE_TTL', '900'))  # seconds
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
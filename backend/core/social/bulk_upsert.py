@@ -0,0 +1,121 @@
+"""Batched upserts for per-post tables (TopContent, ...).
+
+``BulkUpserter`` collects unsaved model instances and flushes them per batch:
+
+1. one SELECT of the existing rows for the batch keys (only the compared columns)
+2. rows whose compared values are identical are dropped
+3. the remaining rows are written with one ``INSERT ... ON CONFLICT DO UPDATE``
+   (``bulk_create(update_conflicts=True)``)
+
+so unchanged posts cost no write at all, and the counts returned by
+``result`` show how many rows were inserted, updated or left unchanged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class BulkUpserter:
+    """Collect rows with ``add`` and write them with ``flush`` (or as a context manager).
+
+    ``unique_fields`` must match a unique constraint of ``model``.
+    ``compare_fields`` (default: ``update_fields`` without auto_now fields)
+    decide whether an existing row changed.
+    """
+
+    def __init__(
+        self,
+        model,
+        *,
+        unique_fields: Sequence[str],
+        update_fields: Sequence[str],
+        compare_fields: Optional[Sequence[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.model = model
+        self.unique_fields = list(unique_fields)
+        self.update_fields = list(update_fields)
+        if compare_fields is None:
+            compare_fields = [
+                f for f in update_fields if not getattr(model._meta.get_field(f), "auto_now", False)
+            ]
+        self.compare_fields = list(compare_fields)
+        self.batch_size = max(1, batch_size)
+        self.result = UpsertResult()
+        self._pending: Dict[Tuple[Any, ...], Any] = {}
+
+    def __enter__(self) -> "BulkUpserter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def _attname(self, name: str) -> str:
+        return self.model._meta.get_field(name).attname
+
+    def _key(self, obj) -> Tuple[Any, ...]:
+        return tuple(getattr(obj, self._attname(f)) for f in self.unique_fields)
+
+    def _values(self, obj) -> Tuple[Any, ...]:
+        return tuple(
+            self.model._meta.get_field(f).to_python(getattr(obj, self._attname(f))) for f in self.compare_fields
+        )
+
+    def add(self, obj) -> None:
+        # Later rows for the same key win (ON CONFLICT cannot touch a row twice).
+        self._pending[self._key(obj)] = obj
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def extend(self, objs: Iterable[Any]) -> None:
+        for obj in objs:
+            self.add(obj)
+
+    def flush(self) -> UpsertResult:
+        if not self._pending:
+            return self.result
+        pending, self._pending = self._pending, {}
+
+        unique_attnames = [self._attname(f) for f in self.unique_fields]
+        compare_attnames = [self._attname(f) for f in self.compare_fields]
+        lookup = {f"{attname}__in": {key[i] for key in pending} for i, attname in enumerate(unique_attnames)}
+        existing = {
+            row[: len(unique_attnames)]: row[len(unique_attnames):]
+            for row in self.model.objects.filter(**lookup).values_list(*unique_attnames, *compare_attnames)
+        }
+
+        to_write: List[Any] = []
+        for key, obj in pending.items():
+            current = existing.get(key)
+            if current is None:
+                self.result.inserted += 1
+            elif tuple(current) == self._values(obj):
+                self.result.unchanged += 1
+                continue
+            else:
+                self.result.updated += 1
+            to_write.append(obj)
+
+        if to_write:
+            self.model.objects.bulk_create(
+                to_write,
+                update_conflicts=True,
+                unique_fields=self.unique_fields,
+                update_fields=self.update_fields,
+            )
+        return self.result
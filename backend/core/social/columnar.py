@@ -0,0 +1,203 @@
+"""Columnar metric analytics with NumPy.
+
+Series for many accounts are read with one streaming ``values_list`` query
+into flat arrays ordered by (account, timestamp); ``offsets`` marks where
+each account's run starts and ends. Statistics are then computed for every
+account at once with segment-wise NumPy operations (``reduceat``, ``cumsum``,
+``bincount``) instead of per-row Python loops.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.social.models import MetricsSnapshot, TopContent
+
+DEFAULT_CHUNK_SIZE = 20000
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+@dataclass
+class SeriesBatch:
+    """Per-account series stored as flat columns; account ``i`` owns rows offsets[i]:offsets[i+1]."""
+
+    account_ids: List[Any]
+    offsets: np.ndarray  # int64, len(account_ids) + 1
+    timestamps: Optional[np.ndarray]  # float64 epoch seconds (loaded on request)
+    values: Dict[str, np.ndarray]  # float64 per metric
+
+    def __len__(self) -> int:
+        return len(self.account_ids)
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self.offsets[:-1]
+
+    @property
+    def ends(self) -> np.ndarray:
+        """Index of each account's last row."""
+        return self.offsets[1:] - 1
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+
+def series_from_rows(
+    rows: Iterable[Tuple],
+    metrics: Sequence[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    with_timestamps: bool = False,
+) -> SeriesBatch:
+    """Build a SeriesBatch from (account_id, timestamp, *metrics) rows sorted by account, then time."""
+    rows = iter(rows)
+    ids: List[Any] = []
+    stamps: List[np.ndarray] = []
+    columns: List[List[np.ndarray]] = [[] for _ in metrics]
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        ids.extend(map(itemgetter(0), chunk))
+        if with_timestamps:
+            stamps.append(
+                np.fromiter((t.timestamp() for t in map(itemgetter(1), chunk)), dtype=np.float64, count=len(chunk))
+            )
+        for position, column in enumerate(columns, start=2):
+            values = (0.0 if v is None else v for v in map(itemgetter(position), chunk))
+            column.append(np.fromiter(values, dtype=np.float64, count=len(chunk)))
+
+    if not ids:
+        empty = np.empty(0, dtype=np.float64)
+        return SeriesBatch([], np.zeros(1, dtype=np.int64), empty if with_timestamps else None, {m: empty for m in metrics})
+
+    # Rows are grouped by account: a new segment starts wherever the id changes.
+    boundaries = [i for i, (a, b) in enumerate(zip(ids, islice(ids, 1, None)), start=1) if a != b]
+    offsets = np.array([0, *boundaries, len(ids)], dtype=np.int64)
+    return SeriesBatch(
+        account_ids=[ids[i] for i in offsets[:-1]],
+        offsets=offsets,
+        timestamps=np.concatenate(stamps) if with_timestamps else None,
+        values={m: np.concatenate(c) for m, c in zip(metrics, columns)},
+    )
+
+
+def load_snapshot_series(
+    metrics: Sequence[str] = ("followers_count",),
+    *,
+    since: Optional[datetime] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    with_timestamps: bool = False,
+    **filters,
+) -> SeriesBatch:
+    """MetricsSnapshot series per account (``filters`` apply to MetricsSnapshot)."""
+    qs = MetricsSnapshot.objects.filter(**filters)
+    if since is not None:
+        qs = qs.filter(timestamp__gte=since)
+    rows = (
+        qs.order_by("social_account_id", "timestamp")
+        .values_list("social_account_id", "timestamp", *metrics)
+        .iterator(chunk_size=chunk_size)
+    )
+    return series_from_rows(rows, metrics, chunk_size, with_timestamps=with_timestamps)
+
+
+def load_top_content_series(
+    fields: Sequence[str] = ("likes_count", "comments_count", "shares_count", "saves_count", "reach", "engagement_rate"),
+    *,
+    since: Optional[datetime] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    with_timestamps: bool = False,
+    **filters,
+) -> SeriesBatch:
+    """TopContent columns per account, ordered by posted_at (``filters`` apply to TopContent)."""
+    qs = TopContent.objects.filter(**filters)
+    if since is not None:
+        qs = qs.filter(posted_at__gte=since)
+    rows = (
+        qs.order_by("social_account_id", "posted_at")
+        .values_list("social_account_id", "posted_at", *fields)
+        .iterator(chunk_size=chunk_size)
+    )
+    return series_from_rows(rows, fields, chunk_size, with_timestamps=with_timestamps)
+
+
+def last_deltas(batch: SeriesBatch, metric: str) -> np.ndarray:
+    """Latest minus previous value per account (NaN with fewer than two rows)."""
+    values = batch.values[metric]
+    deltas = np.full(len(batch), np.nan)
+    ok = batch.counts >= 2
+    ends = batch.ends[ok]
+    deltas[ok] = values[ends] - values[ends - 1]
+    return deltas
+
+
+def growth_rates(batch: SeriesBatch, metric: str) -> np.ndarray:
+    """Percent change from first to last value per account (NaN when the first is 0)."""
+    values = batch.values[metric]
+    first = values[batch.starts]
+    last = values[batch.ends]
+    rates = np.full(len(batch), np.nan)
+    np.divide((last - first) * 100, first, out=rates, where=first > 0)
+    return rates
+
+
+def moving_average(batch: SeriesBatch, metric: str, window: int) -> np.ndarray:
+    """Trailing ``window``-row mean at every row, never crossing account boundaries."""
+    values = batch.values[metric]
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    index = np.arange(len(values))
+    low = np.maximum(np.repeat(batch.starts, batch.counts), index - window + 1)
+    return (cumulative[index + 1] - cumulative[low]) / (index + 1 - low)
+
+
+def segment_mean_std(batch: SeriesBatch, metric: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean and population standard deviation of ``metric`` per account."""
+    values = batch.values[metric]
+    if not len(batch):
+        return np.empty(0), np.empty(0)
+    counts = batch.counts
+    means = np.add.reduceat(values, batch.starts) / counts
+    deviations = values - np.repeat(means, counts)
+    stds = np.sqrt(np.add.reduceat(deviations * deviations, batch.starts) / counts)
+    return means, stds
+
+
+def latest_zscores(batch: SeriesBatch, metric: str) -> np.ndarray:
+    """Z-score of each account's latest value against its own series (NaN when flat)."""
+    means, stds = segment_mean_std(batch, metric)
+    latest = batch.values[metric][batch.ends]
+    scores = np.full(len(batch), np.nan)
+    np.divide(latest - means, stds, out=scores, where=stds > 0)
+    return scores
+
+
+def percentiles(values: np.ndarray, q: Sequence[float] = (50, 90, 99)) -> Dict[float, Optional[float]]:
+    """Percentiles of ``values`` ignoring NaN (None for an empty input)."""
+    values = values[~np.isnan(values)]
+    if not values.size:
+        return {p: None for p in q}
+    return dict(zip(q, (float(v) for v in np.percentile(values, q))))
+
+
+def group_means(keys: np.ndarray, values: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean of ``values`` per integer key in [0, size), and the count per key (NaN mean when empty)."""
+    counts = np.bincount(keys, minlength=size)
+    sums = np.bincount(keys, weights=values, minlength=size)
+    means = np.full(size, np.nan)
+    np.divide(sums, counts, out=means, where=counts > 0)
+    return means, counts
+
+
+def engagement_rates(engagement: np.ndarray, reach: np.ndarray) -> np.ndarray:
+    """Engagement as a percentage of reach (0 when reach is unknown), element-wise."""
+    rates = np.zeros(len(engagement))
+    np.divide(engagement * 100.0, reach, out=rates, where=reach > 0)
+    return rates
@@ -0,0 +1,124 @@
+"""Chunked fan-out of per-account work from the ``sync_all_*`` beat tasks.
+
+``fan_out`` streams primary keys with ``values_list(...).iterator()`` (no
+model instances), groups them into chunks and publishes one message per
+chunk. Messages go out through one broker producer per ``publish_batch``
+messages instead of acquiring a connection for every ``delay()`` call.
+
+Chunk ``i`` of ``n`` gets a countdown of ``i * window / n`` plus up to
+``jitter`` random seconds, so the work is spread evenly over the schedule
+window instead of landing on the workers (and the platform APIs) at once.
+
+Countdowns are kept below the broker's ``visibility_timeout`` (minus the
+task time limit): with acks_late, Redis would otherwise redeliver a
+still-waiting ETA message to a second worker and the chunk would run twice.
+
+Each run returns a FanOutReport (items, broker messages, dispatch time),
+which is logged and becomes the beat task's result.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from celery import current_app
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 50
+DEFAULT_PUBLISH_BATCH = 100
+ID_FETCH_SIZE = 2000
+
+
+@dataclass
+class FanOutReport:
+    name: str
+    items: int = 0
+    messages: int = 0
+    failed_messages: int = 0
+    window: float = 0.0
+    dispatch_seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _chunks(ids: Iterator[Any], size: int) -> Iterator[List[str]]:
+    while True:
+        chunk = [str(i) for i in islice(ids, size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def max_window(jitter: float = 0.0) -> Optional[float]:
+    """Longest safe window for the broker's visibility_timeout (None when not configured)."""
+    visibility = (current_app.conf.broker_transport_options or {}).get("visibility_timeout")
+    if not visibility:
+        return None
+    return max(0.0, visibility - jitter - (current_app.conf.task_time_limit or 0))
+
+
+def fan_out(
+    name: str,
+    queryset,
+    task,
+    *,
+    args: Sequence[Any] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    window: float = 0.0,
+    jitter: float = 0.0,
+    publish_batch: int = DEFAULT_PUBLISH_BATCH,
+    queue: Optional[str] = None,
+) -> FanOutReport:
+    """Publish ``task(*args, [ids...])`` for every ``chunk_size`` ids of ``queryset``.
+
+    Chunks are spread over ``window`` seconds (plus ``jitter``); ``name``
+    labels the report and log line. ``queue`` overrides the task's route.
+    """
+    start = time.perf_counter()
+    limit = max_window(jitter)
+    if limit is not None and window > limit:
+        logger.warning(f"Fan-out {name}: window {window:.0f}s exceeds the broker visibility timeout, using {limit:.0f}s")
+        window = limit
+    chunk_size = max(1, chunk_size)
+    publish_batch = max(1, publish_batch)
+    queryset = queryset.order_by()
+    total = queryset.count()
+    n_chunks = math.ceil(total / chunk_size)
+    spacing = window / n_chunks if n_chunks else 0.0
+    report = FanOutReport(name=name, window=window)
+
+    ids = queryset.values_list("pk", flat=True).iterator(chunk_size=ID_FETCH_SIZE)
+    chunks = _chunks(ids, chunk_size)
+    index = 0
+    while True:
+        batch = list(islice(chunks, publish_batch))
+        if not batch:
+            break
+        with current_app.producer_or_acquire() as producer:
+            for chunk in batch:
+                countdown = index * spacing + (random.uniform(0, jitter) if jitter else 0)
+                index += 1
+                report.items += len(chunk)
+                try:
+                    task.apply_async(
+                        args=(*args, chunk), countdown=countdown, producer=producer, queue=queue
+                    )
+                    report.messages += 1
+                except Exception as e:
+                    report.failed_messages += 1
+                    logger.error(f"Failed to queue {name} chunk of {len(chunk)}: {e}")
+
+    report.dispatch_seconds = round(time.perf_counter() - start, 3)
+    logger.info(
+        f"Fan-out {name}: {report.items} items in {report.messages} messages "
+        f"over {window:.0f}s, dispatched in {report.dispatch_seconds}s"
+    )
+    return report
@@ -0,0 +1,252 @@
+"""FollowerChange writes and reads for the follower_changes endpoints.
+
+- ``create_follower_changes`` bulk-creates rows and, in the same
+  transaction, increments the per-(account, UTC day, change_type) counters
+  (FollowerChangeDailyCount) read by the dashboard and automation triggers.
+  Once the transaction commits it also bumps the cached all-time totals, so
+  the list endpoint never has to ``count()`` millions of rows per request.
+  Those totals are approximate: a missing key is recounted on the next read,
+  and the TTL bounds drift from retention deletes.
+- ``page_follower_changes`` is keyset pagination on (timestamp, id),
+  newest first, served by the (social_account, change_type, -timestamp)
+  index; cost does not grow with page depth. Offset paging is still
+  accepted for one release (deprecated).
+- ``iter_follower_changes`` walks the full history page by page for
+  streaming exports (short queries, no long-lived cursor).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import uuid
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from core.social.models import FollowerChange, FollowerChangeDailyCount
+
+TOTAL_TTL = 24 * 60 * 60
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+EXPORT_PAGE_SIZE = 2000
+
+EXPORT_FIELDS = [
+    "id",
+    "change_type",
+    "user_id",
+    "username",
+    "profile_pic_url",
+    "verified",
+    "follower_count",
+    "timestamp",
+]
+
+Cursor = Tuple[datetime, uuid.UUID]
+
+
+def total_cache_key(account_id, change_type: str) -> str:
+    return f"follower_changes:total:{account_id}:{change_type}"
+
+
+def utc_day(value: datetime) -> date:
+    return value.astimezone(dt_timezone.utc).date()
+
+
+def create_follower_changes(changes: List[FollowerChange], *, batch_size: Optional[int] = None) -> int:
+    """Bulk-create ``changes`` and their daily counters; bump the cached totals after commit."""
+    if not changes:
+        return 0
+    with transaction.atomic():
+        FollowerChange.objects.bulk_create(changes, batch_size=batch_size, ignore_conflicts=True)
+        # timestamp (auto_now_add) is set on the instances by bulk_create.
+        _increment_daily_counts(
+            Counter((c.social_account_id, utc_day(c.timestamp), c.change_type) for c in changes)
+        )
+    counts = Counter((str(c.social_account_id), c.change_type) for c in changes)
+    transaction.on_commit(lambda: _bump_totals(counts))
+    return len(changes)
+
+
+def _increment_daily_counts(counts: Dict[Tuple[Any, date, str], int]) -> None:
+    for (account_id, day, change_type), n in counts.items():
+        rows = FollowerChangeDailyCount.objects.filter(
+            social_account_id=account_id, day=day, change_type=change_type
+        )
+        if rows.update(count=F("count") + n):
+            continue
+        try:
+            with transaction.atomic():
+                FollowerChangeDailyCount.objects.create(
+                    social_account_id=account_id, day=day, change_type=change_type, count=n
+                )
+        except IntegrityError:
+            rows.update(count=F("count") + n)  # created concurrently
+
+
+def daily_change_counts(since: date, **account_filter) -> Dict[str, int]:
+    """{change_type: count} summed over UTC days >= ``since``.
+
+    ``account_filter`` selects the accounts, e.g. ``social_account_id=...``,
+    ``social_account_id__in=[...]`` or ``social_account__workspace=...``.
+    """
+    rows = (
+        FollowerChangeDailyCount.objects.filter(day__gte=since, **account_filter)
+        .values("change_type")
+        .annotate(total=Sum("count"))
+        .values_list("change_type", "total")
+    )
+    return dict(rows)
+
+
+def change_counts_since(since: datetime, **account_filter) -> Dict[str, int]:
+    """{change_type: count} of the changes at or after ``since``.
+
+    Whole UTC days come from the daily counters; the partial first day is
+    counted exactly on follower_changes (a bounded index range), so the
+    window is not widened to midnight. ``account_filter`` as for
+    ``daily_change_counts``.
+    """
+    next_day = utc_day(since) + timedelta(days=1)
+    counts = Counter(daily_change_counts(next_day, **account_filter))
+    first_day = (
+        FollowerChange.objects.filter(
+            timestamp__gte=since,
+            timestamp__lt=datetime(next_day.year, next_day.month, next_day.day, tzinfo=dt_timezone.utc),
+            **account_filter,
+        )
+        .values("change_type")
+        .annotate(total=Count("id"))
+        .values_list("change_type", "total")
+    )
+    counts.update(dict(first_day))
+    return dict(counts)
+
+
+def daily_count_bound(account_id, change_type: str, since: datetime) -> Optional[int]:
+    """Upper bound on the account's ``change_type`` rows since ``since``, from the daily counters.
+
+    None unless every UTC day from ``since`` to today has a counter row: a
+    missing row may be a day without changes or one that was never counted
+    (not backfilled yet), so callers must fall back to the exact count.
+    """
+    first = utc_day(since)
+    counts = list(
+        FollowerChangeDailyCount.objects.filter(
+            social_account_id=account_id, change_type=change_type, day__gte=first
+        ).values_list("count", flat=True)
+    )
+    if len(counts) <= (utc_day(timezone.now()) - first).days:
+        return None
+    return sum(counts)
+
+
+def rebuild_daily_counts(account_ids: Optional[List[Any]] = None) -> int:
+    """Recompute the daily counters from follower_changes (backfill / repair)."""
+    changes = FollowerChange.objects.all()
+    counters = FollowerChangeDailyCount.objects.all()
+    if account_ids:
+        changes = changes.filter(social_account_id__in=account_ids)
+        counters = counters.filter(social_account_id__in=account_ids)
+
+    rows = (
+        changes.annotate(day=TruncDate("timestamp", tzinfo=dt_timezone.utc))
+        .values("social_account_id", "day", "change_type")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    with transaction.atomic():
+        counters.delete()
+        created = FollowerChangeDailyCount.objects.bulk_create(
+            [
+                FollowerChangeDailyCount(
+                    social_account_id=row["social_account_id"],
+                    day=row["day"],
+                    change_type=row["change_type"],
+                    count=row["total"],
+                )
+                for row in rows.iterator()
+            ],
+            batch_size=1000,
+        )
+    return len(created)
+
+
+def _bump_totals(counts: Dict[Tuple[str, str], int]) -> None:
+    for (account_id, change_type), n in counts.items():
+        try:
+            cache.incr(total_cache_key(account_id, change_type), n)
+        except ValueError:
+            pass  # not cached yet: counted on the next read
+
+
+def change_total(account_id, change_type: str) -> int:
+    """Approximate number of ``change_type`` rows for the account (cached)."""
+    key = total_cache_key(account_id, change_type)
+    total = cache.get(key)
+    if total is None:
+        total = FollowerChange.objects.filter(social_account_id=account_id, change_type=change_type).count()
+        cache.add(key, total, timeout=TOTAL_TTL)
+    return total
+
+
+def encode_cursor(timestamp: datetime, change_id) -> str:
+    raw = f"{timestamp.isoformat()}|{change_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> Cursor:
+    """Inverse of ``encode_cursor``; raises ValueError on malformed input."""
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+        timestamp, change_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), uuid.UUID(change_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def page_follower_changes(
+    account_id,
+    change_type: Optional[str] = None,
+    *,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[Cursor] = None,
+    offset: int = 0,
+    fields: Iterable[str] = EXPORT_FIELDS,
+) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
+    """One page of changes, newest first, starting after ``after``.
+
+    ``offset`` skips rows by position instead (deprecated: its cost grows
+    with depth). Returns (rows, next_cursor); next_cursor is None on the
+    last page.
+    """
+    qs = FollowerChange.objects.filter(social_account_id=account_id)
+    if change_type:
+        qs = qs.filter(change_type=change_type)
+    if after is not None:
+        timestamp, change_id = after
+        qs = qs.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=change_id))
+
+    rows = list(qs.order_by("-timestamp", "-id").values(*fields)[offset : offset + limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, (rows[-1]["timestamp"], rows[-1]["id"])
+
+
+def iter_follower_changes(
+    account_id, change_type: Optional[str] = None, *, page_size: int = EXPORT_PAGE_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """Every change for the account, newest first, fetched ``page_size`` rows at a time."""
+    after: Optional[Cursor] = None
+    while True:
+        rows, after = page_follower_changes(account_id, change_type, limit=page_size, after=after)
+        yield from rows
+        if after is None:
+            return
@@ -0,0 +1,180 @@
+"""Bounded-memory follower set diffing.
+
+Follower snapshots can contain millions of IDs, so this module never keeps raw
+user payloads or Python ``set`` objects of strings around. IDs are stored as
+unsigned 64-bit integers in ``array('Q')`` buffers (8 bytes per follower) and
+kept sorted so that membership is a binary search and diffs are a linear
+merge-walk.
+
+Typical flow (see follower_sync.sync_x_followers_snapshot):
+- ``previous`` is the sorted array from the last run.
+- For each fetched page, ``page_new_ids`` tells which IDs are new followers so
+  rows can be emitted while the page's user payloads are still at hand.
+- ``FollowerIdAccumulator`` collects the page IDs as sorted chunks (merged so
+  there are O(log n) of them); ``accumulator.unseen`` drops IDs already seen
+  on an earlier page when the list shifts during pagination.
+- ``iter_removed`` merge-walks ``previous`` against the final sorted array to
+  stream unfollower IDs.
+"""
+
+from __future__ import annotations
+
+import heapq
+import operator
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, chain
+from typing import Any, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+ID_TYPECODE = "Q"
+
+# Persisted snapshot format: first-order deltas of the sorted IDs as
+# little-endian uint64, zlib-compressed. Deltas between neighbouring follower
+# IDs are much smaller than the IDs themselves, so their high bytes are zeros
+# and compress well.
+ENCODING_DELTA_ZLIB = "delta-u64-zlib-v1"
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def parse_user_id(value: Any) -> Optional[int]:
+    """Return a platform user ID as int, or None if it is missing/non-numeric."""
+    if value is None or value == "":
+        return None
+    try:
+        uid = int(value)
+    except (TypeError, ValueError):
+        return None
+    if uid < 0 or uid >= 1 << 64:
+        return None
+    return uid
+
+
+def empty_ids() -> array:
+    return array(ID_TYPECODE)
+
+
+def sorted_ids(values: Iterable[Any]) -> array:
+    """Build a sorted, de-duplicated ID array from arbitrary (str/int) IDs."""
+    parsed = {uid for uid in (parse_user_id(v) for v in values) if uid is not None}
+    return array(ID_TYPECODE, sorted(parsed))
+
+
+def contains(ids: array, uid: int) -> bool:
+    """Binary search membership test on a sorted ID array."""
+    i = bisect_left(ids, uid)
+    return i < len(ids) and ids[i] == uid
+
+
+def page_new_ids(previous: array, page_ids: Iterable[int]) -> List[int]:
+    """IDs from one page that are not present in the previous snapshot."""
+    return [uid for uid in page_ids if not contains(previous, uid)]
+
+
+class FollowerIdAccumulator:
+    """Collect follower IDs page by page and produce one sorted array.
+
+    Each page is sorted on its own (pages are small). A new chunk is merged
+    into the previous one while that one is at most twice its size, so chunk
+    sizes shrink geometrically and membership is a binary search in each of
+    O(log n) chunks. The final array is built with a k-way merge so no
+    intermediate list of Python ints is created.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[array] = []
+
+    def add_page(self, page_ids: Iterable[int]) -> array:
+        """Add one page of IDs; returns the page as a sorted array."""
+        chunk = array(ID_TYPECODE, sorted(page_ids))
+        self.add_sorted(chunk)
+        return chunk
+
+    def add_sorted(self, chunk: array) -> None:
+        """Add an already sorted chunk (e.g. restored from a checkpoint)."""
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        while len(self._chunks) > 1 and len(self._chunks[-2]) <= 2 * len(self._chunks[-1]):
+            newer = self._chunks.pop()
+            older = self._chunks.pop()
+            self._chunks.append(_merge_sorted(older, newer))
+
+    def unseen(self, uids: List[int]) -> List[int]:
+        """The IDs of ``uids`` not in any chunk added so far (one vectorized search per chunk)."""
+        if not uids or not self._chunks:
+            return list(uids)
+        query = np.array(uids, dtype=np.uint64)
+        seen = np.zeros(len(query), dtype=bool)
+        for chunk in self._chunks:
+            ids = np.frombuffer(chunk, dtype=np.uint64)
+            pos = np.minimum(np.searchsorted(ids, query), len(ids) - 1)
+            seen |= ids[pos] == query
+        return [uid for uid, s in zip(uids, seen) if not s]
+
+    def iter_sorted(self) -> Iterator[int]:
+        return _iter_unique(heapq.merge(*self._chunks))
+
+    def to_array(self) -> array:
+        out = array(ID_TYPECODE)
+        for uid in self.iter_sorted():
+            out.append(uid)
+        self._chunks = []
+        return out
+
+
+def _merge_sorted(a: array, b: array) -> array:
+    """Union of two sorted ID arrays (timsort merges the two runs in linear time)."""
+    merged = np.concatenate((np.frombuffer(a, dtype=np.uint64), np.frombuffer(b, dtype=np.uint64)))
+    merged.sort(kind="stable")
+    keep = np.empty(len(merged), dtype=bool)
+    keep[0] = True
+    np.not_equal(merged[1:], merged[:-1], out=keep[1:])
+    return array(ID_TYPECODE, merged[keep].tobytes())
+
+
+def _iter_unique(sorted_uids: Iterable[int]) -> Iterator[int]:
+    last: Optional[int] = None
+    for uid in sorted_uids:
+        if uid != last:
+            yield uid
+            last = uid
+
+
+def iter_removed(previous: array, current: array) -> Iterator[int]:
+    """Yield IDs present in ``previous`` but not in ``current`` (both sorted)."""
+    j = 0
+    n = len(current)
+    for uid in previous:
+        while j < n and current[j] < uid:
+            j += 1
+        if j >= n or current[j] != uid:
+            yield uid
+
+
+def iter_added(previous: array, current: array) -> Iterator[int]:
+    """Yield IDs present in ``current`` but not in ``previous`` (both sorted)."""
+    return iter_removed(current, previous)
+
+
+def encode_ids(ids: array, level: int = 1) -> bytes:
+    """Delta-encode and compress a sorted ID array (see ENCODING_DELTA_ZLIB)."""
+    deltas = array(ID_TYPECODE, map(operator.sub, ids, chain((0,), ids)))
+    if deltas.itemsize != 8:
+        raise RuntimeError("array('Q') must be 8 bytes wide")
+    if _BIG_ENDIAN:
+        deltas.byteswap()
+    return zlib.compress(deltas.tobytes(), level)
+
+
+def decode_ids(blob: bytes) -> array:
+    """Inverse of encode_ids."""
+    deltas = array(ID_TYPECODE)
+    deltas.frombytes(zlib.decompress(blob))
+    if _BIG_ENDIAN:
+        deltas.byteswap()
+    return array(ID_TYPECODE, accumulate(deltas))
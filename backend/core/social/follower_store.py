@@ -0,0 +1,156 @@
+"""Persistent follower snapshot store.
+
+Follower ID sets used for identity-level unfollower detection are kept in
+Postgres (FollowerSnapshot) instead of the cache, so a Redis flush does not
+turn the next sync into a flood of "new followers".
+
+Each sync writes a new version per SocialAccount; only the most recent
+FOLLOWER_SNAPSHOT_HISTORY versions are retained (default 5).
+
+While a sync is still paginating, its progress lives in a
+FollowerSyncCheckpoint (next_token + one encoded ID chunk per page).
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import timedelta
+from typing import Iterator, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from core.social.follower_diff import ENCODING_DELTA_ZLIB, decode_ids, encode_ids
+from core.social.models import FollowerSnapshot, FollowerSyncCheckpoint, FollowerSyncCheckpointPage
+
+DEFAULT_HISTORY = 5
+
+
+def _history_size() -> int:
+    return max(1, int(getattr(settings, "FOLLOWER_SNAPSHOT_HISTORY", DEFAULT_HISTORY)))
+
+
+def _decode(snapshot) -> array:
+    if snapshot.encoding != ENCODING_DELTA_ZLIB:
+        raise ValueError(f"Unsupported follower snapshot encoding: {snapshot.encoding}")
+    return decode_ids(bytes(snapshot.data))
+
+
+def load_latest_ids(social_account_id: str) -> Optional[array]:
+    """Latest stored follower ID array, or None if the account has no snapshot."""
+    snapshot = (
+        FollowerSnapshot.objects.filter(social_account_id=social_account_id)
+        .only("encoding", "data")
+        .order_by("-version")
+        .first()
+    )
+    if snapshot is None:
+        return None
+    return _decode(snapshot)
+
+
+def latest_version(social_account_id: str) -> int:
+    """Version number of the latest snapshot (0 if none)."""
+    return (
+        FollowerSnapshot.objects.filter(social_account_id=social_account_id)
+        .aggregate(v=Max("version"))["v"]
+        or 0
+    )
+
+
+def load_ids(social_account_id: str, version: int) -> array:
+    snapshot = FollowerSnapshot.objects.only("encoding", "data").get(
+        social_account_id=social_account_id, version=version
+    )
+    return _decode(snapshot)
+
+
+def list_versions(social_account_id: str) -> List[dict]:
+    return list(
+        FollowerSnapshot.objects.filter(social_account_id=social_account_id)
+        .order_by("-version")
+        .values("version", "created_at", "follower_count")
+    )
+
+
+def save_snapshot(social_account_id: str, ids: array, keep: Optional[int] = None) -> FollowerSnapshot:
+    """Persist ``ids`` (sorted) as the next version and prune old versions."""
+    keep = keep if keep is not None else _history_size()
+    blob = encode_ids(ids)
+
+    with transaction.atomic():
+        last = (
+            FollowerSnapshot.objects.filter(social_account_id=social_account_id)
+            .aggregate(v=Max("version"))["v"]
+            or 0
+        )
+        snapshot = FollowerSnapshot.objects.create(
+            social_account_id=social_account_id,
+            version=last + 1,
+            follower_count=len(ids),
+            encoding=ENCODING_DELTA_ZLIB,
+            data=blob,
+        )
+        FollowerSnapshot.objects.filter(
+            social_account_id=social_account_id,
+            version__lte=snapshot.version - keep,
+        ).delete()
+
+    return snapshot
+
+
+def get_checkpoint(
+    social_account_id: str, *, base_version: int, max_age: timedelta
+) -> Optional[FollowerSyncCheckpoint]:
+    """Resumable checkpoint for the account, or None.
+
+    Checkpoints taken against another snapshot version, or older than
+    ``max_age`` (pagination tokens expire and the list drifts), are discarded.
+    """
+    checkpoint = FollowerSyncCheckpoint.objects.filter(social_account_id=social_account_id).first()
+    if checkpoint is None:
+        return None
+    if checkpoint.base_version != base_version or checkpoint.updated_at < timezone.now() - max_age:
+        checkpoint.delete()
+        return None
+    return checkpoint
+
+
+def start_checkpoint(social_account_id: str, *, base_version: int) -> FollowerSyncCheckpoint:
+    FollowerSyncCheckpoint.objects.filter(social_account_id=social_account_id).delete()
+    return FollowerSyncCheckpoint.objects.create(
+        social_account_id=social_account_id,
+        base_version=base_version,
+    )
+
+
+def iter_checkpoint_pages(checkpoint: FollowerSyncCheckpoint) -> Iterator[array]:
+    """Decoded, sorted ID chunks saved so far, in page order."""
+    for page in checkpoint.pages.only("encoding", "data").order_by("page_index").iterator():
+        yield _decode(page)
+
+
+def save_checkpoint_page(
+    checkpoint: FollowerSyncCheckpoint,
+    page_ids: array,
+    *,
+    next_token: Optional[str],
+    new_followers: int,
+) -> None:
+    """Record one fetched page. Call inside the transaction that writes its FollowerChange rows."""
+    FollowerSyncCheckpointPage.objects.create(
+        checkpoint=checkpoint,
+        page_index=checkpoint.pages_fetched,
+        encoding=ENCODING_DELTA_ZLIB,
+        data=encode_ids(page_ids),
+    )
+    checkpoint.pages_fetched += 1
+    checkpoint.next_token = next_token or ""
+    checkpoint.new_followers = new_followers
+    checkpoint.save(update_fields=["pages_fetched", "next_token", "new_followers", "updated_at"])
+
+
+def clear_checkpoint(social_account_id: str) -> None:
+    FollowerSyncCheckpoint.objects.filter(social_account_id=social_account_id).delete()
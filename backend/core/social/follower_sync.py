@@ -14,13 +14,35 @@ Docs referenced:
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
 
 from django.core.cache import cache
 from django.db import transaction
 
+from core.social.follower_diff import (
+    FollowerIdAccumulator,
+    empty_ids,
+    iter_removed,
+    page_new_ids,
+    parse_user_id,
+    sorted_ids,
+)
+from core.social.follower_changes import create_follower_changes
+from core.social.follower_store import (
+    clear_checkpoint,
+    get_checkpoint,
+    iter_checkpoint_pages,
+    latest_version,
+    load_latest_ids,
+    save_checkpoint_page,
+    save_snapshot,
+    start_checkpoint,
+)
 from core.social.models import FollowerChange, OAuthToken, SocialAccount
+from core.social.user_cache import read_user_profiles, slim_x_user, write_user_profiles
 from core.utils.crypto import maybe_decrypt
 from core.social.x_api import get_x_followers_page, XApiError
 
@@ -32,26 +54,56 @@ class SyncResult:
     fetched_users: int
     new_followers: int
     unfollowers: int
+    profiles_written: int = 0
+    profiles_unchanged: int = 0
+    complete: bool = True
+    resumed: bool = False
+    pages_fetched: int = 0
 
 
 def _followers_cache_key(account_id: str) -> str:
     return f"followers:{account_id}"
 
 
-def _user_cache_key(platform: str, user_id: str) -> str:
-    return f"user:{platform}:{user_id}"
+def _load_previous_ids(account_id: str) -> array:
+    """Previous follower snapshot as a sorted ID array.
 
+    Snapshots live in the follower store (Postgres). Accounts synced before
+    the store existed still have a pickled ``set`` of string IDs (or a packed
+    array) in the cache; that is used once as the baseline.
+    """
+    stored = load_latest_ids(account_id)
+    if stored is not None:
+        return stored
 
-def _extract_user(user: Dict[str, Any]) -> Dict[str, Any]:
-    public_metrics = user.get("public_metrics") or {}
-    return {
-        "id": str(user.get("id") or ""),
-        "username": user.get("username") or "",
-        "profile_image_url": user.get("profile_image_url"),
-        "verified": bool(user.get("verified", False)),
-        "followers_count": public_metrics.get("followers_count"),
-        "raw": user,
-    }
+    cached = cache.get(_followers_cache_key(account_id))
+    if not cached:
+        return empty_ids()
+    if isinstance(cached, (bytes, bytearray)):
+        ids = empty_ids()
+        ids.frombytes(bytes(cached))
+        return ids
+    return sorted_ids(cached)
+
+
+def _store_current_ids(account_id: str, ids: array) -> None:
+    save_snapshot(account_id, ids)
+    cache.delete(_followers_cache_key(account_id))
+
+
+def _follower_change(
+    account: SocialAccount, change_type: str, uid: int, info: Dict[str, Any]
+) -> FollowerChange:
+    return FollowerChange(
+        social_account=account,
+        change_type=change_type,
+        user_id=str(uid),
+        username=info.get("username", ""),
+        profile_pic_url=info.get("profile_image_url"),
+        verified=bool(info.get("verified", False)),
+        follower_count=info.get("followers_count"),
+        extra_data={"platform": "x"},
+    )
 
 
 def sync_x_followers_snapshot(
@@ -60,7 +112,20 @@ def sync_x_followers_snapshot(
     max_pages: int = 50,
     page_size: int = 1000,
     cache_user_ttl_seconds: int = 86400 * 30,
+    write_batch_size: int = 1000,
+    checkpoint_max_age: timedelta = timedelta(hours=6),
 ) -> SyncResult:
+    """Fetch the X followers list and record new followers/unfollowers.
+
+    Pages are consumed one at a time: only integer IDs are retained across
+    pages (see core.social.follower_diff). After every page its new-follower
+    rows and a checkpoint (ID chunk + next_token) are committed together, so a
+    run interrupted by a 429 resumes where it stopped.
+
+    Unfollowers are only computed when pagination completes. If ``max_pages``
+    is reached first the result is partial (``complete=False``) and the next
+    run continues from the checkpoint.
+    """
     account = SocialAccount.objects.select_related("oauth_token").get(id=social_account_id)
     if account.platform != SocialAccount.PLATFORM_X:
         raise ValueError("sync_x_followers_snapshot can only run for X accounts")
@@ -71,90 +136,129 @@ def sync_x_followers_snapshot(
     if not access_token:
         raise ValueError("Missing access token for X account")
 
-    # Fetch full follower list (paged)
-    all_users: List[Dict[str, Any]] = []
-    next_token: Optional[str] = None
+    account_key = str(account.id)
+    base_version = latest_version(account_key)
+    prev_ids = _load_previous_ids(account_key)
+
+    accumulator = FollowerIdAccumulator()
+    profiles_written = 0
+    profiles_unchanged = 0
+
+    checkpoint = get_checkpoint(account_key, base_version=base_version, max_age=checkpoint_max_age)
+    if checkpoint is not None:
+        resumed = True
+        for chunk in iter_checkpoint_pages(checkpoint):
+            accumulator.add_sorted(chunk)
+        next_token: Optional[str] = checkpoint.next_token or None
+        new_count = checkpoint.new_followers
+    else:
+        resumed = False
+        checkpoint = start_checkpoint(account_key, base_version=base_version)
+        next_token = None
+        new_count = 0
+
+    # Stream the follower list (paged); new followers are detected per page.
+    complete = checkpoint.pages_fetched > 0 and next_token is None
 
-    for _ in range(max_pages):
+    for _ in range(0 if complete else max_pages):
         page = get_x_followers_page(
             platform_user_id=account.platform_user_id,
             access_token=access_token,
             pagination_token=next_token,
             max_results=page_size,
         )
-        all_users.extend(page.users)
+
+        page_map: Dict[int, Dict[str, Any]] = {}
+        for u in page.users:
+            uid = parse_user_id(u.get("id"))
+            if uid is None:
+                continue
+            page_map[uid] = slim_x_user(u)
+
+        # A follower already seen on an earlier page (the list shifted while
+        # paginating) was emitted then; the accumulator is checked before this
+        # page is added to it.
+        new_changes: List[FollowerChange] = [
+            _follower_change(account, FollowerChange.TYPE_NEW_FOLLOWER, uid, page_map[uid])
+            for uid in accumulator.unseen(page_new_ids(prev_ids, sorted(page_map)))
+        ]
+        page_ids = accumulator.add_page(page_map.keys())
+        new_count += len(new_changes)
+
         next_token = page.next_token
+        with transaction.atomic():
+            if new_changes:
+                create_follower_changes(new_changes, batch_size=write_batch_size)
+            save_checkpoint_page(checkpoint, page_ids, next_token=next_token, new_followers=new_count)
+
+        # Cache per-user enrichment (only for currently visible followers)
+        written, unchanged = write_user_profiles(
+            "x", page_map, ttl_seconds=cache_user_ttl_seconds, batch_size=write_batch_size
+        )
+        profiles_written += written
+        profiles_unchanged += unchanged
+
         if not next_token:
+            complete = True
             break
 
-    current_ids: Set[str] = set()
-    current_map: Dict[str, Dict[str, Any]] = {}
-
-    for u in all_users:
-        eu = _extract_user(u)
-        if not eu["id"]:
-            continue
-        current_ids.add(eu["id"])
-        current_map[eu["id"]] = eu
+    if not complete:
+        # Partial snapshot: unfetched followers must not be reported as unfollowers.
+        return SyncResult(
+            platform="x",
+            account_id=account_key,
+            fetched_users=len(accumulator.to_array()),
+            new_followers=new_count,
+            unfollowers=0,
+            profiles_written=profiles_written,
+            profiles_unchanged=profiles_unchanged,
+            complete=False,
+            resumed=resumed,
+            pages_fetched=checkpoint.pages_fetched,
+        )
 
-    prev_ids: Set[str] = cache.get(_followers_cache_key(str(account.id)), set()) or set()
+    current_ids = accumulator.to_array()
 
-    new_ids = current_ids - prev_ids
-    unfollow_ids = prev_ids - current_ids
+    # Unfollowers: best effort enrichment from cache, one get_many per batch.
+    # Written together with the new snapshot version so a crash cannot emit
+    # them twice.
+    unfollow_count = 0
+    batch: List[int] = []
 
-    # Persist changes; keep it idempotent-ish by not creating duplicates in tight loops.
     with transaction.atomic():
-        # New followers
-        new_changes: List[FollowerChange] = []
-        for uid in new_ids:
-            info = current_map.get(uid) or {}
-            new_changes.append(
-                FollowerChange(
-                    social_account=account,
-                    change_type=FollowerChange.TYPE_NEW_FOLLOWER,
-                    user_id=uid,
-                    username=info.get("username", ""),
-                    profile_pic_url=info.get("profile_image_url"),
-                    verified=bool(info.get("verified", False)),
-                    follower_count=info.get("followers_count"),
-                    extra_data={"platform": "x"},
-                )
-            )
 
-        if new_changes:
-            FollowerChange.objects.bulk_create(new_changes, ignore_conflicts=True)
-
-        # Unfollowers: best effort enrichment from cache
-        unf_changes: List[FollowerChange] = []
-        for uid in unfollow_ids:
-            cached = cache.get(_user_cache_key("x", uid), {}) or {}
-            unf_changes.append(
-                FollowerChange(
-                    social_account=account,
-                    change_type=FollowerChange.TYPE_UNFOLLOWER,
-                    user_id=uid,
-                    username=cached.get("username", ""),
-                    profile_pic_url=cached.get("profile_image_url"),
-                    verified=bool(cached.get("verified", False)),
-                    follower_count=cached.get("followers_count"),
-                    extra_data={"platform": "x"},
-                )
+        def flush_unfollowers() -> None:
+            cached = read_user_profiles("x", batch)
+            create_follower_changes(
+                [
+                    _follower_change(
+                        account, FollowerChange.TYPE_UNFOLLOWER, uid, cached.get(str(uid), {})
+                    )
+                    for uid in batch
+                ]
             )
+            batch.clear()
 
-        if unf_changes:
-            FollowerChange.objects.bulk_create(unf_changes, ignore_conflicts=True)
-
-    # Cache follower set snapshot
-    cache.set(_followers_cache_key(str(account.id)), current_ids, timeout=None)
+        for uid in iter_removed(prev_ids, current_ids):
+            batch.append(uid)
+            unfollow_count += 1
+            if len(batch) >= write_batch_size:
+                flush_unfollowers()
+        if batch:
+            flush_unfollowers()
 
-    # Cache per-user enrichment (only for currently visible followers)
-    for uid, info in current_map.items():
-        cache.set(_user_cache_key("x", uid), info, timeout=cache_user_ttl_seconds)
+        # Persist follower set snapshot (new version) and drop the checkpoint
+        _store_current_ids(account_key, current_ids)
+        clear_checkpoint(account_key)
 
     return SyncResult(
         platform="x",
-        account_id=str(account.id),
-        fetched_users=len(current_map),
-        new_followers=len(new_ids),
-        unfollowers=len(unfollow_ids),
+        account_id=account_key,
+        fetched_users=len(current_ids),
+        new_followers=new_count,
+        unfollowers=unfollow_count,
+        profiles_written=profiles_written,
+        profiles_unchanged=profiles_unchanged,
+        resumed=resumed,
+        pages_fetched=checkpoint.pages_fetched,
     )
@@ -0,0 +1,146 @@
+"""Process-wide pooled HTTP transport for platform API clients.
+
+All platform clients (core.social.platforms) share a single
+``requests.Session`` per process so TCP/TLS connections are kept alive and
+reused across accounts. Clients must not put credentials on the session:
+the bearer token is passed per request (see ``bearer``).
+
+Pool sizes are tuned per host with SOCIAL_HTTP_POOL_SIZES
+(``{"api.x.com": 20, ...}``); other hosts get SOCIAL_HTTP_POOL_DEFAULT_SIZE.
+When a host pool is exhausted, callers wait for a free connection
+(``pool_block``) instead of opening throwaway connections; that wait is
+reported in ``pool_stats()`` together with requests and new connections.
+
+HTTP/2 is not available through requests/urllib3; the concurrent metrics
+fetcher (core.social.metrics_fetch) negotiates it via httpx when ``h2`` is
+installed.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+DEFAULT_POOL_SIZE = 10
+
+PLATFORM_HOSTS = (
+    "graph.instagram.com",
+    "graph.facebook.com",
+    "open.tiktokapis.com",
+    "api.linkedin.com",
+    "api.twitter.com",
+    "api.x.com",
+)
+
+
+class _PoolStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "new_connections": 0, "wait_seconds": 0.0}
+        )
+
+    def add(self, host: str, field: str, value: float = 1) -> None:
+        with self._lock:
+            self._hosts[host][field] += value
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            out = {}
+            for host, s in self._hosts.items():
+                out[host] = {
+                    "requests": int(s["requests"]),
+                    "new_connections": int(s["new_connections"]),
+                    "hits": int(max(0, s["requests"] - s["new_connections"])),
+                    "wait_seconds": round(s["wait_seconds"], 4),
+                }
+            return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+
+_stats = _PoolStats()
+
+
+def _instrumented(pool_cls):
+    class InstrumentedPool(pool_cls):
+        def _new_conn(self):
+            _stats.add(self.host, "new_connections")
+            return super()._new_conn()
+
+        def _get_conn(self, timeout=None):
+            start = time.perf_counter()
+            try:
+                return super()._get_conn(timeout=timeout)
+            finally:
+                _stats.add(self.host, "wait_seconds", time.perf_counter() - start)
+
+        def urlopen(self, method, url, *args, **kwargs):
+            _stats.add(self.host, "requests")
+            return super().urlopen(method, url, *args, **kwargs)
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_cls.__name__}"
+    return InstrumentedPool
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter with keep-alive pools that record stats."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _instrumented(HTTPConnectionPool),
+            "https": _instrumented(HTTPSConnectionPool),
+        }
+
+
+def _build_session() -> requests.Session:
+    default_size = int(getattr(settings, "SOCIAL_HTTP_POOL_DEFAULT_SIZE", DEFAULT_POOL_SIZE))
+    sizes = {host: default_size for host in PLATFORM_HOSTS}
+    sizes.update(getattr(settings, "SOCIAL_HTTP_POOL_SIZES", {}) or {})
+
+    session = requests.Session()
+    default = PooledAdapter(pool_connections=len(sizes) + 4, pool_maxsize=default_size, pool_block=True)
+    session.mount("https://", default)
+    session.mount("http://", default)
+    for host, size in sizes.items():
+        session.mount(f"https://{host}/", PooledAdapter(pool_connections=1, pool_maxsize=size, pool_block=True))
+    return session
+
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+
+
+def get_session() -> requests.Session:
+    """Shared session for this process (rebuilt after fork, e.g. Celery prefork)."""
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _lock:
+            if _session is None or _session_pid != pid:
+                _session = _build_session()
+                _session_pid = pid
+                _stats.reset()
+    return _session
+
+
+def bearer(access_token: str) -> Dict[str, str]:
+    """Per-request auth headers (never stored on the shared session)."""
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+def pool_stats() -> Dict[str, Dict[str, float]]:
+    """Per-host pool statistics for this process: requests, hits, new connections, wait time."""
+    return _stats.snapshot()
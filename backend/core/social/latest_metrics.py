@@ -0,0 +1,145 @@
+"""Latest metrics per account.
+
+``LatestMetrics`` holds a copy of the newest MetricsSnapshot of every account.
+Every code path that writes snapshots calls ``refresh_latest_metrics`` right
+after, so readers (dashboard, automations) get current metrics for any number
+of accounts in one indexed query instead of one query per account.
+
+``latest_snapshots`` is the equivalent query on metrics_snapshots itself
+(Postgres ``DISTINCT ON`` over the (social_account, -timestamp) index); it is
+used to backfill accounts that have no LatestMetrics row yet.
+
+``record_snapshots`` is the change-only write path of the metrics sync: a
+fetched snapshot is only inserted when a metric differs from LatestMetrics
+or the last insert is older than the heartbeat. Unchanged accounts just move
+``LatestMetrics.valid_until`` forward; when a new snapshot supersedes a row,
+that row gets the final ``valid_until``, so every superseded snapshot states
+the span its values held (timestamp through valid_until). The newest row's
+``valid_until`` stays null: LatestMetrics has the current one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.social.models import LatestMetrics, MetricsSnapshot
+
+METRIC_FIELDS = [
+    "followers_count",
+    "following_count",
+    "posts_count",
+    "reach",
+    "impressions",
+    "engagement_count",
+    "profile_views",
+]
+
+
+def refresh_latest_metrics(snapshots: Iterable[MetricsSnapshot]) -> int:
+    """Upsert LatestMetrics from freshly saved ``snapshots``; returns rows written."""
+    newest: Dict[object, MetricsSnapshot] = {}
+    for snapshot in snapshots:
+        current = newest.get(snapshot.social_account_id)
+        if current is None or snapshot.timestamp >= current.timestamp:
+            newest[snapshot.social_account_id] = snapshot
+
+    rows = [
+        LatestMetrics(
+            social_account_id=account_id,
+            snapshot_id=snapshot.id,
+            timestamp=snapshot.timestamp,
+            valid_until=snapshot.valid_until or snapshot.timestamp,
+            **{field: getattr(snapshot, field) for field in METRIC_FIELDS},
+        )
+        for account_id, snapshot in newest.items()
+    ]
+    if rows:
+        LatestMetrics.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["social_account"],
+            update_fields=["snapshot_id", "timestamp", "valid_until", *METRIC_FIELDS],
+        )
+    return len(rows)
+
+
+@dataclass
+class RecordResult:
+    written: List[MetricsSnapshot] = field(default_factory=list)
+    unchanged: List[object] = field(default_factory=list)  # account ids
+    # Account ids whose metrics differ from LatestMetrics (or that had none); excludes heartbeat writes
+    changed: List[object] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"written": len(self.written), "unchanged": len(self.unchanged)}
+
+
+def record_snapshots(snapshots: List[MetricsSnapshot], *, heartbeat: timedelta) -> RecordResult:
+    """Insert the ``snapshots`` (unsaved) whose metrics changed or whose heartbeat is due.
+
+    ``heartbeat`` <= 0 writes every snapshot. LatestMetrics is kept current
+    either way.
+    """
+    now = timezone.now()
+    previous = {
+        row.social_account_id: row
+        for row in LatestMetrics.objects.filter(social_account_id__in=[s.social_account_id for s in snapshots])
+    }
+
+    result = RecordResult()
+    superseded = []
+    for snapshot in snapshots:
+        latest = previous.get(snapshot.social_account_id)
+        same = latest is not None and all(getattr(snapshot, f) == getattr(latest, f) for f in METRIC_FIELDS)
+        if same and heartbeat > timedelta(0) and now - latest.timestamp < heartbeat:
+            result.unchanged.append(snapshot.social_account_id)
+            continue
+        result.written.append(snapshot)
+        if not same:
+            result.changed.append(snapshot.social_account_id)
+        if latest is not None:
+            superseded.append(
+                MetricsSnapshot(
+                    id=latest.snapshot_id,
+                    timestamp=latest.timestamp,
+                    valid_until=latest.valid_until or latest.timestamp,
+                )
+            )
+
+    with transaction.atomic():
+        MetricsSnapshot.objects.bulk_create(result.written)
+        if superseded:
+            # Time bound on the partition key prunes partitions.
+            MetricsSnapshot.objects.filter(timestamp__gte=min(s.timestamp for s in superseded)).bulk_update(
+                superseded, ["valid_until"], batch_size=500
+            )
+        refresh_latest_metrics(result.written)
+        if result.unchanged:
+            LatestMetrics.objects.filter(social_account_id__in=result.unchanged).update(valid_until=now)
+    return result
+
+
+def latest_snapshots(account_ids: Iterable) -> List[MetricsSnapshot]:
+    """Newest snapshot per account in a single DISTINCT ON query."""
+    return list(
+        MetricsSnapshot.objects.filter(social_account_id__in=list(account_ids))
+        .order_by("social_account_id", "-timestamp")
+        .distinct("social_account_id")
+        .only("id", "social_account_id", "timestamp", "valid_until", *METRIC_FIELDS)
+    )
+
+
+def rebuild_latest_metrics(account_ids: Optional[Iterable] = None, batch_size: int = 1000) -> int:
+    """Recompute LatestMetrics from metrics_snapshots (all accounts by default)."""
+    if account_ids is None:
+        account_ids = MetricsSnapshot.objects.order_by().values_list("social_account_id", flat=True).distinct()
+    ids = list(account_ids)
+    written = 0
+    for i in range(0, len(ids), batch_size):
+        written += refresh_latest_metrics(latest_snapshots(ids[i:i + batch_size]))
+    return written
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+import core.social.views.analytics  # noqa: F401  (registers the cached endpoints)
+from core.social.response_cache import hit_ratios, reset_stats
+
+
+class Command(BaseCommand):
+    help = "Show the analytics response cache hit ratio per endpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'endpoint':<20}{'hits':>10}{'misses':>10}{'hit ratio':>12}")
+        for endpoint, stats in hit_ratios().items():
+            ratio = "-" if stats["hit_ratio"] is None else f"{stats['hit_ratio']:.1%}"
+            self.stdout.write(f"{endpoint:<20}{stats['hits']:>10}{stats['misses']:>10}{ratio:>12}")
+        if options["reset"]:
+            reset_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset"))
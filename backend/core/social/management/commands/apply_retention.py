@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.social.retention import POLICIES, apply_retention, retention_days
+
+
+class Command(BaseCommand):
+    help = "Delete time-series rows past their retention window (DATA_RETENTION_DAYS) in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--policy", action="append", help=f"Policy to run (repeatable): {', '.join(POLICIES)}")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the rows that would be deleted")
+        parser.add_argument("--batch-size", type=int)
+        parser.add_argument("--max-batches", type=int)
+        parser.add_argument("--pause", type=float, help="Seconds to sleep between batches")
+
+    def handle(self, *args, **options):
+        names = options["policy"]
+        unknown = set(names or []) - set(POLICIES)
+        if unknown:
+            raise CommandError(f"Unknown policy: {', '.join(sorted(unknown))}")
+
+        reports = apply_retention(
+            names,
+            dry_run=options["dry_run"],
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+            pause=options["pause"],
+        )
+
+        verb = "would delete" if options["dry_run"] else "deleted"
+        total = 0
+        for report in reports:
+            total += report.rows
+            notes = f" ({'; '.join(report.notes)})" if report.notes else ""
+            self.stdout.write(
+                f"{report.policy}: keep {retention_days(report.policy)}d, {verb} {report.rows} rows "
+                f"in {report.batches} batches, {report.seconds:.1f}s{notes}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Total rows {verb}: {total}"))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import random
+import statistics
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from core.social.columnar import (
+    WEEKDAYS,
+    group_means,
+    growth_rates,
+    last_deltas,
+    latest_zscores,
+    moving_average,
+    percentiles,
+    series_from_rows,
+)
+
+
+def _per_row(series):
+    """Reference: the per-account, per-row Python the tasks/recommendations used."""
+    deltas, growth, averages, zscores = {}, {}, {}, {}
+    for account_id, points in series.items():
+        values = [v for _, v in points]
+        if len(values) >= 2:
+            deltas[account_id] = values[-1] - values[-2]
+        if values[0] > 0:
+            growth[account_id] = (values[-1] - values[0]) / values[0] * 100
+        window = []
+        averages[account_id] = []
+        for v in values:
+            window.append(v)
+            if len(window) > 4:
+                window.pop(0)
+            averages[account_id].append(sum(window) / len(window))
+        mean = sum(values) / len(values)
+        std = (sum((v - mean) ** 2 for v in values) / len(values)) ** 0.5
+        if std > 0:
+            zscores[account_id] = (values[-1] - mean) / std
+    latest = sorted(points[-1][1] for points in series.values())
+    p50 = statistics.median(latest)
+    return deltas, growth, averages, zscores, p50
+
+
+def _posting_time_per_row(posts):
+    day_performance, hour_performance = {}, {}
+    for posted_at, engagement in posts:
+        day_performance.setdefault(posted_at.strftime("%A").lower(), []).append(engagement)
+        hour_performance.setdefault(posted_at.hour, []).append(engagement)
+    day_avg = {d: sum(r) / len(r) for d, r in day_performance.items()}
+    hour_avg = {h: sum(r) / len(r) for h, r in hour_performance.items()}
+    return (
+        [d for d, _ in sorted(day_avg.items(), key=lambda x: x[1], reverse=True)[:3]],
+        [h for h, _ in sorted(hour_avg.items(), key=lambda x: x[1], reverse=True)[:3]],
+    )
+
+
+def _posting_time_columnar(posts):
+    n = len(posts)
+    days = np.fromiter((p.weekday() for p, _ in posts), dtype=np.int64, count=n)
+    hours = np.fromiter((p.hour for p, _ in posts), dtype=np.int64, count=n)
+    engagement = np.fromiter((e for _, e in posts), dtype=np.float64, count=n)
+    day_avg, day_counts = group_means(days, engagement, 7)
+    hour_avg, hour_counts = group_means(hours, engagement, 24)
+    return (
+        [WEEKDAYS[d] for d in np.argsort(-day_avg, kind="stable") if day_counts[d]][:3],
+        [int(h) for h in np.argsort(-hour_avg, kind="stable") if hour_counts[h]][:3],
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark columnar (NumPy) metric analytics against the per-row Python code on synthetic "
+        "series: deltas, growth, 4-point moving average, z-scores, percentiles, posting-time averages."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accounts", type=int, default=10000)
+        parser.add_argument("--points", type=int, default=96, help="Snapshots per account")
+        parser.add_argument("--posts", type=int, default=200000, help="Posts for the posting-time analysis")
+
+    def handle(self, *args, **options):
+        n, points = options["accounts"], options["points"]
+        start = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+        rows = []
+        for _ in range(n):
+            account_id = uuid.uuid4()
+            value = random.randint(0, 100000)
+            for p in range(points):
+                value = max(0, value + random.randint(-50, 60))
+                rows.append((account_id, start + timedelta(minutes=15 * p), value))
+        self.stdout.write(f"{n} accounts x {points} points ({len(rows)} rows)")
+
+        # Both sides start from the (account_id, timestamp, value) rows a values_list query yields.
+        started = time.perf_counter()
+        grouped = defaultdict(list)
+        for account_id, ts, value in rows:
+            grouped[account_id].append((ts, value))
+        reference = _per_row(grouped)
+        per_row_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        batch = series_from_rows(iter(rows), ("followers_count",))
+        load_s = time.perf_counter() - started
+        started = time.perf_counter()
+        deltas = last_deltas(batch, "followers_count")
+        growth = growth_rates(batch, "followers_count")
+        averages = moving_average(batch, "followers_count", 4)
+        zscores = latest_zscores(batch, "followers_count")
+        p50 = percentiles(batch.values["followers_count"][batch.ends], (50,))[50]
+        columnar_s = time.perf_counter() - started
+
+        # Same answers as the reference implementation.
+        first = batch.account_ids[0]
+        assert deltas[0] == reference[0][first]
+        assert np.allclose(averages[: points], reference[2][first])
+        assert abs(p50 - reference[4]) < 1e-6
+        assert np.isclose(growth[0], reference[1].get(first, np.nan), equal_nan=True)
+        assert np.isclose(zscores[0], reference[3].get(first, np.nan), equal_nan=True)
+
+        self.stdout.write(f"per-row Python      {per_row_s * 1000:9.1f} ms  (group rows + compute)")
+        self.stdout.write(f"columnar build      {load_s * 1000:9.1f} ms  (rows -> arrays)")
+        self.stdout.write(
+            f"columnar compute    {columnar_s * 1000:9.1f} ms  "
+            f"(total {(load_s + columnar_s) * 1000:.1f} ms, {per_row_s / (load_s + columnar_s):.1f}x)"
+        )
+
+        posts = [
+            (start + timedelta(minutes=random.randint(0, 60 * 24 * 365)), random.random() * 10)
+            for _ in range(options["posts"])
+        ]
+        started = time.perf_counter()
+        expected = _posting_time_per_row(posts)
+        per_row_s = time.perf_counter() - started
+        started = time.perf_counter()
+        result = _posting_time_columnar(posts)
+        columnar_s = time.perf_counter() - started
+        assert result == expected
+        self.stdout.write(
+            f"posting time ({len(posts)} posts): per-row {per_row_s * 1000:.1f} ms, "
+            f"columnar {columnar_s * 1000:.1f} ms"
+        )
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from core.social.latest_metrics import latest_snapshots, rebuild_latest_metrics
+from core.social.models import LatestMetrics, MetricsSnapshot, SocialAccount
+from core.workspaces.models import Workspace
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _timed(fn, repeat: int):
+    best = None
+    queries = 0
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            rows = fn()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        queries = len(ctx.captured_queries)
+    return best, queries, rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark latest-metrics reads for the dashboard: per-account queries vs DISTINCT ON vs "
+        "the latest_metrics table. Seeds data inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workspace", required=True, help="Existing Workspace UUID to attach bench accounts to")
+        parser.add_argument("--accounts", type=int, default=1000)
+        parser.add_argument("--snapshots", type=int, default=50000, help="Total snapshots across all accounts")
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        try:
+            workspace = Workspace.objects.get(id=options["workspace"])
+        except Workspace.DoesNotExist:
+            raise CommandError("Workspace not found")
+
+        try:
+            with transaction.atomic():
+                self._run(workspace, options)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _run(self, workspace, options):
+        n, total, repeat = options["accounts"], options["snapshots"], options["repeat"]
+
+        start = time.perf_counter()
+        accounts = SocialAccount.objects.bulk_create(
+            SocialAccount(
+                workspace=workspace,
+                platform=SocialAccount.PLATFORM_X,
+                handle=f"bench-{i}",
+                platform_user_id=str(i),
+                status=SocialAccount.STATUS_ACTIVE,
+            )
+            for i in range(n)
+        )
+        MetricsSnapshot.objects.bulk_create(
+            (
+                MetricsSnapshot(
+                    social_account=accounts[i % n],
+                    followers_count=random.randint(0, 100000),
+                    reach=random.randint(0, 10000),
+                )
+                for i in range(total)
+            ),
+            batch_size=5000,
+        )
+        # bulk_create stamps every row with "now"; spread snapshots over 90 days.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {MetricsSnapshot._meta.db_table} "
+                "SET timestamp = timestamp - random() * interval '90 days' "
+                "WHERE social_account_id = ANY(%s)",
+                [[a.id for a in accounts]],
+            )
+            cursor.execute(f"ANALYZE {MetricsSnapshot._meta.db_table}")
+        rebuild_latest_metrics([a.id for a in accounts])
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {LatestMetrics._meta.db_table}")
+        self.stdout.write(f"seeded {n} accounts x {total} snapshots in {time.perf_counter() - start:.1f}s")
+
+        active = SocialAccount.objects.filter(workspace=workspace, status=SocialAccount.STATUS_ACTIVE)
+
+        def per_account():
+            return [MetricsSnapshot.objects.filter(social_account=a).first() for a in active]
+
+        def distinct_on():
+            return latest_snapshots(active.values_list("id", flat=True))
+
+        def latest_table():
+            return list(
+                active.filter(latest_metrics__isnull=False).values(
+                    "id", "handle", "latest_metrics__followers_count", "latest_metrics__reach"
+                )
+            )
+
+        for label, fn in (("per-account", per_account), ("distinct-on", distinct_on), ("latest_metrics", latest_table)):
+            elapsed, queries, rows = _timed(fn, repeat)
+            self.stdout.write(f"{label:<15} {elapsed * 1000:8.1f} ms  {queries:5d} queries  {len(rows)} rows")
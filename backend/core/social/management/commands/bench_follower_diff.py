@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import multiprocessing
+import resource
+import sys
+import time
+from typing import Any, Dict, Iterator, List
+
+from django.core.management.base import BaseCommand
+
+from core.social.follower_diff import (
+    FollowerIdAccumulator,
+    iter_removed,
+    page_new_ids,
+    parse_user_id,
+    sorted_ids,
+)
+
+PAGE_SIZE = 1000
+CHURN = 0.01
+
+
+def _synthetic_pages(size: int, offset: int) -> Iterator[List[Dict[str, Any]]]:
+    """Pages of fake X users; ``offset`` shifts the ID window to create churn."""
+    base = 10**15
+    page: List[Dict[str, Any]] = []
+    for i in range(offset, size + offset):
+        uid = base + i
+        page.append(
+            {
+                "id": str(uid),
+                "username": f"user{uid}",
+                "profile_image_url": f"https://pbs.twimg.com/profile_images/{uid}/a_normal.jpg",
+                "verified": False,
+                "public_metrics": {"followers_count": i % 5000, "following_count": 100},
+            }
+        )
+        if len(page) == PAGE_SIZE:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def _run_legacy(size: int) -> Dict[str, int]:
+    """Original algorithm: full user list, full map, set of string IDs."""
+    prev_ids = {str(10**15 + i) for i in range(size)}
+    all_users: List[Dict[str, Any]] = []
+    for page in _synthetic_pages(size, int(size * CHURN)):
+        all_users.extend(page)
+
+    current_map: Dict[str, Dict[str, Any]] = {}
+    for u in all_users:
+        current_map[u["id"]] = {"id": u["id"], "username": u["username"], "raw": u}
+    current_ids = set(current_map)
+
+    return {
+        "new": len(current_ids - prev_ids),
+        "removed": len(prev_ids - current_ids),
+    }
+
+
+def _run_streaming(size: int) -> Dict[str, int]:
+    prev_ids = sorted_ids(10**15 + i for i in range(size))
+    accumulator = FollowerIdAccumulator()
+    new = 0
+    for page in _synthetic_pages(size, int(size * CHURN)):
+        ids = [uid for uid in (parse_user_id(u.get("id")) for u in page) if uid is not None]
+        accumulator.add_page(ids)
+        new += len(page_new_ids(prev_ids, ids))
+    current = accumulator.to_array()
+    removed = sum(1 for _ in iter_removed(prev_ids, current))
+    return {"new": new, "removed": removed}
+
+
+def _worker(mode: str, size: int, queue) -> None:
+    start = time.perf_counter()
+    counts = _run_streaming(size) if mode == "streaming" else _run_legacy(size)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":  # bytes on macOS, KiB on Linux
+        peak_kb //= 1024
+    queue.put({"elapsed": elapsed, "peak_rss_mb": peak_kb / 1024, **counts})
+
+
+class Command(BaseCommand):
+    help = "Benchmark follower snapshot diffing (peak RSS + wall time) on synthetic follower lists."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="100000,1000000,5000000")
+        parser.add_argument("--modes", default="streaming,legacy")
+
+    def handle(self, *args, **options):
+        sizes = [int(s) for s in options["sizes"].split(",") if s]
+        modes = [m for m in options["modes"].split(",") if m]
+        # Each run gets a fresh interpreter so peak RSS is not shared between runs.
+        ctx = multiprocessing.get_context("spawn")
+
+        for size in sizes:
+            for mode in modes:
+                queue = ctx.Queue()
+                proc = ctx.Process(target=_worker, args=(mode, size, queue))
+                proc.start()
+                proc.join()
+                if proc.exitcode != 0:
+                    self.stdout.write(self.style.ERROR(f"{mode:<9} size={size:>9} failed (exit {proc.exitcode})"))
+                    continue
+                r = queue.get()
+                self.stdout.write(
+                    f"{mode:<9} size={size:>9} time={r['elapsed']:.2f}s peak_rss={r['peak_rss_mb']:.1f}MB "
+                    f"new={r['new']} removed={r['removed']}"
+                )
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from core.social.metrics_fetch import MetricsRequest, fetch_metrics
+from core.social.models import SocialAccount
+from core.social.platforms import get_client
+
+
+def _x_user(user_id: str) -> dict:
+    return {"id": user_id, "public_metrics": {"followers_count": 1200, "following_count": 80, "tweet_count": 950}}
+
+
+def _payload(path: str, query: str) -> dict:
+    if path.endswith("/users"):
+        return {"data": [_x_user(i) for i in parse_qs(query)["ids"][0].split(",")]}
+    if path.endswith("/users/me"):
+        return {"data": {"id": "1", "public_metrics": {"followers_count": 1200, "following_count": 80, "tweet_count": 950}}}
+    if path.endswith("/user/info/"):
+        return {"data": {"user": {"follower_count": 5400, "following_count": 12, "video_count": 88}}}
+    if path.endswith("/insights"):
+        return {"data": [{"name": m, "values": [{"value": 100}]} for m in ("reach", "impressions", "profile_views")]}
+    return {"followers_count": 3100, "follows_count": 300, "media_count": 410}
+
+
+def _serve(latency: float, port_queue) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlparse(self.path)
+            body = json.dumps(_payload(url.path, url.query)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def _mock_server(latency: float):
+    """Run the mock API in a separate process so it does not share the GIL with the client."""
+    port_queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_serve, args=(latency, port_queue), daemon=True)
+    proc.start()
+    return proc, port_queue.get(timeout=10)
+
+
+class Command(BaseCommand):
+    help = "Benchmark account metrics fetching (per-account clients vs concurrent batch) against a local mock API."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accounts", type=int, default=500)
+        parser.add_argument("--platform", default=SocialAccount.PLATFORM_X, choices=["x", "instagram", "tiktok"])
+        parser.add_argument("--latency-ms", type=int, default=100, help="Simulated API latency per request")
+        parser.add_argument("--concurrency", type=int, default=100)
+
+    # The mock API has no quota; the rate governor would only measure its own budgets.
+    @override_settings(SOCIAL_RATE_GOVERNOR_ENABLED=False)
+    def handle(self, *args, **options):
+        n = options["accounts"]
+        platform = options["platform"]
+        server, port = _mock_server(options["latency_ms"] / 1000)
+        base = f"http://127.0.0.1:{port}"
+
+        try:
+            # Current path: one task per account, one blocking client call sequence each.
+            start = time.perf_counter()
+            for i in range(n):
+                client = get_client(platform, f"token-{i}", base_url=base)
+                client.fetch_account_metrics(str(i))
+            per_task = time.perf_counter() - start
+
+            requests = [MetricsRequest(str(i), platform, str(i), f"token-{i}") for i in range(n)]
+            timings = {}
+            for mode, bulk in (("batch", False), ("batch+bulk", True)):
+                start = time.perf_counter()
+                results = fetch_metrics(
+                    requests,
+                    concurrency={platform: options["concurrency"]},
+                    base_urls={platform: base},
+                    bulk=bulk,
+                )
+                timings[mode] = (time.perf_counter() - start, sum(1 for r in results if r.metrics is None))
+        finally:
+            server.terminate()
+
+        self.stdout.write(f"per-account: {n} accounts in {per_task:.2f}s ({n / per_task:.1f} accounts/s)")
+        for mode, (elapsed, failed) in timings.items():
+            self.stdout.write(
+                f"{mode + ':':<13}{n} accounts in {elapsed:.2f}s ({n / elapsed:.1f} accounts/s, failed={failed})"
+            )
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.social.partitioning import add_months, create_partition, month_start
+
+PLAIN = "bench_follower_changes_plain"
+PARTITIONED = "bench_follower_changes_partitioned"
+
+COLUMNS = """
+    id uuid NOT NULL,
+    social_account_id uuid NOT NULL,
+    change_type varchar(32) NOT NULL,
+    "timestamp" timestamptz NOT NULL
+"""
+
+# (label, SQL, params builder) - every query is bounded on timestamp, as in analytics.py / executor.
+QUERIES = [
+    (
+        "trigger count 15m",
+        "SELECT COUNT(*) FROM {t} WHERE social_account_id = %s AND change_type = 'new_follower' "
+        "AND \"timestamp\" >= now() - interval '15 minutes'",
+        lambda accounts: [random.choice(accounts)],
+    ),
+    (
+        "workspace count 24h",
+        "SELECT COUNT(*) FROM {t} WHERE social_account_id = ANY(%s::uuid[]) AND change_type = 'unfollower' "
+        "AND \"timestamp\" >= now() - interval '24 hours'",
+        lambda accounts: [random.sample(accounts, min(50, len(accounts)))],
+    ),
+    (
+        "latest 50 in 30d",
+        "SELECT id, \"timestamp\" FROM {t} WHERE social_account_id = %s "
+        "AND \"timestamp\" >= now() - interval '30 days' ORDER BY \"timestamp\" DESC LIMIT 50",
+        lambda accounts: [random.choice(accounts)],
+    ),
+    (
+        "account count 90d",
+        "SELECT COUNT(*) FROM {t} WHERE social_account_id = %s AND \"timestamp\" >= now() - interval '90 days'",
+        lambda accounts: [random.choice(accounts)],
+    ),
+]
+
+
+def _account_uuid(i: int) -> str:
+    return f"00000000-0000-0000-0000-{i:012x}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test: insert synthetic follower_changes rows into a plain and a monthly-partitioned table "
+        "(same data, same indexes) and compare query latency. Uses scratch tables, dropped afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=20_000_000)
+        parser.add_argument("--accounts", type=int, default=5000)
+        parser.add_argument("--months", type=int, default=12, help="Months of history")
+        parser.add_argument("--repeat", type=int, default=50)
+        parser.add_argument("--keep", action="store_true", help="Keep the scratch tables")
+
+    def handle(self, *args, **options):
+        rows, n, months = options["rows"], options["accounts"], options["months"]
+        try:
+            self._load(rows, n, months)
+            accounts = [_account_uuid(i) for i in range(n)]
+            self.stdout.write(f"{'query':<22}{'plain p50':>12}{'part p50':>12}{'plain p95':>12}{'part p95':>12}")
+            for label, sql, params in QUERIES:
+                plain, part = self._measure(sql, params, accounts, options["repeat"])
+                self.stdout.write(
+                    f"{label:<22}{plain[0]:>10.2f}ms{part[0]:>10.2f}ms{plain[1]:>10.2f}ms{part[1]:>10.2f}ms"
+                )
+            self._explain(QUERIES[0][1], [accounts[0]])
+        finally:
+            if not options["keep"]:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP TABLE IF EXISTS {PLAIN}, {PARTITIONED}")
+
+    def _load(self, rows: int, n: int, months: int) -> None:
+        start = time.perf_counter()
+        first = add_months(month_start(date.today()), -months)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {PLAIN}, {PARTITIONED}")
+            cursor.execute(f"CREATE TABLE {PLAIN} ({COLUMNS}, PRIMARY KEY (id))")
+            cursor.execute(
+                f"CREATE TABLE {PARTITIONED} ({COLUMNS}, PRIMARY KEY (id, \"timestamp\")) "
+                "PARTITION BY RANGE (\"timestamp\")"
+            )
+        for offset in range(months + 2):
+            create_partition(PARTITIONED, add_months(first, offset))
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {PLAIN}
+                SELECT gen_random_uuid(),
+                       ('00000000-0000-0000-0000-' || lpad(to_hex(mod(g, %s)), 12, '0'))::uuid,
+                       CASE WHEN mod(g, 3) = 0 THEN 'unfollower' ELSE 'new_follower' END,
+                       now() - random() * (now() - %s::timestamptz)
+                FROM generate_series(1, %s) AS g
+                """,
+                [n, first.isoformat(), rows],
+            )
+            cursor.execute(f"INSERT INTO {PARTITIONED} SELECT * FROM {PLAIN}")
+            for table in (PLAIN, PARTITIONED):
+                cursor.execute(f"CREATE INDEX ON {table} (social_account_id, \"timestamp\" DESC)")
+                cursor.execute(f"CREATE INDEX ON {table} (social_account_id, change_type, \"timestamp\" DESC)")
+                cursor.execute(f"VACUUM ANALYZE {table}")
+        self.stdout.write(
+            f"loaded {rows} rows ({n} accounts, {months} months) into both tables in {time.perf_counter() - start:.0f}s"
+        )
+
+    def _measure(self, sql, params, accounts, repeat):
+        timings = {PLAIN: [], PARTITIONED: []}
+        with connection.cursor() as cursor:
+            for _ in range(repeat):
+                args = params(accounts)
+                for table in (PLAIN, PARTITIONED):
+                    started = time.perf_counter()
+                    cursor.execute(sql.format(t=table), args)
+                    cursor.fetchall()
+                    timings[table].append((time.perf_counter() - started) * 1000)
+
+        def summary(values):
+            values = sorted(values)
+            return statistics.median(values), values[int(len(values) * 0.95) - 1 if len(values) > 1 else 0]
+
+        return summary(timings[PLAIN]), summary(timings[PARTITIONED])
+
+    def _explain(self, sql, args) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN " + sql.format(t=PARTITIONED), args)
+            plan = [row[0] for row in cursor.fetchall()]
+        scanned = sum(1 for line in plan if f"{PARTITIONED}_p" in line)
+        self.stdout.write(f"partitions scanned by '{QUERIES[0][0]}': {scanned}")
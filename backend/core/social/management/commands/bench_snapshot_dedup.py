@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import random
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.social.latest_metrics import METRIC_FIELDS, record_snapshots
+from core.social.models import MetricsSnapshot, SocialAccount
+from core.workspaces.models import Workspace
+
+SYNC_INTERVAL = timedelta(minutes=15)
+
+# (share of accounts, platform, per-sync change probability per metric)
+ACCOUNT_MIX = [
+    # Instagram insights are rolling 24h windows: reach/impressions move almost every sync.
+    (0.25, SocialAccount.PLATFORM_INSTAGRAM, {"followers_count": 0.4, "reach": 0.9, "impressions": 0.9,
+                                              "engagement_count": 0.5, "profile_views": 0.3}),
+    # X public_metrics only: follower / post counts.
+    (0.25, SocialAccount.PLATFORM_X, {"followers_count": 0.2, "following_count": 0.02, "posts_count": 0.05}),
+    (0.20, SocialAccount.PLATFORM_TIKTOK, {"followers_count": 0.1, "posts_count": 0.01}),
+    # LinkedIn returns all-zero metrics.
+    (0.15, SocialAccount.PLATFORM_LINKEDIN, {}),
+    # Dormant accounts on any platform.
+    (0.15, SocialAccount.PLATFORM_INSTAGRAM, {}),
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure MetricsSnapshot rows written by change-only snapshot writes for a mixed set of "
+        "accounts over simulated 15-minute syncs, per heartbeat. Runs inside rolled-back transactions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workspace", required=True, help="Existing Workspace UUID to attach bench accounts to")
+        parser.add_argument("--accounts", type=int, default=1000)
+        parser.add_argument("--syncs", type=int, default=96, help="Syncs to simulate (96 = one day)")
+        parser.add_argument(
+            "--heartbeats", default="0,3600,21600", help="Comma-separated heartbeats in seconds (0 = write every sync)"
+        )
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        try:
+            workspace = Workspace.objects.get(id=options["workspace"])
+        except Workspace.DoesNotExist:
+            raise CommandError("Workspace not found")
+
+        heartbeats = [int(h) for h in options["heartbeats"].split(",")]
+        self.stdout.write(f"{'heartbeat':>10}{'rows':>10}{'unchanged':>11}{'reduction':>11}{'seconds':>9}")
+        baseline = options["accounts"] * options["syncs"]
+        for heartbeat in heartbeats:
+            try:
+                with transaction.atomic():
+                    rows, unchanged, elapsed = self._run(workspace, heartbeat, options)
+                    raise _Rollback()
+            except _Rollback:
+                pass
+            self.stdout.write(
+                f"{heartbeat:>10}{rows:>10}{unchanged:>11}{1 - rows / baseline:>10.1%}{elapsed:>9.2f}"
+            )
+        self.stdout.write(f"baseline (one row per account per sync): {baseline}")
+
+    def _run(self, workspace, heartbeat, options):
+        rng = random.Random(options["seed"])
+        n = options["accounts"]
+        profiles = []
+        for share, platform, changes in ACCOUNT_MIX:
+            profiles += [(platform, changes)] * round(share * n)
+        profiles = profiles[:n]
+
+        accounts = SocialAccount.objects.bulk_create(
+            SocialAccount(
+                workspace=workspace,
+                platform=platform,
+                handle=f"bench-dedup-{i}",
+                platform_user_id=str(i),
+                status=SocialAccount.STATUS_ACTIVE,
+            )
+            for i, (platform, _) in enumerate(profiles)
+        )
+        values = [
+            {f: (rng.randint(100, 100000) if changes else 0) for f in METRIC_FIELDS}
+            for _, changes in profiles
+        ]
+
+        clock = timezone.now()
+        unchanged = 0
+        start = time.perf_counter()
+        with mock.patch("django.utils.timezone.now", side_effect=lambda: clock):
+            for _ in range(options["syncs"]):
+                snapshots = []
+                for account, current, (_, changes) in zip(accounts, values, profiles):
+                    for metric, p in changes.items():
+                        if rng.random() < p:
+                            current[metric] = max(0, current[metric] + rng.randint(-20, 50))
+                    snapshots.append(MetricsSnapshot(social_account=account, **current))
+                result = record_snapshots(snapshots, heartbeat=timedelta(seconds=heartbeat))
+                unchanged += len(result.unchanged)
+                clock += SYNC_INTERVAL
+        elapsed = time.perf_counter() - start
+
+        rows = MetricsSnapshot.objects.filter(social_account__in=accounts).count()
+        return rows, unchanged, elapsed
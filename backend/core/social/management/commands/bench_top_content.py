@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from core.social.http_pool import pool_stats
+from core.social.platforms import InstagramClient
+from core.social.platforms.instagram import MEDIA_INSIGHTS
+
+INSIGHTS = {"data": [{"name": m, "values": [{"value": 250}]} for m in MEDIA_INSIGHTS]}
+
+
+def _media(i: int, with_insights: bool) -> dict:
+    media = {
+        "id": f"media-{i}",
+        "caption": f"Post {i}",
+        "media_type": "IMAGE",
+        "permalink": f"https://instagram.com/p/{i}",
+        "timestamp": "2024-01-01T12:00:00+0000",
+        "like_count": 40 + i,
+        "comments_count": 3,
+    }
+    if with_insights:
+        media["insights"] = INSIGHTS
+    return media
+
+
+def _serve(latency: float, reject_expansion: bool, port_queue) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _send(self, status: int, payload) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path.endswith("/insights"):
+                return self._send(200, INSIGHTS)
+            fields = query.get("fields", [""])[0]
+            expanded = "insights.metric" in fields
+            if expanded and reject_expansion:
+                return self._send(400, {"error": {"message": "metric not supported for this media", "code": 100}})
+            limit = int(query.get("limit", ["25"])[0])
+            self._send(200, {"data": [_media(i, expanded) for i in range(limit)]})
+
+        def do_POST(self):
+            time.sleep(latency)
+            batch = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["batch"]
+            self._send(200, [{"code": 200, "body": json.dumps(INSIGHTS)} for _ in batch])
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def _mock_graph(latency: float, reject_expansion: bool):
+    port_queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_serve, args=(latency, reject_expansion, port_queue), daemon=True)
+    proc.start()
+    return proc, port_queue.get(timeout=10)
+
+
+def _requests() -> int:
+    return pool_stats().get("127.0.0.1", {}).get("requests", 0)
+
+
+class Command(BaseCommand):
+    help = "Benchmark Instagram top content fetching (insights per media vs field expansion / batch) against a mock Graph API."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accounts", type=int, default=20)
+        parser.add_argument("--posts", type=int, default=50)
+        parser.add_argument("--latency-ms", type=int, default=100, help="Simulated Graph API latency per request")
+        parser.add_argument(
+            "--fallback", action="store_true", help="Reject insights expansion so the batch request path is measured"
+        )
+
+    @override_settings(SOCIAL_RATE_GOVERNOR_ENABLED=False)
+    def handle(self, *args, **options):
+        n, posts = options["accounts"], options["posts"]
+        server, port = _mock_graph(options["latency_ms"] / 1000, options["fallback"])
+        base = f"http://127.0.0.1:{port}"
+
+        try:
+            # Previous path: list media, then one insights call per media.
+            before = _requests()
+            start = time.perf_counter()
+            for i in range(n):
+                client = InstagramClient(f"token-{i}", base_url=base)
+                for media in client.get_media(str(i), limit=posts):
+                    client.post_metrics(media, client.get_media_insights(media["id"]))
+            per_media = time.perf_counter() - start
+            per_media_requests = _requests() - before
+
+            before = _requests()
+            start = time.perf_counter()
+            fetched = 0
+            for i in range(n):
+                fetched += len(InstagramClient(f"token-{i}", base_url=base).recent_posts(str(i), limit=posts))
+            batched = time.perf_counter() - start
+            batched_requests = _requests() - before
+        finally:
+            server.terminate()
+
+        mode = "batch requests" if options["fallback"] else "field expansion"
+        self.stdout.write(f"{n} accounts x {posts} posts")
+        self.stdout.write(
+            f"per-media: {per_media:.2f}s, {per_media_requests} HTTP requests "
+            f"({per_media_requests / n:.0f}/account); DB: {posts} update_or_create per account"
+        )
+        self.stdout.write(
+            f"{mode}: {batched:.2f}s, {batched_requests} HTTP requests "
+            f"({batched_requests / n:.0f}/account, {fetched} posts); DB: 1 bulk upsert per account"
+        )
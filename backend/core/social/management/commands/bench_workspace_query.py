@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.social.models import (
+    FollowerChange,
+    FollowerChangeDailyCount,
+    LatestMetrics,
+    MetricsRollup,
+    SocialAccount,
+    TopContent,
+)
+from core.social.rollups import bucket_start
+from core.social.workspace_query import QuerySpec, run_query
+from core.workspaces.models import Workspace
+
+PLATFORMS = [
+    SocialAccount.PLATFORM_INSTAGRAM,
+    SocialAccount.PLATFORM_X,
+    SocialAccount.PLATFORM_TIKTOK,
+    SocialAccount.PLATFORM_LINKEDIN,
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _timed(fn, repeat: int):
+    best = None
+    queries = 0
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            rows = fn()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        queries = len(ctx.captured_queries)
+    return best, queries, rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark workspace-wide analytics: per-account Python loops vs compiled workspace_query "
+        "aggregates. Seeds data inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workspace", required=True, help="Existing Workspace UUID to attach bench accounts to")
+        parser.add_argument("--accounts", type=int, default=500)
+        parser.add_argument("--days", type=int, default=90, help="Days of daily rollups / follower counters")
+        parser.add_argument("--posts", type=int, default=50, help="top_content rows per account")
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        try:
+            workspace = Workspace.objects.get(id=options["workspace"])
+        except Workspace.DoesNotExist:
+            raise CommandError("Workspace not found")
+
+        try:
+            with transaction.atomic():
+                self._run(workspace, options)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _seed(self, workspace, n, days, posts):
+        now = timezone.now()
+        accounts = SocialAccount.objects.bulk_create(
+            SocialAccount(
+                workspace=workspace,
+                platform=PLATFORMS[i % len(PLATFORMS)],
+                handle=f"bench-{i}",
+                platform_user_id=str(i),
+                status=SocialAccount.STATUS_ACTIVE,
+            )
+            for i in range(n)
+        )
+        LatestMetrics.objects.bulk_create(
+            LatestMetrics(
+                social_account=a,
+                snapshot_id=uuid.uuid4(),
+                timestamp=now,
+                valid_until=now,
+                followers_count=random.randint(0, 100000),
+                reach=random.randint(0, 50000),
+                engagement_count=random.randint(0, 5000),
+            )
+            for a in accounts
+        )
+        today = bucket_start(now, MetricsRollup.GRANULARITY_DAY)
+        MetricsRollup.objects.bulk_create(
+            (
+                MetricsRollup(
+                    social_account=a,
+                    granularity=MetricsRollup.GRANULARITY_DAY,
+                    bucket_start=today - timedelta(days=d),
+                    samples=96,
+                    last_at=today - timedelta(days=d),
+                    followers_count_last=100000 - d * 10,
+                )
+                for a in accounts
+                for d in range(days)
+            ),
+            batch_size=5000,
+        )
+        TopContent.objects.bulk_create(
+            (
+                TopContent(
+                    social_account=a,
+                    platform_post_id=f"{a.id}-{p}",
+                    post_url="https://example.com/p",
+                    likes_count=random.randint(0, 10000),
+                    engagement_rate=random.random() * 10,
+                    posted_at=now - timedelta(days=p),
+                )
+                for a in accounts
+                for p in range(posts)
+            ),
+            batch_size=5000,
+        )
+        FollowerChangeDailyCount.objects.bulk_create(
+            (
+                FollowerChangeDailyCount(
+                    social_account=a,
+                    day=(now - timedelta(days=d)).date(),
+                    change_type=change_type,
+                    count=random.randint(0, 50),
+                )
+                for a in accounts
+                for d in range(days)
+                for change_type in (FollowerChange.TYPE_NEW_FOLLOWER, FollowerChange.TYPE_UNFOLLOWER)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            for model in (SocialAccount, LatestMetrics, MetricsRollup, TopContent, FollowerChangeDailyCount):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+        return accounts
+
+    def _run(self, workspace, options):
+        n, days, repeat = options["accounts"], options["days"], options["repeat"]
+        start = time.perf_counter()
+        self._seed(workspace, n, days, options["posts"])
+        self.stdout.write(f"seeded {n} accounts ({days} days, {options['posts']} posts each) in {time.perf_counter() - start:.1f}s")
+
+        since = timezone.now() - timedelta(days=30)
+        active = SocialAccount.objects.filter(workspace=workspace, status=SocialAccount.STATUS_ACTIVE)
+
+        # Per-account loops, the way the per-account endpoints compose today.
+        def leaderboard_loop():
+            rows = []
+            for a in active:
+                latest = LatestMetrics.objects.filter(social_account=a).first()
+                if latest:
+                    rows.append((a.handle, latest.engagement_count))
+            return sorted(rows, key=lambda r: -r[1])[:20]
+
+        def growth_loop():
+            totals = defaultdict(int)
+            for a in active:
+                for bucket, followers in MetricsRollup.objects.filter(
+                    social_account=a, granularity=MetricsRollup.GRANULARITY_DAY, bucket_start__gte=since
+                ).values_list("bucket_start", "followers_count_last"):
+                    totals[(a.platform, bucket)] += followers
+            return sorted(totals.items())
+
+        def top_posts_loop():
+            posts = []
+            for a in active:
+                posts.extend(TopContent.objects.filter(social_account=a).order_by("-engagement_rate")[:20])
+            return sorted(posts, key=lambda p: -p.engagement_rate)[:20]
+
+        def unfollowers_loop():
+            totals = defaultdict(int)
+            for a in active:
+                totals[a.platform] += FollowerChangeDailyCount.objects.filter(
+                    social_account=a, change_type=FollowerChange.TYPE_UNFOLLOWER, day__gte=since.date()
+                ).aggregate(total=Sum("count"))["total"] or 0
+            return sorted(totals.items())
+
+        specs = {
+            "leaderboard": QuerySpec(
+                source="accounts", metrics=["max:engagement_count"], group_by=["account", "handle"],
+                order_by="-max_engagement_count", limit=20,
+            ),
+            "growth": QuerySpec(
+                source="rollups", metrics=["sum:followers_count_last"], group_by=["platform", "day"],
+                since=since, deltas=True,
+            ),
+            "top_posts": QuerySpec(
+                source="posts", metrics=["max:engagement_rate"], group_by=["post", "account"],
+                order_by="-max_engagement_rate", limit=20,
+            ),
+            "unfollowers": QuerySpec(
+                source="follower_changes", metrics=["sum:count"], group_by=["platform"],
+                filters={"change_type": [FollowerChange.TYPE_UNFOLLOWER]}, since=since,
+            ),
+        }
+        loops = {
+            "leaderboard": leaderboard_loop,
+            "growth": growth_loop,
+            "top_posts": top_posts_loop,
+            "unfollowers": unfollowers_loop,
+        }
+
+        self.stdout.write(f"{'query':<13}{'loop ms':>10}{'queries':>9}{'engine ms':>11}{'queries':>9}{'rows':>7}")
+        for name, spec in specs.items():
+            loop_s, loop_q, _ = _timed(loops[name], repeat)
+            engine_s, engine_q, rows = _timed(lambda: run_query(workspace.id, spec), repeat)
+            self.stdout.write(
+                f"{name:<13}{loop_s * 1000:10.1f}{loop_q:9d}{engine_s * 1000:11.1f}{engine_q:9d}{len(rows):7d}"
+            )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.social.partitioning import (
+    PARTITIONED_TABLES,
+    convert_to_partitioned,
+    drop_partitions_before,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+)
+from core.social.retention import kept_partition_months
+
+
+class Command(BaseCommand):
+    help = "Manage monthly partitions of metrics_snapshots / follower_changes (Postgres)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["list", "convert", "ensure", "drop"])
+        parser.add_argument("--table", action="append", choices=list(PARTITIONED_TABLES), help="Default: all tables")
+        parser.add_argument("--months-ahead", type=int)
+        parser.add_argument("--keep-legacy", action="store_true", help="convert: keep <table>_unpartitioned")
+        parser.add_argument("--before", help="drop: YYYY-MM-DD; partitions ending on or before it are dropped")
+        parser.add_argument("--no-concurrently", action="store_true", help="drop: plain DETACH (Postgres < 14)")
+        parser.add_argument("--dry-run", action="store_true", help="drop: only list partitions")
+
+    def handle(self, *args, **options):
+        action = options["action"]
+        for table in options["table"] or list(PARTITIONED_TABLES):
+            if action == "convert":
+                created = convert_to_partitioned(
+                    table, months_ahead=options["months_ahead"], keep_legacy=options["keep_legacy"]
+                )
+                if created:
+                    self.stdout.write(self.style.SUCCESS(f"{table}: partitioned into {len(created)} monthly partitions"))
+                else:
+                    self.stdout.write(f"{table}: already partitioned")
+                continue
+
+            if not is_partitioned(table):
+                self.stdout.write(f"{table}: not partitioned (run 'convert' first)")
+                continue
+
+            if action == "list":
+                for p in list_partitions(table):
+                    self.stdout.write(f"{table}: {p.name} [{p.start} .. {p.end})")
+            elif action == "ensure":
+                created = ensure_partitions(table, months_ahead=options["months_ahead"])
+                self.stdout.write(f"{table}: created {', '.join(created) or 'nothing'}")
+            elif action == "drop":
+                if not options["before"]:
+                    raise CommandError("drop requires --before YYYY-MM-DD")
+                cutoff = timezone.make_aware(datetime.combine(datetime.fromisoformat(options["before"]).date(), time.min))
+                dropped = drop_partitions_before(
+                    table,
+                    cutoff,
+                    keep=kept_partition_months(table, cutoff),
+                    concurrently=not options["no_concurrently"],
+                    dry_run=options["dry_run"],
+                )
+                verb = "would drop" if options["dry_run"] else "dropped"
+                self.stdout.write(f"{table}: {verb} {', '.join(p.name for p in dropped) or 'nothing'}")
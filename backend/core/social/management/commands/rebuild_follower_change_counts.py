@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from core.social.follower_changes import rebuild_daily_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute follower_change_daily_counts from follower_changes (backfill / repair)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--account", action="append", help="SocialAccount UUID (repeatable); default: all accounts")
+
+    def handle(self, *args, **options):
+        written = rebuild_daily_counts(options["account"])
+        self.stdout.write(self.style.SUCCESS(f"follower_change_daily_counts rebuilt ({written} rows)"))
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from core.social.latest_metrics import rebuild_latest_metrics
+
+
+class Command(BaseCommand):
+    help = "Recompute the latest_metrics table from metrics_snapshots (backfill / repair)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--account", action="append", help="SocialAccount UUID (repeatable); default: all accounts")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_latest_metrics(options["account"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"latest_metrics rebuilt for {written} accounts"))
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import heapq
+import random
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from itertools import count
+
+from django.core.management.base import BaseCommand
+
+from core.celery_queues import (
+    BULK,
+    DEFAULT_QUEUE,
+    METRICS,
+    PLATFORMS,
+    REALTIME,
+    platform_queue,
+    queue_for,
+)
+
+METRICS_BATCH_TASK = "core.social.tasks.sync_accounts_metrics_batch"
+CHUNK_TASK = "core.social.tasks.run_account_chunk"
+AUTOMATION_TASK = "core.automations.tasks.trigger_automation"
+METRICS_INTERVAL = 900
+
+
+@dataclass
+class _Message:
+    kind: str
+    platform: str
+    queue: str
+    ready: float
+    service: float
+
+
+class _Worker:
+    def __init__(self, queues):
+        self.queues = queues
+        self.next = 0  # round-robin start, like the redis transport's queue cycling
+
+    def take(self, broker):
+        for i in range(len(self.queues)):
+            queue = self.queues[(self.next + i) % len(self.queues)]
+            if broker[queue]:
+                self.next = (self.next + i + 1) % len(self.queues)
+                return broker[queue].popleft()
+        return None
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate the Celery queue topology with an in-memory broker: latency of the 15-minute "
+        "metrics sync and automation checks while a top content backfill is running, for a single "
+        "shared queue, per-workload queues, and per-workload + per-platform sub-queues."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accounts", type=int, default=4000, help="Active accounts (split evenly per platform)")
+        parser.add_argument("--backfill-accounts", type=int, default=20000, help="Accounts in the top content backfill")
+        parser.add_argument("--hours", type=float, default=2.0)
+        parser.add_argument("--metrics-window", type=float, default=600, help="FANOUT_WINDOWS['metrics'] in seconds")
+        parser.add_argument("--realtime-workers", type=int, default=2)
+        parser.add_argument("--metrics-workers", type=int, default=8)
+        parser.add_argument("--bulk-workers", type=int, default=4)
+        parser.add_argument("--throttled", default="x", help="Platform whose calls are slowed down (empty: none)")
+        parser.add_argument("--throttle-factor", type=float, default=8.0)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'topology':<18}{'metrics p50':>12}{'p95':>8}{'p99':>8}{'max':>8}"
+            f"{'sync run p95':>14}{'automation p99':>16}"
+        )
+        for topology in ("shared", "per-class", "per-platform"):
+            metrics_waits, run_spans, realtime_waits, per_platform = self._simulate(topology, options)
+            self.stdout.write(
+                f"{topology:<18}{_percentile(metrics_waits, 50):12.1f}{_percentile(metrics_waits, 95):8.1f}"
+                f"{_percentile(metrics_waits, 99):8.1f}{max(metrics_waits, default=0):8.1f}"
+                f"{_percentile(run_spans, 95):14.1f}{_percentile(realtime_waits, 99):16.1f}"
+            )
+            self.stdout.write(
+                "  metrics p95 by platform: "
+                + ", ".join(f"{p}={_percentile(w, 95):.1f}s" for p, w in sorted(per_platform.items()))
+            )
+        self.stdout.write("Latencies are seconds from the message being due to its task finishing.")
+
+    def _route(self, topology, task_name, platform):
+        if topology == "shared":
+            return DEFAULT_QUEUE
+        if topology == "per-class":
+            return queue_for(task_name)
+        return queue_for(task_name, platform)
+
+    def _workers(self, topology, options):
+        realtime, metrics, bulk = options["realtime_workers"], options["metrics_workers"], options["bulk_workers"]
+        if topology == "shared":
+            return [_Worker([DEFAULT_QUEUE]) for _ in range(realtime + metrics + bulk)]
+        workers = [_Worker([REALTIME]) for _ in range(realtime)]
+        for workload, n in ((METRICS, metrics), (BULK, bulk)):
+            for i in range(n):
+                if topology == "per-class":
+                    workers.append(_Worker([workload]))
+                else:
+                    # Workers pinned to one platform's sub-queue (-Q metrics.x,metrics), so a
+                    # throttled platform only ties up its own share of the pool.
+                    workers.append(_Worker([platform_queue(workload, PLATFORMS[i % len(PLATFORMS)]), workload]))
+        return workers
+
+    def _messages(self, topology, options, rng):
+        horizon = options["hours"] * 3600
+        per_platform = max(1, options["accounts"] // len(PLATFORMS))
+        throttled, factor = options["throttled"], options["throttle_factor"]
+
+        def slow(platform):
+            return factor if platform == throttled else 1.0
+
+        messages = []
+        # Backfill at t=0: run_account_chunk messages of 50 accounts, ~1.5s of API calls per account.
+        backfill_per_platform = options["backfill_accounts"] // len(PLATFORMS)
+        for platform in PLATFORMS:
+            for _ in range(0, backfill_per_platform, 50):
+                service = 50 * 1.5 * slow(platform) * rng.uniform(0.7, 1.3)
+                messages.append(
+                    _Message("backfill", platform, self._route(topology, CHUNK_TASK, platform), 0.0, service)
+                )
+
+        # Metrics sync every 15 minutes: batches of 200 spread over the fan-out window per platform,
+        # ~4s per batch (200 requests at concurrency 50).
+        run = 0
+        for tick in range(0, int(horizon), METRICS_INTERVAL):
+            batches = -(-per_platform // 200)
+            for platform in PLATFORMS:
+                for i in range(batches):
+                    ready = tick + i * options["metrics_window"] / batches + rng.uniform(0, 5)
+                    service = 4.0 * slow(platform) * rng.uniform(0.7, 1.3)
+                    messages.append(
+                        _Message(
+                            f"metrics:{run}", platform, self._route(topology, METRICS_BATCH_TASK, platform),
+                            ready, service,
+                        )
+                    )
+            run += 1
+
+        # Automation checks every 5 minutes: 200 short trigger checks.
+        for tick in range(0, int(horizon), 300):
+            for _ in range(200):
+                messages.append(
+                    _Message("realtime", "", self._route(topology, AUTOMATION_TASK, None), tick, rng.uniform(0.02, 0.1))
+                )
+        return messages
+
+    def _simulate(self, topology, options):
+        rng = random.Random(options["seed"])
+        messages = self._messages(topology, options, rng)
+        workers = self._workers(topology, options)
+        broker = defaultdict(deque)
+
+        seq = count()
+        events = [(m.ready, next(seq), "ready", m) for m in messages]
+        heapq.heapify(events)
+        idle = list(range(len(workers)))
+
+        metrics_waits, realtime_waits = [], []
+        per_platform = defaultdict(list)
+        run_done = defaultdict(float)  # "metrics:<run>" -> last batch finished
+
+        while events:
+            now, _, kind, payload = heapq.heappop(events)
+            if kind == "ready":
+                broker[payload.queue].append(payload)
+            else:
+                message = payload[1]
+                idle.append(payload[0])
+                latency = now - message.ready
+                if message.kind.startswith("metrics:"):
+                    metrics_waits.append(latency)
+                    per_platform[message.platform].append(latency)
+                    run_done[message.kind] = max(run_done[message.kind], now)
+                elif message.kind == "realtime":
+                    realtime_waits.append(latency)
+
+            still_idle = []
+            for w in idle:
+                message = workers[w].take(broker)
+                if message is None:
+                    still_idle.append(w)
+                else:
+                    heapq.heappush(events, (now + message.service, next(seq), "done", (w, message)))
+            idle = still_idle
+
+        run_spans = [done - int(k.split(":")[1]) * METRICS_INTERVAL for k, done in run_done.items()]
+        return metrics_waits, run_spans, realtime_waits, per_platform
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+
+from core.social.models import SocialAccount
+from core.social.sync_schedule import reschedule
+
+FIXED_INTERVAL = 15 * 60  # the former crontab(minute='*/15') for every account
+
+# Interval buckets for the summary: (upper bound in seconds, label)
+BUCKETS = [(15 * 60, "<=15m"), (60 * 60, "<=1h"), (6 * 60 * 60, "<=6h"), (None, ">6h")]
+
+
+def _bucket(interval: int) -> str:
+    for bound, label in BUCKETS:
+        if bound is None or interval <= bound:
+            return label
+    return BUCKETS[-1][1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the adaptive metrics sync schedule of active accounts (interval distribution, projected "
+        "syncs per day vs a fixed 15-minute crontab); --recompute re-applies tier bounds and posting frequency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--recompute", action="store_true", help="Recompute intervals (tier bounds, posting frequency) and next_sync_at first")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        active = SocialAccount.objects.filter(status=SocialAccount.STATUS_ACTIVE)
+
+        if options["recompute"]:
+            ids = list(active.values_list("id", flat=True))
+            updated = 0
+            for i in range(0, len(ids), options["batch_size"]):
+                updated += reschedule(ids[i:i + options["batch_size"]])
+            self.stdout.write(self.style.SUCCESS(f"Rescheduled {updated} accounts"))
+
+        intervals = list(active.exclude(sync_interval=None).values_list("sync_tier", "sync_interval"))
+        total = active.count()
+        unscheduled = total - len(intervals)
+
+        buckets = Counter((tier, _bucket(interval)) for tier, interval in intervals)
+        labels = [label for _, label in BUCKETS]
+        self.stdout.write(f"{'tier':<10}" + "".join(f"{label:>8}" for label in labels))
+        for tier, _ in SocialAccount.SYNC_TIER_CHOICES:
+            self.stdout.write(f"{tier:<10}" + "".join(f"{buckets[(tier, label)]:>8}" for label in labels))
+
+        adaptive = sum(86400 / interval for _, interval in intervals) + unscheduled * 86400 / FIXED_INTERVAL
+        fixed = total * 86400 / FIXED_INTERVAL
+        self.stdout.write(
+            f"accounts: {total} ({unscheduled} not scheduled yet); projected syncs/day: "
+            f"{adaptive:.0f} adaptive vs {fixed:.0f} fixed 15-minute"
+            + (f" ({abs(1 - adaptive / fixed):.1%} {'fewer' if adaptive <= fixed else 'more'})" if fixed else "")
+        )
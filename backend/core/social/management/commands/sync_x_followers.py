@@ -27,5 +27,6 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS(
                 f"X follower sync ok: account={result.account_id} fetched={result.fetched_users} new={result.new_followers} unfollow={result.unfollowers}"
+                f" complete={result.complete} resumed={result.resumed} pages={result.pages_fetched}"
             )
         )
@@ -0,0 +1,191 @@
+"""Concurrent account metrics fetching.
+
+``fetch_metrics`` fetches metrics for many accounts concurrently inside one
+worker (asyncio + httpx), with a concurrency cap per platform so one slow or
+throttled platform cannot take every connection. It is used by
+core.social.tasks.sync_accounts_metrics_batch, which then writes all
+snapshots with a single bulk_create.
+
+Platforms with a bulk lookup endpoint (``BulkMetricsMixin`` adapters, e.g. X
+``GET /2/users?ids=``) are fetched up to that many accounts per request,
+using the token of one account in the group; a failed bulk request falls
+back to per-account calls.
+
+Calls go through the shared rate governor and retry connection errors,
+timeouts and 429/5xx responses with the same jittered backoff and
+MAX_RETRY_WAIT as PlatformClient.request; accounts whose budget is exhausted
+come back with ``retry_after`` set so the task can requeue them for exactly
+that delay.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from core.social.models import SocialAccount
+from core.social.platforms import CLIENTS, BulkMetricsMixin, PlatformAPIError, get_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = {
+    SocialAccount.PLATFORM_INSTAGRAM: 50,
+    SocialAccount.PLATFORM_TIKTOK: 50,
+    SocialAccount.PLATFORM_LINKEDIN: 50,
+    SocialAccount.PLATFORM_X: 50,
+}
+
+# Negotiate HTTP/2 when the optional ``h2`` package is installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class MetricsRequest:
+    account_id: str
+    platform: str
+    platform_user_id: str
+    access_token: str
+
+
+@dataclass
+class MetricsResult:
+    account_id: str
+    metrics: Optional[Dict[str, int]]
+    error: str = ""
+    retry_after: Optional[float] = None
+
+
+async def _get(client: httpx.AsyncClient, adapter, call) -> Dict[str, Any]:
+    # Same retry/backoff as PlatformClient.request, without blocking the event loop.
+    attempt = 0
+    while True:
+        await asyncio.to_thread(adapter.throttle, call.path)
+        try:
+            response = await client.get(adapter.url(call.path), params=call.params, headers=adapter.headers())
+        except httpx.TransportError as e:
+            delay = adapter.retry_delay(attempt)
+            if delay is None:
+                raise PlatformAPIError(adapter.platform, f"{adapter.platform} request failed: {e}") from e
+        else:
+            adapter.observe(response.headers, response.status_code, call.path)
+            if response.status_code < 400:
+                return response.json()
+            error = adapter.error_from_response(response)
+            delay = adapter.retry_delay(attempt, error)
+            if delay is None:
+                raise error
+
+        logger.warning(
+            f"{adapter.platform} GET {call.path} failed (attempt {attempt + 1}), retrying in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _fetch_one(
+    client: httpx.AsyncClient, req: MetricsRequest, base_urls: Dict[str, str]
+) -> Dict[str, int]:
+    # The platform adapter describes the calls and parses the responses;
+    # only the transport differs from PlatformClient.fetch_account_metrics.
+    adapter = get_client(req.platform, req.access_token, base_url=base_urls.get(req.platform))
+    calls = adapter.account_metrics_calls(req.platform_user_id)
+    responses = await asyncio.gather(*(_get(client, adapter, call) for call in calls))
+    return adapter.parse_account_metrics(list(responses)).as_dict()
+
+
+def _bulk_groups(requests: List[MetricsRequest]) -> Tuple[List[List[MetricsRequest]], List[MetricsRequest]]:
+    """Split ``requests`` into bulk lookup groups and the requests fetched one by one."""
+    by_platform: Dict[str, List[MetricsRequest]] = defaultdict(list)
+    single = []
+    for req in requests:
+        client_cls = CLIENTS.get(req.platform)
+        if client_cls is not None and issubclass(client_cls, BulkMetricsMixin):
+            by_platform[req.platform].append(req)
+        else:
+            single.append(req)
+    groups = []
+    for platform, reqs in by_platform.items():
+        size = CLIENTS[platform].BULK_METRICS_MAX
+        groups.extend(reqs[i:i + size] for i in range(0, len(reqs), size))
+    return groups, single
+
+
+async def fetch_metrics_async(
+    requests: List[MetricsRequest],
+    *,
+    concurrency: Optional[Dict[str, int]] = None,
+    timeout: float = 10,
+    base_urls: Optional[Dict[str, str]] = None,
+    bulk: bool = True,
+) -> List[MetricsResult]:
+    """Fetch metrics for ``requests``; ``base_urls`` overrides adapter BASE_URLs (tests/benchmarks).
+
+    ``bulk=False`` disables the bulk lookup endpoints.
+    """
+    caps = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+    urls = base_urls or {}
+    semaphores = {platform: asyncio.Semaphore(max(1, cap)) for platform, cap in caps.items()}
+    limits = httpx.Limits(max_connections=sum(caps.values()), max_keepalive_connections=sum(caps.values()))
+
+    async with httpx.AsyncClient(timeout=timeout, limits=limits, http2=HTTP2_AVAILABLE) as client:
+
+        async def run(req: MetricsRequest) -> MetricsResult:
+            semaphore = semaphores.get(req.platform) or asyncio.Semaphore(1)
+            async with semaphore:
+                try:
+                    return MetricsResult(req.account_id, await _fetch_one(client, req, urls))
+                except PlatformAPIError as e:
+                    if e.rate_limited:
+                        return MetricsResult(req.account_id, None, str(e), retry_after=e.retry_after or 60)
+                    logger.error(f"Failed to fetch metrics for account {req.account_id}: {e}")
+                    return MetricsResult(req.account_id, None, str(e))
+                except Exception as e:
+                    logger.error(f"Failed to fetch metrics for account {req.account_id}: {e}")
+                    return MetricsResult(req.account_id, None, str(e))
+
+        async def run_bulk(group: List[MetricsRequest]) -> List[MetricsResult]:
+            platform = group[0].platform
+            adapter = get_client(platform, group[0].access_token, base_url=urls.get(platform))
+            call = adapter.bulk_account_metrics_call([req.platform_user_id for req in group])
+            async with semaphores.get(platform) or asyncio.Semaphore(1):
+                try:
+                    metrics = adapter.parse_bulk_account_metrics(await _get(client, adapter, call))
+                except PlatformAPIError as e:
+                    if e.rate_limited:
+                        return [MetricsResult(r.account_id, None, str(e), retry_after=e.retry_after or 60) for r in group]
+                    metrics = None
+                    error = e
+                except Exception as e:
+                    metrics = None
+                    error = e
+            if metrics is None:
+                logger.error(f"Bulk {platform} metrics lookup failed for {len(group)} accounts, fetching one by one: {error}")
+                return list(await asyncio.gather(*(run(req) for req in group)))
+
+            results = []
+            for req in group:
+                found = metrics.get(req.platform_user_id)
+                if found is None:
+                    logger.error(f"Metrics for account {req.account_id} missing from bulk {platform} lookup")
+                    results.append(MetricsResult(req.account_id, None, "missing from bulk lookup"))
+                else:
+                    results.append(MetricsResult(req.account_id, found.as_dict()))
+            return results
+
+        groups, single = _bulk_groups(requests) if bulk else ([], requests)
+        batches = await asyncio.gather(
+            asyncio.gather(*(run(req) for req in single)),
+            *(run_bulk(group) for group in groups),
+        )
+        return [result for batch in batches for result in batch]
+
+
+def fetch_metrics(requests: List[MetricsRequest], **kwargs) -> List[MetricsResult]:
+    """Synchronous entry point (Celery tasks) for fetch_metrics_async."""
+    return asyncio.run(fetch_metrics_async(requests, **kwargs))
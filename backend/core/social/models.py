@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.utils import timezone
 from core.workspaces.models import Workspace
 
 
@@ -26,6 +27,17 @@ class SocialAccount(models.Model):
         (STATUS_DISCONNECTED, "Disconnected"),
     ]
 
+    # Plan tier: bounds of the adaptive metrics sync interval (core.social.sync_schedule)
+    SYNC_TIER_PRIORITY = "priority"
+    SYNC_TIER_STANDARD = "standard"
+    SYNC_TIER_ECONOMY = "economy"
+
+    SYNC_TIER_CHOICES = [
+        (SYNC_TIER_PRIORITY, "Priority"),
+        (SYNC_TIER_STANDARD, "Standard"),
+        (SYNC_TIER_ECONOMY, "Economy"),
+    ]
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     workspace = models.ForeignKey(Workspace, on_delete=models.CASCADE, related_name="social_accounts")
     platform = models.CharField(max_length=32, choices=PLATFORM_CHOICES)
@@ -49,9 +61,24 @@ class SocialAccount(models.Model):
     identity_unfollowers_last_run_at = models.DateTimeField(null=True, blank=True)
     identity_unfollowers_last_error = models.TextField(blank=True, default="")
 
+    # Adaptive metrics sync
+    sync_tier = models.CharField(max_length=16, choices=SYNC_TIER_CHOICES, default=SYNC_TIER_STANDARD)
+    next_sync_at = models.DateTimeField(default=timezone.now, help_text="When the metrics sync is next due")
+    sync_interval = models.IntegerField(
+        null=True, blank=True, help_text="Seconds between metrics syncs last chosen by the scheduler"
+    )
+    sync_base_interval = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text="Interval learned from sync outcomes (shrinks on change, grows on no change), before posting frequency",
+    )
+
     class Meta:
         db_table = "social_accounts"
         unique_together = ("workspace", "platform", "handle")
+        indexes = [
+            models.Index(fields=["status", "next_sync_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.platform}:{self.handle}"
@@ -89,6 +116,11 @@ class MetricsSnapshot(models.Model):
     # Platform-specific
     extra_data = models.JSONField(default=dict, blank=True, help_text="Platform-specific metrics")
 
+    # Snapshots are only written when a value changes (core.social.latest_metrics);
+    # the values held from timestamp through valid_until. Set when the row is
+    # superseded: null on the newest row (see LatestMetrics) and legacy rows.
+    valid_until = models.DateTimeField(null=True, blank=True, help_text="Last sync that saw these values")
+
     class Meta:
         db_table = "metrics_snapshots"
         ordering = ["-timestamp"]
@@ -97,6 +129,96 @@ class MetricsSnapshot(models.Model):
         ]
 
 
+class LatestMetrics(models.Model):
+    """Latest MetricsSnapshot values per account (one row per SocialAccount).
+
+    Maintained on every snapshot write (core.social.latest_metrics) so the
+    dashboard reads current metrics for a whole workspace in one query.
+    """
+    social_account = models.OneToOneField(
+        SocialAccount, on_delete=models.CASCADE, primary_key=True, related_name="latest_metrics"
+    )
+    snapshot_id = models.UUIDField()
+    timestamp = models.DateTimeField()
+    valid_until = models.DateTimeField(null=True, help_text="Last sync that confirmed these values")
+
+    followers_count = models.IntegerField(default=0)
+    following_count = models.IntegerField(default=0)
+    posts_count = models.IntegerField(default=0)
+    reach = models.IntegerField(default=0)
+    impressions = models.IntegerField(default=0)
+    engagement_count = models.IntegerField(default=0)
+    profile_views = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "latest_metrics"
+
+
+class MetricsRollup(models.Model):
+    """Hourly/daily/weekly aggregates of MetricsSnapshot per account.
+
+    Per metric: min, max, last value in the bucket and sum (avg = sum / samples).
+    Maintained incrementally by core.social.rollups.
+    """
+    GRANULARITY_HOUR = "hour"
+    GRANULARITY_DAY = "day"
+    GRANULARITY_WEEK = "week"
+
+    GRANULARITY_CHOICES = [
+        (GRANULARITY_HOUR, "Hour"),
+        (GRANULARITY_DAY, "Day"),
+        (GRANULARITY_WEEK, "Week"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    social_account = models.ForeignKey(SocialAccount, on_delete=models.CASCADE, related_name="metrics_rollups")
+    granularity = models.CharField(max_length=8, choices=GRANULARITY_CHOICES)
+    bucket_start = models.DateTimeField()
+    samples = models.IntegerField(default=0)
+    last_at = models.DateTimeField(help_text="Timestamp of the snapshot providing *_last")
+
+    followers_count_min = models.IntegerField(default=0)
+    followers_count_max = models.IntegerField(default=0)
+    followers_count_last = models.IntegerField(default=0)
+    followers_count_sum = models.BigIntegerField(default=0)
+
+    reach_min = models.IntegerField(default=0)
+    reach_max = models.IntegerField(default=0)
+    reach_last = models.IntegerField(default=0)
+    reach_sum = models.BigIntegerField(default=0)
+
+    impressions_min = models.IntegerField(default=0)
+    impressions_max = models.IntegerField(default=0)
+    impressions_last = models.IntegerField(default=0)
+    impressions_sum = models.BigIntegerField(default=0)
+
+    engagement_count_min = models.IntegerField(default=0)
+    engagement_count_max = models.IntegerField(default=0)
+    engagement_count_last = models.IntegerField(default=0)
+    engagement_count_sum = models.BigIntegerField(default=0)
+
+    profile_views_min = models.IntegerField(default=0)
+    profile_views_max = models.IntegerField(default=0)
+    profile_views_last = models.IntegerField(default=0)
+    profile_views_sum = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "metrics_rollups"
+        ordering = ["bucket_start"]
+        unique_together = ("social_account", "granularity", "bucket_start")
+
+
+class MetricsRollupWatermark(models.Model):
+    """Position (timestamp, id) of the last MetricsSnapshot folded into the rollups."""
+    name = models.CharField(max_length=64, primary_key=True)
+    snapshot_timestamp = models.DateTimeField()
+    snapshot_id = models.UUIDField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "metrics_rollup_watermarks"
+
+
 class FollowerChange(models.Model):
     """Track individual follower/following changes for detailed analysis."""
     TYPE_NEW_FOLLOWER = "new_follower"
@@ -133,6 +255,84 @@ class FollowerChange(models.Model):
         ]
 
 
+class FollowerChangeDailyCount(models.Model):
+    """FollowerChange rows per account, UTC day and change_type.
+
+    Incremented in the transaction that bulk-creates the rows
+    (core.social.follower_changes), so timeframe totals are a sum over a few
+    small rows instead of a count over follower_changes.
+    """
+    id = models.BigAutoField(primary_key=True)
+    social_account = models.ForeignKey(
+        SocialAccount, on_delete=models.CASCADE, related_name="follower_change_counts"
+    )
+    day = models.DateField()
+    change_type = models.CharField(max_length=32, choices=FollowerChange.TYPE_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "follower_change_daily_counts"
+        ordering = ["day"]
+        unique_together = ("social_account", "day", "change_type")
+
+
+class FollowerSnapshot(models.Model):
+    """Versioned follower ID set per account (identity-level follower sync).
+
+    IDs are stored sorted and delta-encoded (see core.social.follower_diff),
+    so a 5M follower list takes a few MB and old versions are cheap to keep.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    social_account = models.ForeignKey(SocialAccount, on_delete=models.CASCADE, related_name="follower_snapshots")
+    version = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    follower_count = models.IntegerField(default=0)
+    encoding = models.CharField(max_length=32)
+    data = models.BinaryField()
+
+    class Meta:
+        db_table = "follower_snapshots"
+        ordering = ["-version"]
+        unique_together = ("social_account", "version")
+
+
+class FollowerSyncCheckpoint(models.Model):
+    """Partial follower snapshot for a sync that has not finished paginating.
+
+    Saved after every page so a run interrupted by a rate limit (or stopped by
+    identity_unfollowers_max_pages) resumes from ``next_token`` instead of page
+    one. Unfollowers are only computed once pagination completes.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    social_account = models.OneToOneField(
+        SocialAccount, on_delete=models.CASCADE, related_name="follower_sync_checkpoint"
+    )
+    base_version = models.PositiveIntegerField(default=0, help_text="FollowerSnapshot version being diffed against")
+    next_token = models.CharField(max_length=255, blank=True, default="")
+    pages_fetched = models.IntegerField(default=0)
+    new_followers = models.IntegerField(default=0)
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "follower_sync_checkpoints"
+
+
+class FollowerSyncCheckpointPage(models.Model):
+    """Follower IDs of one fetched page of a checkpointed sync (same encoding as FollowerSnapshot)."""
+    id = models.BigAutoField(primary_key=True)
+    checkpoint = models.ForeignKey(FollowerSyncCheckpoint, on_delete=models.CASCADE, related_name="pages")
+    page_index = models.IntegerField()
+    encoding = models.CharField(max_length=32)
+    data = models.BinaryField()
+
+    class Meta:
+        db_table = "follower_sync_checkpoint_pages"
+        ordering = ["page_index"]
+        unique_together = ("checkpoint", "page_index")
+
+
 class TopContent(models.Model):
     """Track top-performing posts for each account."""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -157,6 +357,12 @@ class TopContent(models.Model):
         db_table = "top_content"
         ordering = ["-engagement_rate"]
         unique_together = ("social_account", "platform_post_id")
+        # One per sort mode of the top_content endpoint (core.social.top_content.SORT_MODES)
+        indexes = [
+            models.Index(fields=["social_account", "-engagement_rate"]),
+            models.Index(fields=["social_account", "-likes_count"]),
+            models.Index(fields=["social_account", "-reach"]),
+        ]
 
 
 class AudienceInsight(models.Model):
@@ -0,0 +1,225 @@
+"""Monthly range partitioning for high-volume time-series tables (Postgres).
+
+metrics_snapshots and follower_changes can be converted to tables
+partitioned by month on ``timestamp`` (``convert_to_partitioned``; one-off,
+run in a maintenance window with ``manage.py partition_time_series convert``).
+Afterwards:
+
+- ``ensure_partitions`` creates the partitions for the coming months
+  (daily Celery beat job, PARTITION_MONTHS_AHEAD);
+- ``drop_partitions_before`` detaches and drops whole months past retention
+  (called by core.social.retention before its batched row deletes).
+
+Partitioning is transparent to the ORM: the primary key becomes
+(id, timestamp) but ids stay unique UUIDs, and nothing references these
+tables by foreign key. Queries prune partitions when they filter on
+``timestamp``, so readers should always pass a time bound.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Collection, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.transaction import TransactionManagementError
+
+PARTITIONED_TABLES = {
+    "metrics_snapshots": "timestamp",
+    "follower_changes": "timestamp",
+}
+DEFAULT_MONTHS_AHEAD = 3
+
+
+@dataclass
+class Partition:
+    name: str
+    start: date
+    end: date
+
+
+def month_start(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, start: date) -> str:
+    return f"{table}_p{start:%Y%m}"
+
+
+def _q(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def is_partitioned(table: str) -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [table])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def list_partitions(table: str) -> List[Partition]:
+    """Monthly partitions of ``table``, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s)
+            """,
+            [table],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        # FOR VALUES FROM ('2026-01-01 00:00:00+00') TO ('2026-02-01 00:00:00+00')
+        try:
+            low, high = [part.split("'")[1] for part in bound.split(" TO ")]
+            partitions.append(Partition(name, date.fromisoformat(low[:10]), date.fromisoformat(high[:10])))
+        except (IndexError, ValueError):
+            continue  # DEFAULT or foreign partition layout
+    return sorted(partitions, key=lambda p: p.start)
+
+
+def create_partition(table: str, start: date) -> str:
+    name = partition_name(table, start)
+    end = add_months(start, 1)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {_q(name)} PARTITION OF {_q(table)} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    return name
+
+
+def ensure_partitions(table: str, months_ahead: Optional[int] = None, today: Optional[date] = None) -> List[str]:
+    """Create partitions from the current month up to ``months_ahead`` months ahead."""
+    if months_ahead is None:
+        months_ahead = int(getattr(settings, "PARTITION_MONTHS_AHEAD", DEFAULT_MONTHS_AHEAD))
+    current = month_start(today or date.today())
+    existing = {p.start for p in list_partitions(table)}
+    created = []
+    for offset in range(months_ahead + 1):
+        start = add_months(current, offset)
+        if start not in existing:
+            created.append(create_partition(table, start))
+    return created
+
+
+def drop_partitions_before(
+    table: str,
+    cutoff: datetime,
+    *,
+    keep: Collection[date] = (),
+    concurrently: bool = True,
+    dry_run: bool = False,
+) -> List[Partition]:
+    """Detach and drop partitions whose whole range is older than ``cutoff``.
+
+    Partitions whose start month is in ``keep`` (they hold rows that must
+    survive retention) are left for the batched deletes.
+
+    ``DETACH ... CONCURRENTLY`` (Postgres 14+) avoids blocking readers and
+    writers of the parent table; it must run outside a transaction.
+    """
+    old = [p for p in list_partitions(table) if p.end <= cutoff.date() and p.start not in keep]
+    if dry_run:
+        return old
+    if concurrently and old and connection.in_atomic_block:
+        raise TransactionManagementError("DETACH PARTITION CONCURRENTLY cannot run inside an atomic block")
+    for partition in old:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {_q(table)} DETACH PARTITION {_q(partition.name)}"
+                f"{' CONCURRENTLY' if concurrently else ''}"
+            )
+            cursor.execute(f"DROP TABLE {_q(partition.name)}")
+    return old
+
+
+def estimated_rows(partitions: List[Partition]) -> int:
+    """Planner row estimates (pg_class.reltuples) for ``partitions``."""
+    if not partitions:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COALESCE(SUM(GREATEST(reltuples, 0)), 0) FROM pg_class WHERE relname = ANY(%s)",
+            [[p.name for p in partitions]],
+        )
+        return int(cursor.fetchone()[0])
+
+
+def convert_to_partitioned(table: str, *, months_ahead: Optional[int] = None, keep_legacy: bool = False) -> List[str]:
+    """Rebuild ``table`` as a monthly-partitioned table with the same columns, indexes and FKs.
+
+    Runs in one transaction: the table is locked for the duration of the
+    copy, so run it in a maintenance window. With ``keep_legacy`` the old
+    heap stays as ``<table>_unpartitioned``.
+    """
+    column = PARTITIONED_TABLES[table]
+    legacy = f"{table}_unpartitioned"
+    if months_ahead is None:
+        months_ahead = int(getattr(settings, "PARTITION_MONTHS_AHEAD", DEFAULT_MONTHS_AHEAD))
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        if is_partitioned(table):
+            return []
+
+        cursor.execute(
+            """
+            SELECT c.conname, pg_get_constraintdef(c.oid)
+            FROM pg_constraint c WHERE c.conrelid = to_regclass(%s) AND c.contype = 'f'
+            """,
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT i.relname, pg_get_indexdef(i.oid)
+            FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid
+            WHERE x.indrelid = to_regclass(%s) AND NOT x.indisprimary
+            """,
+            [table],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(f"SELECT MIN({_q(column)}) FROM {_q(table)}")
+        oldest = cursor.fetchone()[0]
+
+        # Free the index names for the new table.
+        cursor.execute(f"ALTER TABLE {_q(table)} RENAME TO {_q(legacy)}")
+        for name, _ in indexes:
+            cursor.execute(f"ALTER INDEX {_q(name)} RENAME TO {_q(name[:50] + '_unpart')}")
+
+        cursor.execute(
+            f"CREATE TABLE {_q(table)} (LIKE {_q(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({_q(column)})"
+        )
+        cursor.execute(f"ALTER TABLE {_q(table)} ADD PRIMARY KEY (id, {_q(column)})")
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {_q(table)} ADD CONSTRAINT {_q(name)} {definition}")
+        for name, definition in indexes:
+            on_table = definition.split(" USING ", 1)[1]
+            unique = "UNIQUE " if definition.startswith("CREATE UNIQUE") else ""
+            cursor.execute(f"CREATE {unique}INDEX {_q(name)} ON {_q(table)} USING {on_table}")
+
+        created = []
+        start = month_start(oldest) if oldest else month_start(date.today())
+        end = add_months(month_start(date.today()), months_ahead)
+        while start <= end:
+            created.append(create_partition(table, start))
+            start = add_months(start, 1)
+
+        cursor.execute(f"INSERT INTO {_q(table)} SELECT * FROM {_q(legacy)}")
+        if not keep_legacy:
+            cursor.execute(f"DROP TABLE {_q(legacy)}")
+
+    return created
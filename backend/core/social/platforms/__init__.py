@@ -0,0 +1,45 @@
+"""Platform API clients.
+
+One adapter per platform, all built on PlatformClient (shared connection
+pool, timeouts, retry/backoff, pagination) and returning typed records.
+Use ``get_client(account.platform, token)`` rather than importing adapters
+directly.
+"""
+
+from core.social.platforms.base import ApiCall, BulkMetricsMixin, PlatformAPIError, PlatformClient
+from core.social.platforms.instagram import InstagramClient
+from core.social.platforms.linkedin import LinkedInClient
+from core.social.platforms.records import AccountMetrics, PostMetrics
+from core.social.platforms.tiktok import TikTokClient
+from core.social.platforms.x import XClient
+
+CLIENTS = {
+    InstagramClient.platform: InstagramClient,
+    TikTokClient.platform: TikTokClient,
+    LinkedInClient.platform: LinkedInClient,
+    XClient.platform: XClient,
+}
+
+
+def get_client(platform: str, access_token: str, **kwargs) -> PlatformClient:
+    try:
+        client_cls = CLIENTS[platform]
+    except KeyError:
+        raise ValueError(f"Unknown platform: {platform}")
+    return client_cls(access_token, **kwargs)
+
+
+__all__ = [
+    "AccountMetrics",
+    "ApiCall",
+    "BulkMetricsMixin",
+    "CLIENTS",
+    "InstagramClient",
+    "LinkedInClient",
+    "PlatformAPIError",
+    "PlatformClient",
+    "PostMetrics",
+    "TikTokClient",
+    "XClient",
+    "get_client",
+]
@@ -0,0 +1,259 @@
+"""Common HTTP behaviour for platform clients.
+
+Adapters subclass PlatformClient and implement its abstract methods, which
+describe endpoints and normalize responses. Timeouts, retry/backoff, error
+handling, pagination, the shared connection pool (core.social.http_pool) and
+the distributed rate governor (core.social.rate_governor) live here.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import requests
+
+from core.social.http_pool import bearer, get_session
+from core.social.platforms.records import AccountMetrics
+from core.social.rate_governor import governor
+
+logger = logging.getLogger(__name__)
+
+
+class PlatformAPIError(RuntimeError):
+    """Non-retryable (or retries exhausted) platform API failure."""
+
+    def __init__(
+        self,
+        platform: str,
+        message: str,
+        *,
+        status_code: Optional[int] = None,
+        payload: Any = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.platform = platform
+        self.status_code = status_code
+        self.payload = payload
+        self.retry_after = retry_after
+
+    @property
+    def rate_limited(self) -> bool:
+        return self.status_code == 429
+
+
+@dataclass(frozen=True)
+class ApiCall:
+    """One GET request, relative to the client's BASE_URL."""
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+class PlatformClient(ABC):
+    platform = ""
+    BASE_URL = ""
+
+    TIMEOUT = 10
+    MAX_RETRIES = 3
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 8.0
+    # Rate limit waits longer than this are surfaced to the caller (Celery
+    # retry) instead of blocking the worker.
+    MAX_RETRY_WAIT = 10.0
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        access_token: str,
+        *,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self.access_token = access_token
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = timeout if timeout is not None else self.TIMEOUT
+        self.max_retries = max_retries if max_retries is not None else self.MAX_RETRIES
+        self.session = get_session()
+
+    def headers(self) -> Dict[str, str]:
+        return bearer(self.access_token)
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    # -- transport -------------------------------------------------------
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        # Retry-After (seconds), else X's x-rate-limit-reset (epoch seconds).
+        value = response.headers.get("Retry-After")
+        reset = response.headers.get("x-rate-limit-reset")
+        try:
+            if value is not None:
+                return float(value)
+            if reset is not None and response.status_code == 429:
+                return max(1.0, float(reset) - time.time())
+        except ValueError:
+            pass
+        return None
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.BACKOFF_MAX, self.BACKOFF_BASE * (2 ** attempt)) * (0.5 + random.random() / 2)
+
+    def retry_delay(self, attempt: int, error: Optional[PlatformAPIError] = None) -> Optional[float]:
+        """Seconds to wait before retrying after failed ``attempt`` (0-based), or None to give up.
+
+        ``error`` is the HTTP error response; None means a connection error
+        or timeout. Shared by request() and the async batch fetch
+        (core.social.metrics_fetch), so both retry the same way.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if error is None:
+            return self._backoff(attempt)
+        if error.status_code not in self.RETRY_STATUSES:
+            return None
+        delay = error.retry_after if error.retry_after is not None else self._backoff(attempt)
+        return delay if delay <= self.MAX_RETRY_WAIT else None
+
+    def throttle(self, path: Optional[str] = None) -> None:
+        """Wait for rate governor budget before a call to ``path``.
+
+        Short waits block; longer ones raise a rate-limited PlatformAPIError
+        whose ``retry_after`` is the exact delay, for the Celery task to retry.
+        """
+        while True:
+            wait = governor.acquire(self.platform, self.access_token, endpoint=path)
+            if wait <= 0:
+                return
+            if wait > self.MAX_RETRY_WAIT:
+                raise PlatformAPIError(
+                    self.platform,
+                    f"{self.platform} rate budget exhausted, retry in {wait:.0f}s",
+                    status_code=429,
+                    retry_after=wait,
+                )
+            time.sleep(wait)
+
+    def observe(self, headers, status_code: int, path: Optional[str] = None) -> None:
+        """Feed the rate limit headers of a response to ``path`` back to the governor."""
+        governor.observe(self.platform, self.access_token, headers, status_code, endpoint=path)
+
+    def error_from_response(self, response: requests.Response) -> PlatformAPIError:
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {"text": response.text}
+        if response.status_code == 429:
+            message = f"{self.platform} rate limit exceeded (HTTP 429)"
+        else:
+            message = f"{self.platform} API error {response.status_code}: {payload}"
+        return PlatformAPIError(
+            self.platform,
+            message,
+            status_code=response.status_code,
+            payload=payload,
+            retry_after=self._retry_after(response),
+        )
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+    ) -> Dict[str, Any]:
+        """Send a request with retry/backoff; returns the decoded JSON body."""
+        url = self.url(path)
+        attempt = 0
+        while True:
+            self.throttle(path)
+            try:
+                response = self.session.request(
+                    method, url, params=params, json=json, headers=self.headers(), timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self.retry_delay(attempt)
+                if delay is None:
+                    raise PlatformAPIError(self.platform, f"{self.platform} request failed: {e}") from e
+            else:
+                self.observe(response.headers, response.status_code, path)
+                if response.status_code < 400:
+                    return response.json() if response.content else {}
+                error = self.error_from_response(response)
+                delay = self.retry_delay(attempt, error)
+                if delay is None:
+                    raise error
+
+            logger.warning(f"{self.platform} {method} {path} failed (attempt {attempt + 1}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.request("GET", path, params=params)
+
+    def post(self, path: str, json: Any = None, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.request("POST", path, params=params, json=json)
+
+    def call(self, api_call: ApiCall) -> Dict[str, Any]:
+        return self.get(api_call.path, api_call.params)
+
+    def paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        items: Callable[[Dict[str, Any]], List[Any]],
+        next_params: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+        max_pages: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Yield items across pages.
+
+        ``items`` extracts the page's items from a response; ``next_params``
+        returns the params to add for the next page (cursor), or None when done.
+        """
+        page_params = dict(params or {})
+        pages = 0
+        while True:
+            data = self.get(path, page_params)
+            yield from items(data)
+            pages += 1
+            cursor = next_params(data)
+            if not cursor or (max_pages is not None and pages >= max_pages):
+                return
+            page_params = {**page_params, **cursor}
+
+    # -- normalized operations -------------------------------------------
+
+    @abstractmethod
+    def account_metrics_calls(self, platform_user_id: str) -> List[ApiCall]:
+        """Requests needed for fetch_account_metrics (shared with the async batch fetcher)."""
+
+    @abstractmethod
+    def parse_account_metrics(self, responses: List[Dict[str, Any]]) -> AccountMetrics:
+        """Build AccountMetrics from the responses of account_metrics_calls, in order."""
+
+    def fetch_account_metrics(self, platform_user_id: str) -> AccountMetrics:
+        responses = [self.call(c) for c in self.account_metrics_calls(platform_user_id)]
+        return self.parse_account_metrics(responses)
+
+
+class BulkMetricsMixin(ABC):
+    """For adapters of platforms with a bulk user lookup (core.social.metrics_fetch groups their accounts)."""
+
+    # Max users per bulk_account_metrics_call.
+    BULK_METRICS_MAX: int
+
+    @abstractmethod
+    def bulk_account_metrics_call(self, platform_user_ids: List[str]) -> ApiCall:
+        """One request returning metrics for up to BULK_METRICS_MAX users."""
+
+    @abstractmethod
+    def parse_bulk_account_metrics(self, response: Dict[str, Any]) -> Dict[str, AccountMetrics]:
+        """{platform_user_id: AccountMetrics} for the users present in a bulk response."""
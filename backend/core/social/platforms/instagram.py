@@ -0,0 +1,166 @@
+"""Instagram Graph API (business/creator accounts via Facebook Login)."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from core.social.models import SocialAccount
+from core.social.platforms.base import ApiCall, PlatformAPIError, PlatformClient
+from core.social.platforms.records import AccountMetrics, PostMetrics, engagement_rate
+
+ACCOUNT_FIELDS = "id,username,media_count,followers_count,follows_count,profile_picture_url"
+MEDIA_FIELDS = "id,caption,media_type,media_url,permalink,timestamp,like_count,comments_count"
+ACCOUNT_INSIGHTS = ("reach", "impressions", "profile_views")
+MEDIA_INSIGHTS = ("reach", "impressions", "engagement", "saved")
+# Media edge with insights expanded inline: one call for a whole page of posts.
+MEDIA_WITH_INSIGHTS_FIELDS = f"{MEDIA_FIELDS},insights.metric({','.join(MEDIA_INSIGHTS)})"
+# Graph API batch requests accept at most 50 operations.
+MAX_BATCH_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
+
+def parse_insights(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize an insights payload into {metric_name: latest value}."""
+    result = {}
+    for item in data.get("data", []):
+        values = item.get("values", [])
+        if values:
+            result[item["name"]] = values[-1].get("value", 0)
+    return result
+
+
+def _next_after(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    paging = data.get("paging") or {}
+    after = (paging.get("cursors") or {}).get("after")
+    return {"after": after} if after and paging.get("next") else None
+
+
+class InstagramClient(PlatformClient):
+    platform = SocialAccount.PLATFORM_INSTAGRAM
+    BASE_URL = "https://graph.facebook.com/v18.0"
+
+    def get_account_info(self, user_id: str) -> Dict[str, Any]:
+        return self.get(user_id, {"fields": ACCOUNT_FIELDS})
+
+    def get_insights(self, user_id: str, metrics: Sequence[str], period: str = "day") -> Dict[str, Any]:
+        data = self.get(f"{user_id}/insights", {"metric": ",".join(metrics), "period": period})
+        return parse_insights(data)
+
+    def get_media(self, user_id: str, limit: int = 25) -> List[Dict[str, Any]]:
+        return self.get(f"{user_id}/media", {"fields": MEDIA_FIELDS, "limit": limit}).get("data", [])
+
+    def iter_media(self, user_id: str, page_size: int = 50, max_pages: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        return self.paginate(
+            f"{user_id}/media",
+            {"fields": MEDIA_FIELDS, "limit": page_size},
+            items=lambda data: data.get("data", []),
+            next_params=_next_after,
+            max_pages=max_pages,
+        )
+
+    def get_media_insights(self, media_id: str, metrics: Sequence[str] = MEDIA_INSIGHTS) -> Dict[str, Any]:
+        return parse_insights(self.get(f"{media_id}/insights", {"metric": ",".join(metrics)}))
+
+    def get_media_with_insights(self, user_id: str, limit: int = 25) -> List[Dict[str, Any]]:
+        """Recent media with their insights (``media["insights"]``) via field expansion."""
+        return self.get(f"{user_id}/media", {"fields": MEDIA_WITH_INSIGHTS_FIELDS, "limit": limit}).get("data", [])
+
+    def get_media_insights_batch(
+        self, media_ids: Sequence[str], metrics: Sequence[str] = MEDIA_INSIGHTS
+    ) -> Dict[str, Dict[str, Any]]:
+        """Insights for many media through Graph API batch requests (50 per call).
+
+        Returns ``{media_id: insights}``; media whose operation failed get ``{}``.
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        metric = ",".join(metrics)
+        for i in range(0, len(media_ids), MAX_BATCH_SIZE):
+            chunk = list(media_ids[i:i + MAX_BATCH_SIZE])
+            batch = [{"method": "GET", "relative_url": f"{media_id}/insights?metric={metric}"} for media_id in chunk]
+            responses = self.post("", json={"batch": batch, "include_headers": False})
+            for media_id, response in zip(chunk, responses or []):
+                if response and response.get("code") == 200:
+                    result[media_id] = parse_insights(json.loads(response.get("body") or "{}"))
+                else:
+                    result[media_id] = {}
+        return result
+
+    def get_audience_insights(self, user_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Audience demographics (city, country, age/gender)."""
+        data = self.get(
+            f"{user_id}/insights",
+            {"metric": "audience_city,audience_country,audience_gender_age", "period": "lifetime"},
+        )
+        result: Dict[str, List[Dict[str, Any]]] = {"cities": [], "countries": [], "age_gender": []}
+        for item in data.get("data", []):
+            name = item["name"]
+            values = item.get("values", [{}])[0].get("value", {})
+            if name == "audience_city":
+                result["cities"] = [{"city": k, "count": v} for k, v in values.items()]
+            elif name == "audience_country":
+                result["countries"] = [{"country": k, "count": v} for k, v in values.items()]
+            elif name == "audience_gender_age":
+                result["age_gender"] = [{"category": k, "count": v} for k, v in values.items()]
+        return result
+
+    def account_metrics_calls(self, platform_user_id: str) -> List[ApiCall]:
+        return [
+            ApiCall(platform_user_id, {"fields": ACCOUNT_FIELDS}),
+            ApiCall(f"{platform_user_id}/insights", {"metric": ",".join(ACCOUNT_INSIGHTS), "period": "day"}),
+        ]
+
+    def parse_account_metrics(self, responses: List[Dict[str, Any]]) -> AccountMetrics:
+        account_info, insights_payload = responses
+        insights = parse_insights(insights_payload)
+        return AccountMetrics(
+            followers=account_info.get("followers_count", 0),
+            following=account_info.get("follows_count", 0),
+            posts=account_info.get("media_count", 0),
+            reach=insights.get("reach", 0),
+            impressions=insights.get("impressions", 0),
+            profile_views=insights.get("profile_views", 0),
+            engagement=0,  # Calculated from posts
+        )
+
+    def post_metrics(self, media: Dict[str, Any], insights: Dict[str, Any]) -> PostMetrics:
+        likes = media.get("like_count", 0)
+        comments = media.get("comments_count", 0)
+        reach = insights.get("reach", 1)
+        return PostMetrics(
+            platform_post_id=media["id"],
+            post_url=media["permalink"],
+            caption=media.get("caption", ""),
+            media_type=media["media_type"].lower(),
+            likes=likes,
+            comments=comments,
+            shares=0,  # Instagram doesn't expose shares
+            saves=insights.get("saved", 0),
+            reach=reach,
+            engagement_rate=engagement_rate(likes + comments, reach),
+            posted_at=media["timestamp"],
+        )
+
+    def recent_posts(self, user_id: str, limit: int = 50) -> List[PostMetrics]:
+        """Recent posts with insights in one call (two with the batch fallback).
+
+        Field expansion fails as a whole when one media does not support a
+        metric (e.g. media older than the business account conversion); the
+        fallback lists media and fetches insights with a batch request, where
+        failures are per media.
+        """
+        try:
+            return [
+                self.post_metrics(media, parse_insights(media.get("insights") or {}))
+                for media in self.get_media_with_insights(user_id, limit=limit)
+            ]
+        except PlatformAPIError as e:
+            if e.status_code != 400:
+                raise
+            logger.warning(f"Instagram insights expansion failed for {user_id}, using batch requests: {e}")
+
+        media_items = self.get_media(user_id, limit=limit)
+        insights = self.get_media_insights_batch([media["id"] for media in media_items])
+        return [self.post_metrics(media, insights.get(media["id"], {})) for media in media_items]
@@ -0,0 +1,36 @@
+"""LinkedIn v2 API."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from core.social.models import SocialAccount
+from core.social.platforms.base import ApiCall, PlatformClient
+from core.social.platforms.records import AccountMetrics
+
+
+class LinkedInClient(PlatformClient):
+    platform = SocialAccount.PLATFORM_LINKEDIN
+    BASE_URL = "https://api.linkedin.com/v2"
+
+    def headers(self) -> Dict[str, str]:
+        return {**super().headers(), "Content-Type": "application/json"}
+
+    def get_profile(self) -> Dict[str, Any]:
+        return self.get("me")
+
+    def get_organization_followers(self, org_id: str) -> Dict[str, Any]:
+        return self.get(f"networkSizes/{org_id}", {"edgeType": "CompanyFollowedByMember"})
+
+    def get_share_statistics(self, share_urn: str) -> Dict[str, Any]:
+        return self.get(
+            "organizationalEntityShareStatistics",
+            {"q": "organizationalEntity", "organizationalEntity": share_urn},
+        )
+
+    def account_metrics_calls(self, platform_user_id: str) -> List[ApiCall]:
+        # Member profiles expose no metrics; follower counts require additional permissions.
+        return []
+
+    def parse_account_metrics(self, responses: List[Dict[str, Any]]) -> AccountMetrics:
+        return AccountMetrics()
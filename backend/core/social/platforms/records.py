@@ -0,0 +1,60 @@
+"""Typed records returned by platform clients.
+
+Every adapter normalizes its raw API responses into these records, so tasks
+and views never depend on platform-specific field names.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+
+
+@dataclass
+class AccountMetrics:
+    """Account-level metrics, mapped 1:1 onto MetricsSnapshot."""
+    followers: int = 0
+    following: int = 0
+    posts: int = 0
+    reach: int = 0
+    impressions: int = 0
+    profile_views: int = 0
+    engagement: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class PostMetrics:
+    """Performance of a single post, mapped 1:1 onto TopContent."""
+    platform_post_id: str
+    post_url: str
+    caption: str
+    media_type: str
+    likes: int
+    comments: int
+    shares: int
+    saves: int
+    reach: int
+    engagement_rate: float
+    posted_at: Any
+
+    def top_content_defaults(self) -> Dict[str, Any]:
+        return {
+            "post_url": self.post_url,
+            "caption": self.caption,
+            "media_type": self.media_type,
+            "likes_count": self.likes,
+            "comments_count": self.comments,
+            "shares_count": self.shares,
+            "saves_count": self.saves,
+            "reach": self.reach,
+            "engagement_rate": self.engagement_rate,
+            "posted_at": self.posted_at,
+        }
+
+
+def engagement_rate(engagement: int, reach: int) -> float:
+    """Engagement as a percentage of reach (0 when reach is unknown)."""
+    return (engagement / reach * 100) if reach > 0 else 0
@@ -0,0 +1,47 @@
+"""TikTok Open API v2."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from core.social.models import SocialAccount
+from core.social.platforms.base import ApiCall, PlatformClient
+from core.social.platforms.records import AccountMetrics
+
+USER_FIELDS = "open_id,union_id,avatar_url,display_name,follower_count,following_count,video_count"
+VIDEO_FIELDS = "id,title,create_time,cover_image_url,share_url,view_count,like_count,comment_count,share_count"
+
+
+class TikTokClient(PlatformClient):
+    platform = SocialAccount.PLATFORM_TIKTOK
+    BASE_URL = "https://open.tiktokapis.com/v2"
+
+    def headers(self) -> Dict[str, str]:
+        return {**super().headers(), "Content-Type": "application/json"}
+
+    def get_user_info(self) -> Dict[str, Any]:
+        return self.get("user/info/", {"fields": USER_FIELDS}).get("data", {}).get("user", {})
+
+    def get_video_list(self, max_count: int = 20) -> List[Dict[str, Any]]:
+        data = self.post("video/list/", json={"max_count": max_count}, params={"fields": VIDEO_FIELDS})
+        return data.get("data", {}).get("videos", [])
+
+    def get_video_insights(self, video_id: str) -> Dict[str, Any]:
+        """Stats for one video (may require creator permissions)."""
+        data = self.post(
+            "video/query/", json={"filters": {"video_ids": [video_id]}}, params={"fields": VIDEO_FIELDS}
+        )
+        videos = data.get("data", {}).get("videos", [])
+        return videos[0] if videos else {}
+
+    def account_metrics_calls(self, platform_user_id: str) -> List[ApiCall]:
+        return [ApiCall("user/info/", {"fields": USER_FIELDS})]
+
+    def parse_account_metrics(self, responses: List[Dict[str, Any]]) -> AccountMetrics:
+        user_info = responses[0].get("data", {}).get("user", {})
+        # TikTok doesn't provide reach/impressions in the basic API
+        return AccountMetrics(
+            followers=user_info.get("follower_count", 0),
+            following=user_info.get("following_count", 0),
+            posts=user_info.get("video_count", 0),
+        )
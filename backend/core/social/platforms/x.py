@@ -0,0 +1,94 @@
+"""X (Twitter) API v2."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from core.social.models import SocialAccount
+from core.social.platforms.base import ApiCall, BulkMetricsMixin, PlatformClient
+from core.social.platforms.records import AccountMetrics, PostMetrics, engagement_rate
+
+ME_FIELDS = "id,name,username,public_metrics,verified"
+FOLLOWER_FIELDS = "profile_image_url,verified,public_metrics"
+TWEET_FIELDS = "id,text,created_at,public_metrics,entities"
+
+
+def metrics_from_user(user: Dict[str, Any]) -> AccountMetrics:
+    public_metrics = user.get("public_metrics", {})
+    return AccountMetrics(
+        followers=public_metrics.get("followers_count", 0),
+        following=public_metrics.get("following_count", 0),
+        posts=public_metrics.get("tweet_count", 0),
+    )
+
+
+class XClient(BulkMetricsMixin, PlatformClient):
+    platform = SocialAccount.PLATFORM_X
+    BASE_URL = "https://api.x.com/2"
+
+    def get_me(self) -> Dict[str, Any]:
+        return self.get("users/me", {"user.fields": ME_FIELDS}).get("data", {})
+
+    def get_user(self, user_id: str) -> Dict[str, Any]:
+        return self.get(f"users/{user_id}", {"user.fields": "public_metrics"}).get("data", {})
+
+    def get_user_by_username(self, username: str) -> Dict[str, Any]:
+        params = {"user.fields": "created_at,description,public_metrics,profile_image_url,verified"}
+        return self.get(f"users/by/username/{username}", params).get("data", {})
+
+    def get_user_tweets(self, user_id: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        params = {"max_results": max_results, "tweet.fields": TWEET_FIELDS}
+        return self.get(f"users/{user_id}/tweets", params).get("data", [])
+
+    def get_tweet_metrics(self, tweet_id: str) -> Dict[str, Any]:
+        data = self.get(f"tweets/{tweet_id}", {"tweet.fields": "public_metrics"}).get("data", {})
+        return data.get("public_metrics", {})
+
+    def get_followers_page(
+        self, user_id: str, pagination_token: Optional[str] = None, max_results: int = 1000
+    ) -> Dict[str, Any]:
+        """One page of GET /2/users/{id}/followers (raw body: data + meta.next_token)."""
+        params: Dict[str, Any] = {"max_results": max_results, "user.fields": FOLLOWER_FIELDS}
+        if pagination_token:
+            params["pagination_token"] = pagination_token
+        return self.get(f"users/{user_id}/followers", params)
+
+    def account_metrics_calls(self, platform_user_id: str) -> List[ApiCall]:
+        return [ApiCall("users/me", {"user.fields": ME_FIELDS})]
+
+    def parse_account_metrics(self, responses: List[Dict[str, Any]]) -> AccountMetrics:
+        return metrics_from_user(responses[0].get("data", {}))
+
+    # GET /2/users?ids= takes up to 100 ids; public_metrics are readable with any user token.
+    BULK_METRICS_MAX = 100
+
+    def bulk_account_metrics_call(self, platform_user_ids: List[str]) -> ApiCall:
+        return ApiCall("users", {"ids": ",".join(platform_user_ids), "user.fields": "public_metrics"})
+
+    def parse_bulk_account_metrics(self, response: Dict[str, Any]) -> Dict[str, AccountMetrics]:
+        # Suspended / deleted users are listed under "errors" instead of "data".
+        return {user["id"]: metrics_from_user(user) for user in response.get("data", [])}
+
+    def post_metrics(self, tweet: Dict[str, Any]) -> PostMetrics:
+        metrics = tweet.get("public_metrics", {})
+        likes = metrics.get("like_count", 0)
+        retweets = metrics.get("retweet_count", 0)
+        replies = metrics.get("reply_count", 0)
+        # X doesn't provide reach in basic API, use impressions as proxy
+        impressions = metrics.get("impression_count", 1)
+        return PostMetrics(
+            platform_post_id=tweet["id"],
+            post_url=f"https://twitter.com/i/web/status/{tweet['id']}",
+            caption=tweet["text"],
+            media_type="tweet",
+            likes=likes,
+            comments=replies,
+            shares=retweets,
+            saves=0,
+            reach=impressions,
+            engagement_rate=engagement_rate(likes + retweets + replies, impressions),
+            posted_at=tweet["created_at"],
+        )
+
+    def recent_posts(self, user_id: str, limit: int = 50) -> List[PostMetrics]:
+        return [self.post_metrics(tweet) for tweet in self.get_user_tweets(user_id, max_results=limit)]
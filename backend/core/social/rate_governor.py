@@ -0,0 +1,262 @@
+"""Distributed rate governor for outbound platform API calls.
+
+Every request made through core.social.platforms first acquires a token from
+two Redis-backed token buckets shared by all Celery workers:
+
+- ``app``  bucket: platform + app credential (client id), i.e. the app-wide quota
+- ``user`` bucket: platform + hash of the access token, i.e. the per-user quota
+
+X limits are per user *and endpoint*, so X calls also take from an
+``endpoint`` bucket keyed by the token and the path template
+(``users/:id/followers``); X's headers and 429s only affect that bucket.
+
+Budgets start from SOCIAL_RATE_LIMITS and adapt to what the platform reports:
+
+- X ``x-rate-limit-remaining`` / ``x-rate-limit-reset``: the endpoint bucket
+  is clamped to the remaining calls and blocked until the reset when exhausted.
+- Meta ``X-App-Usage`` (percent of the app quota used): the app bucket is
+  paused when usage gets close to 100%.
+- ``Retry-After`` on a 429 blocks the user bucket (X: the endpoint bucket)
+  for that long.
+
+``acquire`` returns how long the caller must wait. PlatformClient.throttle
+sleeps through short waits; longer ones raise a rate-limited PlatformAPIError
+whose ``retry_after`` is the wait, and the Celery task retries with that
+countdown.
+When Redis is not the cache backend the governor is disabled (fail open).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# (refill rate per second, burst capacity); "endpoint" defaults to the user limits
+DEFAULT_LIMITS: Dict[str, Dict[str, Tuple[float, float]]] = {
+    "x": {"app": (10.0, 100), "user": (1.0, 60)},  # ~900 requests / 15 min per user
+    "instagram": {"app": (50.0, 200), "user": (200 / 3600, 50)},  # 200 calls / user / hour
+    "tiktok": {"app": (10.0, 100), "user": (5.0, 20)},  # 600 / min
+    "linkedin": {"app": (1.0, 50), "user": (1.0, 20)},  # ~100k / day
+}
+
+APP_CREDENTIAL_SETTINGS = {
+    "x": "X_CLIENT_ID",
+    "instagram": "META_APP_ID",
+    "tiktok": "TIKTOK_CLIENT_KEY",
+    "linkedin": "LINKEDIN_CLIENT_ID",
+}
+
+# Platforms whose rate limit headers are per user per endpoint.
+ENDPOINT_SCOPED_PLATFORMS = frozenset({"x"})
+
+# Path parameters: numeric segments (user / tweet ids) and X's users/by/username/<name>
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+_USERNAME_SEGMENT = re.compile(r"(?<=/username/)[^/]+")
+
+# Meta X-App-Usage thresholds (percent) -> seconds to pause the app bucket
+APP_USAGE_PAUSES = ((100, 600), (90, 60))
+
+# KEYS: bucket keys. ARGV: cost, then (rate, capacity) per key.
+# Returns the wait in seconds as a string ("0" when the tokens were taken).
+_ACQUIRE = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local cost = tonumber(ARGV[1])
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+  local rate = tonumber(ARGV[2 * i])
+  local cap = tonumber(ARGV[2 * i + 1])
+  local data = redis.call('HMGET', key, 'tokens', 'ts', 'blocked_until')
+  local level = tonumber(data[1]) or cap
+  local ts = tonumber(data[2]) or now
+  local blocked = tonumber(data[3]) or 0
+  level = math.min(cap, level + math.max(0, now - ts) * rate)
+  tokens[i] = level
+  if blocked > now then wait = math.max(wait, blocked - now) end
+  if level < cost then wait = math.max(wait, (cost - level) / rate) end
+end
+for i, key in ipairs(KEYS) do
+  local rate = tonumber(ARGV[2 * i])
+  local cap = tonumber(ARGV[2 * i + 1])
+  local level = tokens[i]
+  if wait == 0 then level = level - cost end
+  redis.call('HSET', key, 'tokens', level, 'ts', now)
+  redis.call('EXPIRE', key, math.ceil(cap / rate) + 3600)
+end
+return tostring(wait)
+"""
+
+# KEYS[1]: bucket. ARGV: remaining (-1 = unknown), blocked_until epoch (0 = none)
+_OBSERVE = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local remaining = tonumber(ARGV[1])
+local until_ts = tonumber(ARGV[2])
+if remaining >= 0 then
+  local level = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+  if level == nil or level > remaining then
+    redis.call('HSET', KEYS[1], 'tokens', remaining, 'ts', now)
+  end
+end
+if until_ts > 0 then
+  local blocked = tonumber(redis.call('HGET', KEYS[1], 'blocked_until')) or 0
+  if until_ts > blocked then
+    redis.call('HSET', KEYS[1], 'blocked_until', until_ts)
+  end
+end
+if redis.call('TTL', KEYS[1]) < until_ts - now + 60 then
+  redis.call('EXPIRE', KEYS[1], math.ceil(math.max(0, until_ts - now)) + 3600)
+end
+return 1
+"""
+
+
+def _limits(platform: str) -> Dict[str, Tuple[float, float]]:
+    configured = (getattr(settings, "SOCIAL_RATE_LIMITS", {}) or {}).get(platform, {})
+    defaults = DEFAULT_LIMITS.get(platform, {"app": (10.0, 100), "user": (1.0, 20)})
+    limits = {scope: tuple(configured.get(scope, defaults[scope])) for scope in ("app", "user")}
+    limits["endpoint"] = tuple(configured.get("endpoint", defaults.get("endpoint", limits["user"])))
+    return limits
+
+
+def endpoint_template(path: str) -> str:
+    """``users/2244994945/followers`` -> ``users/:id/followers``."""
+    path = _ID_SEGMENT.sub(":id", "/" + path.strip("/"))
+    return _USERNAME_SEGMENT.sub(":username", path)[1:]
+
+
+def bucket_keys(platform: str, access_token: str, endpoint: Optional[str] = None) -> Dict[str, str]:
+    app = getattr(settings, APP_CREDENTIAL_SETTINGS.get(platform, ""), "") or "default"
+    user = hashlib.sha256(access_token.encode("utf-8")).hexdigest()[:16]
+    keys = {
+        "app": f"ratelimit:{platform}:app:{app}",
+        "user": f"ratelimit:{platform}:user:{user}",
+    }
+    if endpoint and platform in ENDPOINT_SCOPED_PLATFORMS:
+        keys["endpoint"] = f"ratelimit:{platform}:endpoint:{user}:{endpoint_template(endpoint)}"
+    return keys
+
+
+class RateGovernor:
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+        self._acquire = None
+        self._observe = None
+
+    @property
+    def enabled(self) -> bool:
+        if not getattr(settings, "SOCIAL_RATE_GOVERNOR_ENABLED", True):
+            return False
+        if self._redis is None:
+            try:
+                from django_redis import get_redis_connection
+
+                self._redis = get_redis_connection("default")
+            except Exception as e:
+                logger.warning(f"Rate governor disabled (no Redis connection): {e}")
+                self._redis = False
+        return bool(self._redis)
+
+    def _scripts(self):
+        if self._acquire is None:
+            self._acquire = self._redis.register_script(_ACQUIRE)
+            self._observe = self._redis.register_script(_OBSERVE)
+        return self._acquire, self._observe
+
+    def acquire(
+        self, platform: str, access_token: str, cost: float = 1, endpoint: Optional[str] = None
+    ) -> float:
+        """Take ``cost`` tokens from the app, user and (X) ``endpoint`` buckets.
+
+        Returns 0 when the call may proceed now, otherwise the seconds to wait
+        (nothing is taken in that case).
+        """
+        if not self.enabled:
+            return 0.0
+        keys = bucket_keys(platform, access_token, endpoint)
+        limits = _limits(platform)
+        args = [cost]
+        for scope in keys:
+            rate, capacity = limits[scope]
+            args.extend([rate, capacity])
+        acquire, _ = self._scripts()
+        try:
+            return float(acquire(keys=list(keys.values()), args=args))
+        except Exception as e:
+            logger.warning(f"Rate governor acquire failed for {platform}: {e}")
+            return 0.0
+
+    def observe(
+        self,
+        platform: str,
+        access_token: str,
+        headers: Mapping[str, str],
+        status_code: int,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        """Adapt bucket state to the rate limit information in a response to ``endpoint``."""
+        if not self.enabled:
+            return
+        keys = bucket_keys(platform, access_token, endpoint)
+        # X reports (and enforces) limits per endpoint: never clamp the token's other endpoints.
+        limited = keys.get("endpoint", keys["user"])
+        now = time.time()
+        updates: Dict[str, Tuple[int, float]] = {}
+
+        remaining = _int(headers.get("x-rate-limit-remaining"))
+        reset = _int(headers.get("x-rate-limit-reset"))
+        if remaining is not None:
+            until = float(reset) if remaining == 0 and reset else 0.0
+            updates[limited] = (remaining, until)
+
+        usage = _app_usage(headers.get("x-app-usage"))
+        if usage is not None:
+            for threshold, pause in APP_USAGE_PAUSES:
+                if usage >= threshold:
+                    updates[keys["app"]] = (-1, now + pause)
+                    break
+
+        if status_code == 429:
+            retry_after = _int(headers.get("retry-after"))
+            if retry_after:
+                remaining_limited, until_limited = updates.get(limited, (-1, 0.0))
+                updates[limited] = (remaining_limited, max(until_limited, now + retry_after))
+
+        if not updates:
+            return
+        _, observe = self._scripts()
+        try:
+            for key, (remaining_value, until) in updates.items():
+                observe(keys=[key], args=[remaining_value, until])
+        except Exception as e:
+            logger.warning(f"Rate governor observe failed for {platform}: {e}")
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _app_usage(value: Optional[str]) -> Optional[float]:
+    """Highest percentage in a Meta X-App-Usage header ({"call_count": 28, ...})."""
+    if not value:
+        return None
+    try:
+        usage = json.loads(value)
+        return max(float(v) for v in usage.values())
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+governor = RateGovernor()
@@ -0,0 +1,150 @@
+"""Read-through cache for the analytics endpoint responses.
+
+Responses are cached per endpoint, scope (workspace or account), data
+version and query string. Versions are counters in the cache, bumped by the
+Celery tasks right after they write new data (``invalidate_accounts``,
+``invalidate_rollups``); bumping an account also bumps its workspace, since
+the dashboard aggregates all of its accounts. Stale entries are not deleted,
+just no longer addressed, and expire after ANALYTICS_CACHE_TTL.
+
+Every cached response carries an ETag (hash of the body); a matching
+``If-None-Match`` gets a 304 without the body.
+
+Hits and misses are counted per endpoint (``hit_ratios``,
+``manage.py analytics_cache_stats``).
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import time
+from typing import Dict, Iterable, List
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+DEFAULT_TTL = 15 * 60
+ROLLUPS_VERSION_KEY = "analytics:version:rollups"
+
+ENDPOINTS: List[str] = []
+
+
+def _version_key(scope: str, scope_id) -> str:
+    return f"analytics:version:{scope}:{scope_id}"
+
+
+def _stats_key(endpoint: str, kind: str) -> str:
+    return f"analytics:stats:{endpoint}:{kind}"
+
+
+def _seed() -> int:
+    # Clock-based start value: a version key lost to eviction can never
+    # come back with a number that addresses old entries.
+    return time.time_ns() // 1000
+
+
+def _version(key: str) -> int:
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _seed(), timeout=None)
+        version = cache.get(key, 0)
+    return version
+
+
+def _incr(key: str, seed: int) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, seed, timeout=None)
+
+
+def invalidate_accounts(accounts: Iterable) -> None:
+    """Drop cached responses for these SocialAccounts and their workspaces."""
+    workspace_ids = set()
+    for account in accounts:
+        _incr(_version_key("account", account.id), _seed())
+        workspace_ids.add(account.workspace_id)
+    for workspace_id in workspace_ids:
+        _incr(_version_key("workspace", workspace_id), _seed())
+
+
+def invalidate_rollups() -> None:
+    """Drop cached responses built from the metrics rollups (all accounts)."""
+    _incr(ROLLUPS_VERSION_KEY, _seed())
+
+
+def _etag(content: bytes) -> str:
+    return '"' + hashlib.md5(content).hexdigest() + '"'
+
+
+def _response_key(endpoint: str, scope_id, versions: List[int], request) -> str:
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    digest = hashlib.md5(query.encode()).hexdigest()
+    return f"analytics:resp:{endpoint}:{scope_id}:{'.'.join(map(str, versions))}:{digest}"
+
+
+def cached_response(endpoint: str, scope: str, *, rollups: bool = False):
+    """Cache a JSON analytics view keyed on its ``<scope>_id`` URL kwarg and data version.
+
+    ``rollups`` adds the rollup version for views that read MetricsRollup.
+    Only 200 responses are cached.
+    """
+    ENDPOINTS.append(endpoint)
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not getattr(settings, "ANALYTICS_CACHE_ENABLED", True):
+                return view(request, *args, **kwargs)
+
+            scope_id = kwargs[f"{scope}_id"]
+            versions = [_version(_version_key(scope, scope_id))]
+            if rollups:
+                versions.append(_version(ROLLUPS_VERSION_KEY))
+            key = _response_key(endpoint, scope_id, versions, request)
+
+            entry = cache.get(key)
+            _incr(_stats_key(endpoint, "hits" if entry else "misses"), 1)
+            if entry is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200 or response.streaming:
+                    return response
+                entry = (response.content, response["Content-Type"], _etag(response.content))
+                cache.set(key, entry, timeout=int(getattr(settings, "ANALYTICS_CACHE_TTL", DEFAULT_TTL)))
+
+            content, content_type, etag = entry
+            if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+            if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == "*"):
+                response = HttpResponseNotModified()
+            else:
+                response = HttpResponse(content, content_type=content_type)
+            response["ETag"] = etag
+            response["Cache-Control"] = "private, no-cache"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def hit_ratios() -> Dict[str, Dict]:
+    """{endpoint: {hits, misses, hit_ratio}} since the counters were last reset."""
+    stats = {}
+    for endpoint in ENDPOINTS:
+        hits = cache.get(_stats_key(endpoint, "hits"), 0)
+        misses = cache.get(_stats_key(endpoint, "misses"), 0)
+        total = hits + misses
+        stats[endpoint] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 3) if total else None,
+        }
+    return stats
+
+
+def reset_stats() -> None:
+    cache.delete_many([_stats_key(e, kind) for e in ENDPOINTS for kind in ("hits", "misses")])
@@ -0,0 +1,273 @@
+"""Data retention for time-series tables.
+
+Each RetentionPolicy removes rows older than its retention window in small
+batches (``DELETE ... WHERE id IN (<batch>)``), one short transaction per
+batch, so deletes never hold long locks or build huge WAL bursts.
+
+Raw metrics snapshots are downsampled before they go: a snapshot is only
+deleted once it has been folded into the rollups (older than the rollup
+watermark, see core.social.rollups), and the snapshot backing each account's
+LatestMetrics row is always kept. Rollups themselves are thinned the same
+way (hourly rollups expire before daily ones; weekly rollups are kept).
+
+When a table is partitioned by month (core.social.partitioning), whole
+partitions past the cutoff are detached and dropped first; batched deletes
+then only handle the boundary month. A month holding a row the policy must
+keep (a LatestMetrics snapshot) is not dropped; its other rows go through the
+batched deletes.
+
+Follower change daily counters expire with (never before) the follower
+changes they count.
+
+Retention windows (days) come from DATA_RETENTION_DAYS; 0 disables a policy.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Callable, Dict, List, Optional, Set
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from core.automations.models import AutomationRun
+from core.social.models import (
+    FollowerChange,
+    FollowerChangeDailyCount,
+    LatestMetrics,
+    MetricsRollup,
+    MetricsRollupWatermark,
+    MetricsSnapshot,
+)
+from core.social.partitioning import drop_partitions_before, estimated_rows, is_partitioned, month_start
+from core.social.rollups import WATERMARK_NAME
+
+DEFAULT_RETENTION_DAYS = {
+    "metrics_snapshots": 90,
+    "metrics_rollups_hour": 180,
+    "metrics_rollups_day": 730,
+    "follower_changes": 365,
+    "follower_change_daily_counts": 365,
+    "automation_runs": 90,
+}
+DEFAULT_BATCH_SIZE = 5000
+
+
+def _same_cutoff(cutoff: datetime) -> Optional[datetime]:
+    return cutoff
+
+
+@dataclass
+class RetentionPolicy:
+    name: str
+    # Rows eligible for deletion before the (effective) cutoff.
+    queryset: Callable[[datetime], QuerySet]
+    timestamp_field: str
+    # Effective cutoff for the configured one (None = nothing may be deleted yet).
+    cutoff: Callable[[datetime], Optional[datetime]] = _same_cutoff
+    # Table whose monthly partitions can be dropped wholesale, if partitioned.
+    partitioned_table: Optional[str] = None
+    # Start months of partitions before the cutoff that hold rows the queryset excludes.
+    kept_months: Optional[Callable[[datetime], Set[date]]] = None
+
+
+@dataclass
+class RetentionReport:
+    policy: str
+    cutoff: Optional[str]
+    rows: int = 0
+    batches: int = 0
+    partitions_dropped: int = 0
+    seconds: float = 0.0
+    dry_run: bool = False
+    notes: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict:
+        return {
+            "policy": self.policy,
+            "cutoff": self.cutoff,
+            "rows": self.rows,
+            "batches": self.batches,
+            "partitions_dropped": self.partitions_dropped,
+            "seconds": round(self.seconds, 3),
+            "dry_run": self.dry_run,
+            "notes": self.notes,
+        }
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=dt_timezone.utc)
+
+
+def _rolled_up_cutoff(cutoff: datetime) -> Optional[datetime]:
+    watermark = MetricsRollupWatermark.objects.filter(name=WATERMARK_NAME).first()
+    if watermark is None:
+        return None  # nothing rolled up yet: deleting would lose data
+    return min(cutoff, watermark.snapshot_timestamp)
+
+
+def _snapshots(cutoff: datetime) -> QuerySet:
+    return MetricsSnapshot.objects.filter(timestamp__lt=cutoff).exclude(
+        id__in=LatestMetrics.objects.values("snapshot_id")
+    )
+
+
+def _latest_snapshot_months(cutoff: datetime) -> Set[date]:
+    return {
+        month_start(ts)
+        for ts in LatestMetrics.objects.filter(timestamp__lt=cutoff).datetimes(
+            "timestamp", "month", tzinfo=dt_timezone.utc
+        )
+    }
+
+
+def _rollups(granularity: str) -> Callable[[datetime], QuerySet]:
+    def queryset(cutoff: datetime) -> QuerySet:
+        return MetricsRollup.objects.filter(granularity=granularity, bucket_start__lt=cutoff)
+
+    return queryset
+
+
+def _follower_changes(cutoff: datetime) -> QuerySet:
+    return FollowerChange.objects.filter(timestamp__lt=cutoff)
+
+
+def _follower_change_counts_cutoff(cutoff: datetime) -> Optional[datetime]:
+    # Counters never outlive their window over follower_changes: sums would
+    # include rows retention already deleted.
+    days = retention_days("follower_changes")
+    if days <= 0:
+        return None  # follower_changes are kept forever: keep their counters too
+    return min(cutoff, timezone.now() - timedelta(days=days))
+
+
+def _follower_change_counts(cutoff: datetime) -> QuerySet:
+    # Whole UTC days before the cutoff day only.
+    return FollowerChangeDailyCount.objects.filter(day__lt=cutoff.astimezone(dt_timezone.utc).date())
+
+
+def _automation_runs(cutoff: datetime) -> QuerySet:
+    return AutomationRun.objects.filter(
+        Q(completed_at__lt=cutoff) | Q(completed_at__isnull=True, triggered_at__lt=cutoff),
+        status__in=[AutomationRun.STATUS_SUCCESS, AutomationRun.STATUS_FAILED, AutomationRun.STATUS_SKIPPED],
+    )
+
+
+POLICIES: Dict[str, RetentionPolicy] = {
+    p.name: p
+    for p in (
+        RetentionPolicy(
+            "metrics_snapshots", _snapshots, "timestamp",
+            cutoff=_rolled_up_cutoff, partitioned_table="metrics_snapshots", kept_months=_latest_snapshot_months,
+        ),
+        RetentionPolicy("metrics_rollups_hour", _rollups(MetricsRollup.GRANULARITY_HOUR), "bucket_start"),
+        RetentionPolicy("metrics_rollups_day", _rollups(MetricsRollup.GRANULARITY_DAY), "bucket_start"),
+        RetentionPolicy("follower_changes", _follower_changes, "timestamp", partitioned_table="follower_changes"),
+        RetentionPolicy(
+            "follower_change_daily_counts", _follower_change_counts, "day", cutoff=_follower_change_counts_cutoff,
+        ),
+        RetentionPolicy("automation_runs", _automation_runs, "triggered_at"),
+    )
+}
+
+
+def kept_partition_months(table: str, cutoff: datetime) -> Set[date]:
+    """Months of ``table`` that must not be dropped wholesale before ``cutoff``."""
+    return {
+        month
+        for policy in POLICIES.values()
+        if policy.partitioned_table == table and policy.kept_months
+        for month in policy.kept_months(cutoff)
+    }
+
+
+def retention_days(name: str) -> int:
+    configured = getattr(settings, "DATA_RETENTION_DAYS", {}) or {}
+    return int(configured.get(name, DEFAULT_RETENTION_DAYS[name]))
+
+
+def apply_policy(
+    policy: RetentionPolicy,
+    *,
+    dry_run: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+    pause: float = 0.0,
+) -> RetentionReport:
+    """Delete (or, with ``dry_run``, count) the rows past the policy's retention window."""
+    days = retention_days(policy.name)
+    if days <= 0:
+        return RetentionReport(policy.name, None, dry_run=dry_run, notes=["disabled"])
+
+    start = time.perf_counter()
+    cutoff = policy.cutoff(timezone.now() - timedelta(days=days))
+    report = RetentionReport(policy.name, cutoff.isoformat() if cutoff else None, dry_run=dry_run)
+    if cutoff is None:
+        report.notes.append("skipped: nothing may be deleted yet")
+        return report
+
+    dropped = []
+    if policy.partitioned_table and is_partitioned(policy.partitioned_table):
+        # Whole months go with DETACH + DROP (counted from planner estimates).
+        keep = policy.kept_months(cutoff) if policy.kept_months else set()
+        dropped = drop_partitions_before(policy.partitioned_table, cutoff, keep=keep, dry_run=True)
+        report.rows += estimated_rows(dropped)
+        if not dry_run:
+            drop_partitions_before(policy.partitioned_table, cutoff, keep=keep)
+        report.partitions_dropped = len(dropped)
+        if dropped:
+            report.notes.append(f"partitions: {', '.join(p.name for p in dropped)}")
+        if keep:
+            report.notes.append(f"kept {len(keep)} month(s) holding rows that must be retained")
+
+    qs = policy.queryset(cutoff)
+    if dry_run:
+        # Nothing was detached: leave out the months already counted above.
+        for partition in dropped:
+            qs = qs.exclude(
+                **{
+                    f"{policy.timestamp_field}__gte": _utc_midnight(partition.start),
+                    f"{policy.timestamp_field}__lt": _utc_midnight(partition.end),
+                }
+            )
+        report.rows += qs.count()
+    else:
+        model = qs.model
+        while max_batches is None or report.batches < max_batches:
+            with transaction.atomic():
+                ids = list(qs.order_by(policy.timestamp_field).values_list("pk", flat=True)[:batch_size])
+                if not ids:
+                    break
+                deleted, _ = model.objects.filter(pk__in=ids).delete()
+            report.rows += deleted
+            report.batches += 1
+            if len(ids) < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+        else:
+            report.notes.append("stopped at max_batches")
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def apply_retention(
+    names: Optional[List[str]] = None,
+    *,
+    dry_run: bool = False,
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None,
+    pause: Optional[float] = None,
+) -> List[RetentionReport]:
+    """Run the selected policies (all by default) and return one report each."""
+    batch_size = batch_size or int(getattr(settings, "DATA_RETENTION_BATCH_SIZE", DEFAULT_BATCH_SIZE))
+    pause = pause if pause is not None else float(getattr(settings, "DATA_RETENTION_BATCH_PAUSE", 0.0))
+    return [
+        apply_policy(POLICIES[name], dry_run=dry_run, batch_size=batch_size, max_batches=max_batches, pause=pause)
+        for name in (names or list(POLICIES))
+    ]
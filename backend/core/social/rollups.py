@@ -0,0 +1,335 @@
+"""Incremental hourly/daily/weekly rollups of MetricsSnapshot.
+
+``update_rollups`` folds snapshots written since the watermark into
+MetricsRollup rows (min/max/last/sum + samples per metric and bucket) and
+advances the watermark in the same transaction, so every snapshot is counted
+exactly once. Snapshots are read in (timestamp, id) order, stopping ``lag``
+before now so rows from transactions still in flight are not skipped.
+
+Snapshots are only written when metrics change (core.social.latest_metrics),
+so an account can have no snapshot in many buckets. The job fills those with
+carried rows (``samples`` 0, min = max = last = the previous value, sum 0):
+the gaps before each new snapshot, and the buckets after the latest one up to
+now (at most FILL_LOOKBACK past LatestMetrics.valid_until). Readers summing
+``<metric>_last`` over accounts per bucket then see every account in every
+bucket.
+
+Trend reads use ``choose_granularity`` to pick the coarsest rollup that still
+gives at least ``min_points`` buckets over the requested range.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Max, Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.social.models import LatestMetrics, MetricsRollup, MetricsRollupWatermark, MetricsSnapshot, SocialAccount
+
+ROLLUP_METRICS = ["followers_count", "reach", "impressions", "engagement_count", "profile_views"]
+
+BUCKET_WIDTHS = {
+    MetricsRollup.GRANULARITY_HOUR: timedelta(hours=1),
+    MetricsRollup.GRANULARITY_DAY: timedelta(days=1),
+    MetricsRollup.GRANULARITY_WEEK: timedelta(weeks=1),
+}
+
+WATERMARK_NAME = "metrics_snapshots"
+DEFAULT_CHUNK_SIZE = 20000
+DEFAULT_LAG = timedelta(minutes=2)
+DEFAULT_MIN_POINTS = 24
+# How far back a new snapshot looks for the account's previous bucket to fill
+# the gap from. Must exceed the longest sync interval (economy ceiling + lease).
+FILL_LOOKBACK = timedelta(days=2)
+
+AGGREGATE_FIELDS = ["samples", "last_at"] + [
+    f"{metric}_{agg}" for metric in ROLLUP_METRICS for agg in ("min", "max", "last", "sum")
+]
+
+_Key = Tuple[Any, str, datetime]
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    """Start of the UTC bucket containing ``ts`` (weeks start on Monday)."""
+    ts = ts.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+    if granularity == MetricsRollup.GRANULARITY_HOUR:
+        return ts
+    ts = ts.replace(hour=0)
+    if granularity == MetricsRollup.GRANULARITY_DAY:
+        return ts
+    return ts - timedelta(days=ts.weekday())
+
+
+def _new_aggregate(ts: datetime, values: Dict[str, int]) -> Dict[str, Any]:
+    agg: Dict[str, Any] = {"samples": 1, "last_at": ts}
+    for metric, value in values.items():
+        agg[f"{metric}_min"] = value
+        agg[f"{metric}_max"] = value
+        agg[f"{metric}_last"] = value
+        agg[f"{metric}_sum"] = value
+    return agg
+
+
+def _merge(into: Dict[str, Any], other: Dict[str, Any]) -> None:
+    """Fold aggregate ``other`` into ``into``."""
+    newer = other["last_at"] >= into["last_at"]
+    into["samples"] += other["samples"]
+    for metric in ROLLUP_METRICS:
+        into[f"{metric}_min"] = min(into[f"{metric}_min"], other[f"{metric}_min"])
+        into[f"{metric}_max"] = max(into[f"{metric}_max"], other[f"{metric}_max"])
+        into[f"{metric}_sum"] += other[f"{metric}_sum"]
+        if newer:
+            into[f"{metric}_last"] = other[f"{metric}_last"]
+    if newer:
+        into["last_at"] = other["last_at"]
+
+
+def _carried(last: Dict[str, Any], start: datetime) -> Dict[str, Any]:
+    """Aggregate of a bucket without samples, holding the ``<metric>_last`` values of ``last``."""
+    agg: Dict[str, Any] = {"samples": 0, "last_at": start}
+    for metric in ROLLUP_METRICS:
+        value = last[f"{metric}_last"]
+        agg[f"{metric}_min"] = value
+        agg[f"{metric}_max"] = value
+        agg[f"{metric}_last"] = value
+        agg[f"{metric}_sum"] = 0
+    return agg
+
+
+def _fold(rows) -> Dict[_Key, Dict[str, Any]]:
+    buckets: Dict[_Key, Dict[str, Any]] = {}
+    for _, account_id, ts, *values in rows:
+        snapshot = _new_aggregate(ts, dict(zip(ROLLUP_METRICS, values)))
+        for granularity in BUCKET_WIDTHS:
+            key = (account_id, granularity, bucket_start(ts, granularity))
+            if key in buckets:
+                _merge(buckets[key], snapshot)
+            else:
+                buckets[key] = dict(snapshot)
+    return buckets
+
+
+def _fill_gaps(buckets: Dict[_Key, Dict[str, Any]]) -> None:
+    """Add carried buckets before and between each account's new ``buckets``.
+
+    The gap before an account's first new bucket is filled from its latest
+    stored bucket within FILL_LOOKBACK; stored buckets are never replaced.
+    """
+    for granularity, width in BUCKET_WIDTHS.items():
+        starts: Dict[Any, List[datetime]] = defaultdict(list)
+        for account_id, g, start in buckets:
+            if g == granularity:
+                starts[account_id].append(start)
+        if not starts:
+            continue
+        firsts = {account_id: min(account_starts) for account_id, account_starts in starts.items()}
+        rollups = MetricsRollup.objects.filter(granularity=granularity, social_account_id__in=list(firsts))
+        previous = (
+            rollups.filter(
+                bucket_start__gte=min(firsts.values()) - FILL_LOOKBACK,
+                bucket_start__lt=max(firsts.values()),
+            )
+            .values("social_account_id")
+            .annotate(start=Max("bucket_start"))
+            .values_list("social_account_id", "start")
+        )
+        gaps = {account_id: start for account_id, start in previous if start < firsts[account_id] - width}
+        carried: Dict[Any, Tuple[datetime, Dict[str, Any]]] = {}
+        if gaps:
+            stored = rollups.filter(social_account_id__in=list(gaps), bucket_start__in=set(gaps.values())).values(
+                "social_account_id", "bucket_start", *(f"{metric}_last" for metric in ROLLUP_METRICS)
+            )
+            for row in stored:
+                if gaps[row["social_account_id"]] == row["bucket_start"]:
+                    carried[row["social_account_id"]] = (row["bucket_start"], row)
+
+        for account_id, account_starts in starts.items():
+            prev = carried.get(account_id)
+            for start in sorted(account_starts):
+                if prev is not None:
+                    gap = prev[0] + width
+                    while gap < start:
+                        buckets[(account_id, granularity, gap)] = _carried(prev[1], gap)
+                        gap += width
+                prev = (start, buckets[(account_id, granularity, start)])
+
+
+def _carry_latest(since: Optional[datetime], upper: datetime) -> int:
+    """Carry each active account's LatestMetrics into the buckets up to ``upper``; returns rows written.
+
+    Only buckets after ``since`` (the previous run already filled the rest)
+    and at most FILL_LOOKBACK past the last sync: an account that stopped
+    syncing is not carried on indefinitely.
+    """
+    latest = LatestMetrics.objects.filter(social_account__status=SocialAccount.STATUS_ACTIVE).alias(
+        known=Coalesce("valid_until", "timestamp")
+    )
+    if since is not None:
+        latest = latest.filter(known__gt=since - FILL_LOOKBACK)
+    rows = []
+    for row in latest.values("social_account_id", "timestamp", "valid_until", *ROLLUP_METRICS).iterator():
+        last = {f"{metric}_last": row[metric] for metric in ROLLUP_METRICS}
+        until = min(upper, (row["valid_until"] or row["timestamp"]) + FILL_LOOKBACK)
+        for granularity, width in BUCKET_WIDTHS.items():
+            start = bucket_start(row["timestamp"], granularity) + width
+            if since is not None:
+                start = max(start, bucket_start(since, granularity) + width)
+            while start <= until:
+                rows.append(
+                    MetricsRollup(
+                        social_account_id=row["social_account_id"],
+                        granularity=granularity,
+                        bucket_start=start,
+                        **_carried(last, start),
+                    )
+                )
+                start += width
+    # Buckets that already have a row (a snapshot, or an earlier fill) keep it.
+    MetricsRollup.objects.bulk_create(rows, ignore_conflicts=True, batch_size=1000)
+    return len(rows)
+
+
+def _write(buckets: Dict[_Key, Dict[str, Any]]) -> int:
+    # Merge with the stored rows of the same buckets, then upsert.
+    for granularity in BUCKET_WIDTHS:
+        keys = [k for k in buckets if k[1] == granularity]
+        if not keys:
+            continue
+        existing = MetricsRollup.objects.filter(
+            granularity=granularity,
+            social_account_id__in={k[0] for k in keys},
+            bucket_start__in={k[2] for k in keys},
+        ).values("social_account_id", "bucket_start", *AGGREGATE_FIELDS)
+        for row in existing:
+            key = (row.pop("social_account_id"), granularity, row.pop("bucket_start"))
+            if key in buckets:
+                stored = dict(row)
+                _merge(stored, buckets[key])
+                buckets[key] = stored
+
+    MetricsRollup.objects.bulk_create(
+        [
+            MetricsRollup(social_account_id=account_id, granularity=granularity, bucket_start=start, **agg)
+            for (account_id, granularity, start), agg in buckets.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["social_account", "granularity", "bucket_start"],
+        update_fields=AGGREGATE_FIELDS,
+        batch_size=1000,
+    )
+    return len(buckets)
+
+
+def update_rollups(
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    lag: timedelta = DEFAULT_LAG,
+    max_chunks: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Fold snapshots newer than the watermark into the rollups, then carry values forward."""
+    upper = timezone.now() - lag
+    snapshots = 0
+    rollups = 0
+    chunks = 0
+    watermark = MetricsRollupWatermark.objects.filter(name=WATERMARK_NAME).first()
+    since = watermark.snapshot_timestamp if watermark else None
+
+    while max_chunks is None or chunks < max_chunks:
+        with transaction.atomic():
+            watermark = (
+                MetricsRollupWatermark.objects.select_for_update().filter(name=WATERMARK_NAME).first()
+            )
+            qs = MetricsSnapshot.objects.filter(timestamp__lte=upper)
+            if watermark is not None:
+                qs = qs.filter(
+                    Q(timestamp__gt=watermark.snapshot_timestamp)
+                    | Q(timestamp=watermark.snapshot_timestamp, id__gt=watermark.snapshot_id)
+                )
+            rows = list(
+                qs.order_by("timestamp", "id").values_list("id", "social_account_id", "timestamp", *ROLLUP_METRICS)[
+                    :chunk_size
+                ]
+            )
+            if not rows:
+                break
+
+            buckets = _fold(rows)
+            _fill_gaps(buckets)
+            rollups += _write(buckets)
+            last_id, _, last_ts, *_ = rows[-1]
+            watermark, _ = MetricsRollupWatermark.objects.update_or_create(
+                name=WATERMARK_NAME,
+                defaults={"snapshot_timestamp": last_ts, "snapshot_id": last_id},
+            )
+
+        snapshots += len(rows)
+        chunks += 1
+        if len(rows) < chunk_size:
+            break
+
+    rollups += _carry_latest(since, upper)
+    return {
+        "snapshots": snapshots,
+        "rollups_written": rollups,
+        "watermark": watermark.snapshot_timestamp.isoformat() if watermark else None,
+    }
+
+
+def choose_granularity(span: timedelta, min_points: int = DEFAULT_MIN_POINTS) -> str:
+    """Coarsest granularity giving at least ``min_points`` buckets over ``span``."""
+    for granularity in (MetricsRollup.GRANULARITY_WEEK, MetricsRollup.GRANULARITY_DAY):
+        if span / BUCKET_WIDTHS[granularity] >= min_points:
+            return granularity
+    return MetricsRollup.GRANULARITY_HOUR
+
+
+def trend_series(account_id, metric: str, since: datetime, until: datetime, granularity: str) -> List[Dict[str, Any]]:
+    """[{bucket_start, min, max, last, avg, samples}] for ``metric`` over [since, until].
+
+    Snapshots are only written when metrics change, so a bucket without
+    samples means "unchanged": it is filled with the previous bucket's last
+    value (``samples`` 0), up to the account's LatestMetrics.valid_until.
+    """
+    first = bucket_start(since, granularity)
+    rollups = MetricsRollup.objects.filter(social_account_id=account_id, granularity=granularity)
+    rows = rollups.filter(bucket_start__gte=first, bucket_start__lte=until).values_list(
+        "bucket_start", "samples", f"{metric}_min", f"{metric}_max", f"{metric}_last", f"{metric}_sum"
+    )
+    points = {
+        start: {
+            "bucket_start": start.isoformat(),
+            "min": low,
+            "max": high,
+            "last": last,
+            "avg": round(total / samples, 2) if samples else last,
+            "samples": samples,
+        }
+        for start, samples, low, high, last, total in rows
+    }
+
+    latest = LatestMetrics.objects.filter(social_account_id=account_id).values_list("valid_until", "timestamp").first()
+    if latest is None:
+        return [points[start] for start in sorted(points)]
+    known_until = bucket_start(min(until, latest[0] or latest[1]), granularity)
+    value = (
+        rollups.filter(bucket_start__lt=first).order_by("-bucket_start").values_list(f"{metric}_last", flat=True).first()
+    )
+
+    series = []
+    start = first
+    while start <= until:
+        point = points.get(start)
+        if point is not None:
+            series.append(point)
+            value = point["last"]
+        elif value is not None and start <= known_until:
+            series.append(
+                {"bucket_start": start.isoformat(), "min": value, "max": value, "last": value, "avg": value, "samples": 0}
+            )
+        start += BUCKET_WIDTHS[granularity]
+    return series
@@ -0,0 +1,123 @@
+"""Adaptive per-account metrics sync scheduling.
+
+Every SocialAccount carries ``next_sync_at`` (indexed with status). The beat
+task picks due accounts with ``claim_due``, which moves their next_sync_at to
+a lease time, so later ticks skip them while they are queued, and a failed
+sync is simply retried when the lease expires. After a sync, ``reschedule``
+sets the real next time from:
+
+- volatility: the outcome of each sync. ``sync_base_interval`` shrinks by
+  SHRINK when the fetched metrics changed (core.social.latest_metrics
+  RecordResult.changed) and grows by GROW when they did not, so it settles
+  where about log(GROW) / (log(GROW) - log(SHRINK)) of the syncs (~37%) see a
+  change. Counting stored snapshot rows instead would never exceed the
+  current sync rate, and an account at its ceiling could not come back.
+- posting frequency: top_content posts per day; the interval is divided by
+  (1 + posts per day). Counted over POSTING_LOOKBACK, or twice the tier
+  ceiling if that is longer.
+- plan tier: SocialAccount.sync_tier bounds both intervals (SYNC_TIERS).
+
+New accounts start at the tier floor. Next times get +-JITTER so accounts
+do not fall due together.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from typing import Collection, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Count
+from django.utils import timezone
+
+from core.social.models import SocialAccount, TopContent
+
+# tier -> (floor, ceiling) in seconds
+DEFAULT_TIERS: Dict[str, Tuple[int, int]] = {
+    SocialAccount.SYNC_TIER_PRIORITY: (5 * 60, 60 * 60),
+    SocialAccount.SYNC_TIER_STANDARD: (15 * 60, 6 * 60 * 60),
+    SocialAccount.SYNC_TIER_ECONOMY: (60 * 60, 24 * 60 * 60),
+}
+
+SHRINK = 0.5
+GROW = 1.5
+POSTING_LOOKBACK = timedelta(days=7)
+CLAIM_LEASE = timedelta(minutes=15)
+JITTER = 0.1
+
+
+def tier_bounds(tier: str) -> Tuple[int, int]:
+    tiers = {**DEFAULT_TIERS, **getattr(settings, "SYNC_TIERS", {})}
+    return tiers.get(tier, tiers[SocialAccount.SYNC_TIER_STANDARD])
+
+
+def _clamp(interval: float, tier: str) -> int:
+    floor, ceiling = tier_bounds(tier)
+    return int(min(ceiling, max(floor, interval)))
+
+
+def next_base_interval(tier: str, base: Optional[int], changed: Optional[bool]) -> int:
+    """Base interval after a sync (``changed`` None: no outcome, only re-clamped)."""
+    if base is None:
+        base = tier_bounds(tier)[0]
+    if changed is True:
+        base *= SHRINK
+    elif changed is False:
+        base *= GROW
+    return _clamp(base, tier)
+
+
+def posting_lookback(tiers: Iterable[str]) -> timedelta:
+    ceiling = max((tier_bounds(tier)[1] for tier in tiers), default=0)
+    return max(POSTING_LOOKBACK, timedelta(seconds=2 * ceiling))
+
+
+def posts_per_day(account_ids: Collection, lookback: timedelta, now: datetime) -> Dict[str, float]:
+    days = lookback.total_seconds() / 86400
+    return {
+        str(account_id): n / days
+        for account_id, n in TopContent.objects.filter(social_account_id__in=account_ids, posted_at__gte=now - lookback)
+        .values("social_account_id")
+        .annotate(n=Count("id"))
+        .values_list("social_account_id", "n")
+    }
+
+
+def reschedule(account_ids: Iterable, changed: Optional[Collection] = None, now: Optional[datetime] = None) -> int:
+    """Set next_sync_at / sync_interval for the accounts after a sync; returns accounts updated.
+
+    ``changed`` holds the ids whose metrics changed in this sync; the others
+    count as unchanged. Without it (e.g. ``manage.py sync_schedule
+    --recompute``) the learned base intervals are kept.
+    """
+    now = now or timezone.now()
+    accounts = list(
+        SocialAccount.objects.filter(id__in=list(account_ids)).only("id", "sync_tier", "sync_base_interval")
+    )
+    if not accounts:
+        return 0
+    changed_ids = {str(i) for i in changed} if changed is not None else None
+    ids = [a.id for a in accounts]
+    posts = posts_per_day(ids, posting_lookback({a.sync_tier for a in accounts}), now)
+
+    for account in accounts:
+        key = str(account.id)
+        outcome = None if changed_ids is None else key in changed_ids
+        account.sync_base_interval = next_base_interval(account.sync_tier, account.sync_base_interval, outcome)
+        account.sync_interval = _clamp(account.sync_base_interval / (1 + posts.get(key, 0.0)), account.sync_tier)
+        account.next_sync_at = now + timedelta(seconds=account.sync_interval * (1 + random.uniform(-JITTER, JITTER)))
+    SocialAccount.objects.bulk_update(
+        accounts, ["next_sync_at", "sync_interval", "sync_base_interval"], batch_size=500
+    )
+    return len(accounts)
+
+
+def claim_due(now: Optional[datetime] = None):
+    """Lease every due active account; returns (queryset of the claimed accounts, count)."""
+    now = now or timezone.now()
+    # Microsecond-precise lease time doubles as the claim marker.
+    lease_until = now + CLAIM_LEASE
+    active = SocialAccount.objects.filter(status=SocialAccount.STATUS_ACTIVE)
+    claimed = active.filter(next_sync_at__lte=now).update(next_sync_at=lease_until)
+    return active.filter(next_sync_at=lease_until), claimed
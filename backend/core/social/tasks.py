@@ -2,16 +2,30 @@ from celery import shared_task
 from django.utils import timezone
 from datetime import timedelta
 import logging
+import math
 
+import numpy as np
+
+from django.conf import settings
 from django.core.cache import cache
 
 from core.social.models import (
     SocialAccount, MetricsSnapshot, FollowerChange, TopContent, AudienceInsight
 )
 from core.social.views.oauth import decrypt_token
-from core.social.api_clients import (
-    InstagramAPIClient, TikTokAPIClient, LinkedInAPIClient, XAPIClient
-)
+from core.social.platforms import CLIENTS, InstagramClient, PlatformAPIError, get_client
+from core.social.metrics_fetch import MetricsRequest, fetch_metrics
+from core.social.bulk_upsert import BulkUpserter
+from core.social.columnar import last_deltas, load_snapshot_series
+from core.social.fanout import fan_out
+from core.celery_queues import queue_for
+from core.social.latest_metrics import record_snapshots
+from core.social.response_cache import invalidate_accounts, invalidate_rollups
+from core.social.rollups import update_rollups
+from core.social.sync_schedule import claim_due, reschedule
+from core.social.top_content import refresh_rankings
+from core.social.retention import apply_retention
+from core.social.partitioning import PARTITIONED_TABLES, ensure_partitions, is_partitioned
 
 # Identity-level unfollowers (official APIs only)
 from core.social.follower_sync import sync_x_followers_snapshot
@@ -19,117 +33,265 @@ from core.social.x_api import XApiError
 
 logger = logging.getLogger(__name__)
 
+# Retry budget for tasks deferred by the rate governor / platform 429s.
+RATE_LIMIT_MAX_RETRIES = 5
+
+# Snapshots read by detect_all_follower_changes (must hold the last two syncs).
+FOLLOWER_DELTA_LOOKBACK = timedelta(days=1)
+# Beat interval of detect_all_follower_changes: an older latest snapshot was already reported.
+FOLLOWER_DELTA_INTERVAL = timedelta(minutes=30)
+
+
+def _rate_limit_countdown(exc, default=60):
+    """Seconds until the rate limited call can be retried (None if not rate limited)."""
+    if getattr(exc, "status_code", None) != 429:
+        return None
+    retry_after = getattr(exc, "retry_after", None)
+    return max(1, math.ceil(retry_after)) if retry_after else default
+
+
+@shared_task
+def sync_due_accounts_metrics():
+    """Sync metrics for the accounts whose adaptive next_sync_at is due (core.social.sync_schedule)."""
+    accounts, claimed = claim_due()
+    reports = _fan_out_active(
+        "metrics_due",
+        sync_accounts_metrics_batch,
+        chunk_size=int(getattr(settings, "METRICS_SYNC_BATCH_SIZE", 200)),
+        accounts=accounts,
+    )
+    logger.info(f"Claimed {claimed} accounts due for metrics sync")
+    return {"claimed": claimed, "dispatch": reports}
+
 
 @shared_task
 def sync_all_accounts_metrics():
-    """Sync metrics for all active accounts."""
-    accounts = SocialAccount.objects.filter(status=SocialAccount.STATUS_ACTIVE)
-    for account in accounts:
+    """Sync metrics for all active accounts now, ignoring the schedule (manual full sync)."""
+    return _fan_out_active(
+        "metrics",
+        sync_accounts_metrics_batch,
+        chunk_size=int(getattr(settings, "METRICS_SYNC_BATCH_SIZE", 200)),
+    )
+
+
+def _fan_out_active(name, task, *, args_for=None, chunk_size=None, accounts=None):
+    """Dispatch ``task`` over ``accounts`` (default: all active), one fan-out per platform sub-queue.
+
+    Chunks hold accounts of a single platform and are spread over
+    FANOUT_WINDOWS[name]; ``args_for(platform)`` gives the arguments before
+    the id list. Returns {platform: report}.
+    """
+    if accounts is None:
+        accounts = SocialAccount.objects.filter(status=SocialAccount.STATUS_ACTIVE)
+    reports = {}
+    for platform, _ in SocialAccount.PLATFORM_CHOICES:
+        report = fan_out(
+            f"{name}:{platform}",
+            accounts.filter(platform=platform),
+            task,
+            args=args_for(platform) if args_for else (),
+            chunk_size=chunk_size or int(getattr(settings, "FANOUT_CHUNK_SIZE", 50)),
+            window=float(getattr(settings, "FANOUT_WINDOWS", {}).get(name, 0)),
+            jitter=float(getattr(settings, "FANOUT_JITTER", 0)),
+            queue=queue_for(task.name, platform),
+        )
+        reports[platform] = report.as_dict()
+    return reports
+
+
+def _snapshot_heartbeat():
+    return timedelta(seconds=int(getattr(settings, "METRICS_SNAPSHOT_HEARTBEAT", 3600)))
+
+
+def _build_metrics_snapshot(account, metrics):
+    return MetricsSnapshot(
+        social_account=account,
+        followers_count=metrics["followers"],
+        following_count=metrics["following"],
+        posts_count=metrics["posts"],
+        reach=metrics["reach"],
+        impressions=metrics["impressions"],
+        engagement_count=metrics["engagement"],
+        profile_views=metrics["profile_views"],
+    )
+
+
+@shared_task
+def sync_accounts_metrics_batch(account_ids):
+    """Fetch metrics for many accounts concurrently and save them in one bulk insert."""
+    accounts = {
+        str(a.id): a
+        for a in SocialAccount.objects.select_related("oauth_token").filter(id__in=account_ids)
+    }
+
+    requests = []
+    for account_id, account in accounts.items():
         try:
-            sync_account_metrics.delay(str(account.id))
+            token = decrypt_token(account.oauth_token.access_token_enc)
         except Exception as e:
-            logger.error(f"Failed to queue metrics sync for {account}: {e}")
+            logger.error(f"Failed to load token for account {account_id}: {e}")
+            continue
+        requests.append(
+            MetricsRequest(
+                account_id=account_id,
+                platform=account.platform,
+                platform_user_id=account.platform_user_id,
+                access_token=token,
+            )
+        )
 
+    results = fetch_metrics(
+        requests,
+        concurrency=getattr(settings, "METRICS_SYNC_CONCURRENCY", None),
+        bulk=getattr(settings, "METRICS_SYNC_BULK_LOOKUP", True),
+    )
 
-@shared_task
-def sync_account_metrics(account_id):
+    snapshots = [
+        _build_metrics_snapshot(accounts[r.account_id], r.metrics)
+        for r in results
+        if r.metrics is not None
+    ]
+    recorded = record_snapshots(snapshots, heartbeat=_snapshot_heartbeat())
+    invalidate_accounts(s.social_account for s in recorded.written)
+    # Failed and deferred accounts keep their claim lease and come due again when it expires.
+    reschedule([s.social_account_id for s in snapshots], changed=recorded.changed)
+
+    # Accounts held back by the rate governor are requeued for exactly the
+    # reported delay instead of being counted as failures.
+    deferred = [r for r in results if r.retry_after is not None]
+    if deferred:
+        countdown = max(1, math.ceil(max(r.retry_after for r in deferred)))
+        platform = accounts[deferred[0].account_id].platform  # fan-out chunks hold one platform
+        sync_accounts_metrics_batch.apply_async(
+            args=([r.account_id for r in deferred],),
+            countdown=countdown,
+            queue=queue_for(sync_accounts_metrics_batch.name, platform),
+        )
+        logger.info(f"Deferred metrics sync for {len(deferred)} rate limited accounts by {countdown}s")
+
+    logger.info(
+        f"Synced metrics for {len(snapshots)}/{len(accounts)} accounts "
+        f"({len(recorded.written)} snapshots written, {len(recorded.unchanged)} unchanged)"
+    )
+    return {
+        "accounts": len(accounts),
+        "synced": len(snapshots),
+        "written": len(recorded.written),
+        "deferred": len(deferred),
+        "failed": len(accounts) - len(snapshots) - len(deferred),
+    }
+
+
+@shared_task(bind=True, max_retries=RATE_LIMIT_MAX_RETRIES)
+def sync_account_metrics(self, account_id):
     """Fetch and save current metrics for a single account."""
     try:
-        account = SocialAccount.objects.get(id=account_id)
+        account = SocialAccount.objects.select_related("oauth_token").get(id=account_id)
         token = decrypt_token(account.oauth_token.access_token_enc)
 
-        # Fetch metrics based on platform
-        if account.platform == SocialAccount.PLATFORM_INSTAGRAM:
-            client = InstagramAPIClient(token)
-            account_info = client.get_account_info(account.platform_user_id)
-            insights = client.get_insights(
-                account.platform_user_id,
-                metrics=["reach", "impressions", "profile_views"],
-                period="day"
-            )
-
-            metrics = {
-                "followers": account_info.get("followers_count", 0),
-                "following": account_info.get("follows_count", 0),
-                "posts": account_info.get("media_count", 0),
-                "reach": insights.get("reach", 0),
-                "impressions": insights.get("impressions", 0),
-                "profile_views": insights.get("profile_views", 0),
-                "engagement": 0,  # Calculated from posts
-            }
-
-        elif account.platform == SocialAccount.PLATFORM_TIKTOK:
-            client = TikTokAPIClient(token)
-            user_info = client.get_user_info()
-
-            metrics = {
-                "followers": user_info.get("follower_count", 0),
-                "following": user_info.get("following_count", 0),
-                "posts": user_info.get("video_count", 0),
-                "reach": 0,  # TikTok doesn't provide this in basic API
-                "impressions": 0,
-                "profile_views": 0,
-                "engagement": 0,
-            }
-
-        elif account.platform == SocialAccount.PLATFORM_LINKEDIN:
-            # LinkedIn API is more restricted, basic profile only
-            metrics = {
-                "followers": 0,  # Requires additional permissions
-                "following": 0,
-                "posts": 0,
-                "reach": 0,
-                "impressions": 0,
-                "profile_views": 0,
-                "engagement": 0,
-            }
-
-        elif account.platform == SocialAccount.PLATFORM_X:
-            client = XAPIClient(token)
-            user_info = client.get_me()
-            public_metrics = user_info.get("public_metrics", {})
-
-            metrics = {
-                "followers": public_metrics.get("followers_count", 0),
-                "following": public_metrics.get("following_count", 0),
-                "posts": public_metrics.get("tweet_count", 0),
-                "reach": 0,  # Calculated from tweets
-                "impressions": 0,
-                "profile_views": 0,
-                "engagement": 0,
-            }
-        else:
+        if account.platform not in CLIENTS:
             logger.warning(f"Unknown platform: {account.platform}")
             return
 
-        # Save snapshot
-        MetricsSnapshot.objects.create(
-            social_account=account,
-            followers_count=metrics["followers"],
-            following_count=metrics["following"],
-            posts_count=metrics["posts"],
-            reach=metrics["reach"],
-            impressions=metrics["impressions"],
-            engagement_count=metrics["engagement"],
-            profile_views=metrics["profile_views"],
-        )
+        client = get_client(account.platform, token)
+        metrics = client.fetch_account_metrics(account.platform_user_id).as_dict()
+
+        # Save snapshot (skipped when nothing changed)
+        recorded = record_snapshots([_build_metrics_snapshot(account, metrics)], heartbeat=_snapshot_heartbeat())
+        if recorded.written:
+            invalidate_accounts([account])
+        reschedule([account.id], changed=recorded.changed)
 
         logger.info(f"Synced metrics for {account}")
 
+    except PlatformAPIError as e:
+        countdown = _rate_limit_countdown(e)
+        if countdown is not None:
+            raise self.retry(exc=e, countdown=countdown)
+        logger.error(f"Failed to sync metrics for account {account_id}: {e}")
+        raise
+
     except Exception as e:
         logger.error(f"Failed to sync metrics for account {account_id}: {e}")
         raise
 
 
+@shared_task
+def rollup_metrics_snapshots():
+    """Fold MetricsSnapshot rows written since the last run into hourly/daily/weekly rollups."""
+    lock_key = "lock:rollup_metrics_snapshots"
+    if not cache.add(lock_key, "1", timeout=30 * 60):
+        return {"skipped": True, "reason": "lock_exists"}
+    try:
+        result = update_rollups()
+        if result["snapshots"]:
+            invalidate_rollups()
+        logger.info(f"Rolled up {result['snapshots']} metrics snapshots into {result['rollups_written']} rollup rows")
+        return result
+    finally:
+        cache.delete(lock_key)
+
+
+@shared_task
+def apply_data_retention():
+    """Delete rows past their retention window (see core.social.retention)."""
+    lock_key = "lock:apply_data_retention"
+    if not cache.add(lock_key, "1", timeout=6 * 60 * 60):
+        return {"skipped": True, "reason": "lock_exists"}
+    try:
+        reports = [r.as_dict() for r in apply_retention()]
+        for report in reports:
+            logger.info(f"Retention {report['policy']}: {report['rows']} rows reclaimed in {report['batches']} batches")
+        return reports
+    finally:
+        cache.delete(lock_key)
+
+
+@shared_task
+def maintain_partitions():
+    """Create upcoming monthly partitions for partitioned time-series tables."""
+    created = {}
+    for table in PARTITIONED_TABLES:
+        if is_partitioned(table):
+            created[table] = ensure_partitions(table)
+            if created[table]:
+                logger.info(f"Created partitions for {table}: {', '.join(created[table])}")
+    return created
+
+
 @shared_task
 def detect_all_follower_changes():
-    """Detect follower changes for all active accounts (aggregate delta only)."""
-    accounts = SocialAccount.objects.filter(status=SocialAccount.STATUS_ACTIVE)
-    for account in accounts:
-        try:
-            detect_follower_changes.delay(str(account.id))
-        except Exception as e:
-            logger.error(f"Failed to queue follower detection for {account}: {e}")
+    """Detect follower count deltas for all active accounts (aggregate delta only).
+
+    One streaming read of the last day of snapshots; latest-vs-previous deltas
+    are computed for every account at once (core.social.columnar). Snapshots
+    are only written on change, so an account whose latest snapshot predates
+    the previous run is unchanged.
+    """
+    now = timezone.now()
+    batch = load_snapshot_series(
+        ("followers_count",),
+        since=now - FOLLOWER_DELTA_LOOKBACK,
+        with_timestamps=True,
+        social_account__status=SocialAccount.STATUS_ACTIVE,
+    )
+    deltas = last_deltas(batch, "followers_count")
+    unchanged = batch.timestamps[batch.ends] < (now - FOLLOWER_DELTA_INTERVAL).timestamp()
+    deltas[unchanged] = 0
+
+    for account_id, delta in zip(batch.account_ids, deltas):
+        if delta > 0:
+            logger.info(f"Account {account_id} gained {int(delta)} followers")
+        elif delta < 0:
+            logger.info(f"Account {account_id} lost {int(-delta)} followers")
+
+    return {
+        "accounts": len(batch),
+        "gained": int(np.count_nonzero(deltas > 0)),
+        "lost": int(np.count_nonzero(deltas < 0)),
+        "unchanged": int(np.count_nonzero(unchanged)),
+        "not_enough_snapshots": int(np.count_nonzero(np.isnan(deltas))),
+    }
 
 
 @shared_task
@@ -138,9 +300,10 @@ def detect_follower_changes(account_id):
     try:
         account = SocialAccount.objects.get(id=account_id)
 
-        # Get current and previous follower counts
+        # Get current and previous follower counts (time bound prunes partitions)
         snapshots = MetricsSnapshot.objects.filter(
-            social_account=account
+            social_account=account,
+            timestamp__gte=timezone.now() - timedelta(days=7),
         ).order_by("-timestamp")[:2]
 
         if len(snapshots) < 2:
@@ -181,7 +344,11 @@ def sync_all_x_followers_identities():
         try:
             # Deterministic staggering: spread calls in a 0..300s window.
             delay = int(str(account.id).replace("-", ""), 16) % 300
-            sync_x_followers_identities.apply_async(args=[str(account.id)], countdown=delay)
+            sync_x_followers_identities.apply_async(
+                args=[str(account.id)],
+                countdown=delay,
+                queue=queue_for(sync_x_followers_identities.name, SocialAccount.PLATFORM_X),
+            )
         except Exception as e:
             logger.error(f"Failed to queue X followers identity sync for {account}: {e}")
 
@@ -192,7 +359,8 @@ def sync_x_followers_identities(self, account_id: str):
 
     - Guarded by a cache lock to prevent overlap.
     - Uses per-account caps configured on SocialAccount.
-    - Retries are used for transient errors (e.g., rate limits).
+    - Retries are used for transient errors (e.g., rate limits); progress is
+      checkpointed per page, so a retry resumes pagination where it stopped.
     """
     lock_key = _x_identity_lock_key(account_id)
 
@@ -216,6 +384,8 @@ def sync_x_followers_identities(self, account_id: str):
             identity_unfollowers_last_run_at=timezone.now(),
             identity_unfollowers_last_error="",
         )
+        if result.new_followers or result.unfollowers:
+            invalidate_accounts([account])
 
         logger.info(
             "X follower identity sync ok",
@@ -225,6 +395,11 @@ def sync_x_followers_identities(self, account_id: str):
                 "fetched_users": result.fetched_users,
                 "new_followers": result.new_followers,
                 "unfollowers": result.unfollowers,
+                "profiles_written": result.profiles_written,
+                "profiles_unchanged": result.profiles_unchanged,
+                "complete": result.complete,
+                "resumed": result.resumed,
+                "pages_fetched": result.pages_fetched,
             },
         )
 
@@ -234,15 +409,17 @@ def sync_x_followers_identities(self, account_id: str):
             "fetched_users": result.fetched_users,
             "new_followers": result.new_followers,
             "unfollowers": result.unfollowers,
+            "complete": result.complete,
         }
 
     except XApiError as exc:
         msg = str(exc)
         SocialAccount.objects.filter(id=account_id).update(identity_unfollowers_last_error=msg)
 
-        # Backoff on X rate limits.
-        if "429" in msg or "rate limit" in msg.lower():
-            raise self.retry(exc=exc, countdown=60 * 15)
+        # Wait exactly until the X window (or governor budget) resets.
+        countdown = _rate_limit_countdown(exc, default=60 * 15)
+        if countdown is not None:
+            raise self.retry(exc=exc, countdown=countdown, max_retries=RATE_LIMIT_MAX_RETRIES)
         raise
 
     except SocialAccount.DoesNotExist:
@@ -258,90 +435,63 @@ def sync_x_followers_identities(self, account_id: str):
         cache.delete(lock_key)
 
 
+TOP_CONTENT_UPDATE_FIELDS = [
+    "post_url", "caption", "media_type", "likes_count", "comments_count", "shares_count",
+    "saves_count", "reach", "engagement_rate", "posted_at", "last_updated",
+]
+
+
+def _top_content_upserter():
+    return BulkUpserter(
+        TopContent,
+        unique_fields=["social_account", "platform_post_id"],
+        update_fields=TOP_CONTENT_UPDATE_FIELDS,
+    )
+
+
 @shared_task
 def update_all_top_content():
-    """Update top content for all active accounts."""
-    accounts = SocialAccount.objects.filter(status=SocialAccount.STATUS_ACTIVE)
-    for account in accounts:
-        try:
-            update_top_content.delay(str(account.id))
-        except Exception as e:
-            logger.error(f"Failed to queue top content update for {account}: {e}")
+    """Update top content for all active accounts, in chunks of FANOUT_CHUNK_SIZE."""
+    return _fan_out_active(
+        "top_content", run_account_chunk, args_for=lambda platform: ("update_top_content", platform)
+    )
 
 
-@shared_task
-def update_top_content(account_id):
+@shared_task(bind=True, max_retries=RATE_LIMIT_MAX_RETRIES)
+def update_top_content(self, account_id):
     """Fetch recent posts and update performance metrics."""
     try:
         account = SocialAccount.objects.get(id=account_id)
         token = decrypt_token(account.oauth_token.access_token_enc)
 
-        if account.platform == SocialAccount.PLATFORM_INSTAGRAM:
-            client = InstagramAPIClient(token)
-            media_list = client.get_media(account.platform_user_id, limit=50)
-
-            for media in media_list:
-                media_id = media["id"]
-                insights = client.get_media_insights(media_id)
-
-                engagement = (
-                    media.get("like_count", 0) +
-                    media.get("comments_count", 0)
-                )
-                reach = insights.get("reach", 1)
-                engagement_rate = (engagement / reach * 100) if reach > 0 else 0
-
-                TopContent.objects.update_or_create(
-                    social_account=account,
-                    platform_post_id=media_id,
-                    defaults={
-                        "post_url": media["permalink"],
-                        "caption": media.get("caption", ""),
-                        "media_type": media["media_type"].lower(),
-                        "likes_count": media.get("like_count", 0),
-                        "comments_count": media.get("comments_count", 0),
-                        "shares_count": 0,  # Instagram doesn't expose shares
-                        "saves_count": insights.get("saved", 0),
-                        "reach": reach,
-                        "engagement_rate": engagement_rate,
-                        "posted_at": media["timestamp"],
-                    },
-                )
-
-        elif account.platform == SocialAccount.PLATFORM_X:
-            client = XAPIClient(token)
-            tweets = client.get_user_tweets(account.platform_user_id, max_results=50)
-
-            for tweet in tweets:
-                metrics = tweet.get("public_metrics", {})
-                engagement = (
-                    metrics.get("like_count", 0) +
-                    metrics.get("retweet_count", 0) +
-                    metrics.get("reply_count", 0)
-                )
-
-                # X doesn't provide reach in basic API, use impressions as proxy
-                impressions = metrics.get("impression_count", 1)
-                engagement_rate = (engagement / impressions * 100) if impressions > 0 else 0
-
-                TopContent.objects.update_or_create(
-                    social_account=account,
-                    platform_post_id=tweet["id"],
-                    defaults={
-                        "post_url": f"https://twitter.com/i/web/status/{tweet['id']}" ,
-                        "caption": tweet["text"],
-                        "media_type": "tweet",
-                        "likes_count": metrics.get("like_count", 0),
-                        "comments_count": metrics.get("reply_count", 0),
-                        "shares_count": metrics.get("retweet_count", 0),
-                        "saves_count": 0,
-                        "reach": impressions,
-                        "engagement_rate": engagement_rate,
-                        "posted_at": tweet["created_at"],
-                    },
-                )
-
-        logger.info(f"Updated top content for {account}")
+        upserter = _top_content_upserter()
+        if account.platform in (SocialAccount.PLATFORM_INSTAGRAM, SocialAccount.PLATFORM_X):
+            client = get_client(account.platform, token)
+            with upserter:
+                for post in client.recent_posts(account.platform_user_id, limit=50):
+                    upserter.add(
+                        TopContent(
+                            social_account=account,
+                            platform_post_id=post.platform_post_id,
+                            **post.top_content_defaults(),
+                        )
+                    )
+
+        result = upserter.result
+        if result.inserted or result.updated:
+            refresh_rankings(account.id)
+            invalidate_accounts([account])
+        logger.info(
+            f"Updated top content for {account}: {result.inserted} inserted, "
+            f"{result.updated} updated, {result.unchanged} unchanged"
+        )
+        return result.as_dict()
+
+    except PlatformAPIError as e:
+        countdown = _rate_limit_countdown(e)
+        if countdown is not None:
+            raise self.retry(exc=e, countdown=countdown)
+        logger.error(f"Failed to update top content for {account_id}: {e}")
 
     except Exception as e:
         logger.error(f"Failed to update top content for {account_id}: {e}")
@@ -349,24 +499,21 @@ def update_top_content(account_id):
 
 @shared_task
 def fetch_all_audience_insights():
-    """Fetch audience insights for all active accounts."""
-    accounts = SocialAccount.objects.filter(status=SocialAccount.STATUS_ACTIVE)
-    for account in accounts:
-        try:
-            fetch_audience_insights.delay(str(account.id))
-        except Exception as e:
-            logger.error(f"Failed to queue audience insights for {account}: {e}")
+    """Fetch audience insights for all active accounts, in chunks of FANOUT_CHUNK_SIZE."""
+    return _fan_out_active(
+        "audience_insights", run_account_chunk, args_for=lambda platform: ("fetch_audience_insights", platform)
+    )
 
 
-@shared_task
-def fetch_audience_insights(account_id):
+@shared_task(bind=True, max_retries=RATE_LIMIT_MAX_RETRIES)
+def fetch_audience_insights(self, account_id):
     """Fetch audience demographics and activity patterns."""
     try:
         account = SocialAccount.objects.get(id=account_id)
         token = decrypt_token(account.oauth_token.access_token_enc)
 
         if account.platform == SocialAccount.PLATFORM_INSTAGRAM:
-            client = InstagramAPIClient(token)
+            client = InstagramClient(token)
             audience_data = client.get_audience_insights(account.platform_user_id)
 
             AudienceInsight.objects.update_or_create(
@@ -381,8 +528,49 @@ def fetch_audience_insights(account_id):
                     "active_days": [],
                 },
             )
+            invalidate_accounts([account])
 
         logger.info(f"Fetched audience insights for {account}")
 
+    except PlatformAPIError as e:
+        countdown = _rate_limit_countdown(e)
+        if countdown is not None:
+            raise self.retry(exc=e, countdown=countdown)
+        logger.error(f"Failed to fetch audience insights for {account_id}: {e}")
+
     except Exception as e:
         logger.error(f"Failed to fetch audience insights for {account_id}: {e}")
+
+
+# Per-account tasks that run_account_chunk may execute.
+CHUNK_TASKS = {
+    "update_top_content": update_top_content,
+    "fetch_audience_insights": fetch_audience_insights,
+}
+
+
+@shared_task
+def run_account_chunk(task_name, platform, account_ids):
+    """Run a per-account task in this worker for every account of a fan-out chunk.
+
+    One message covers the whole chunk (accounts of one ``platform``). Rate
+    limited accounts are requeued individually to the platform's sub-queue
+    for the reported delay; other failures are logged and do not stop the
+    rest of the chunk.
+    """
+    task = CHUNK_TASKS[task_name]
+    done = deferred = failed = 0
+    for account_id in account_ids:
+        try:
+            # Called directly: self.retry() re-raises the original error here.
+            task(account_id)
+            done += 1
+        except Exception as e:
+            countdown = _rate_limit_countdown(e)
+            if countdown is not None:
+                task.apply_async(args=(account_id,), countdown=countdown, queue=queue_for(task.name, platform))
+                deferred += 1
+            else:
+                failed += 1
+                logger.error(f"{task_name} failed for {account_id}: {e}")
+    return {"accounts": len(account_ids), "done": done, "deferred": deferred, "failed": failed}
@@ -0,0 +1,138 @@
+import random
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.social.follower_diff import sorted_ids
+from core.social.follower_store import load_latest_ids, save_snapshot
+from core.social.follower_sync import sync_x_followers_snapshot
+from core.social.models import (
+    FollowerChange,
+    FollowerSyncCheckpoint,
+    OAuthToken,
+    SocialAccount,
+)
+from core.social.x_api import XApiError, XFollowersPage
+from core.workspaces.models import Workspace
+
+
+class FakeXFollowers:
+    """Paged GET /2/users/:id/followers that answers 429 once at each page in ``fail_at``.
+
+    Pagination tokens are "page-<n>"; ``requested`` records the token of every call.
+    """
+
+    def __init__(self, follower_ids, page_size, fail_at=()):
+        self.follower_ids = [str(uid) for uid in follower_ids]
+        self.page_size = page_size
+        self.fail_at = set(fail_at)
+        self.requested = []
+
+    def __call__(self, *, platform_user_id, access_token, pagination_token=None, max_results=1000, timeout=30):
+        self.requested.append(pagination_token)
+        page = int(pagination_token.split("-")[1]) if pagination_token else 0
+        if page in self.fail_at:
+            self.fail_at.discard(page)
+            raise XApiError("Too Many Requests", status_code=429, retry_after=900)
+
+        start = page * self.page_size
+        users = [
+            {"id": uid, "username": f"user{uid}", "public_metrics": {"followers_count": 1}}
+            for uid in self.follower_ids[start:start + self.page_size]
+        ]
+        more = start + self.page_size < len(self.follower_ids)
+        return XFollowersPage(users=users, next_token=f"page-{page + 1}" if more else None)
+
+
+class XFollowerSyncResumeTests(TestCase):
+    PAGE_SIZE = 10
+
+    def setUp(self):
+        owner = User.objects.create_user(username="owner", password="x")
+        workspace = Workspace.objects.create(name="Test", owner=owner)
+        self.account = SocialAccount.objects.create(
+            workspace=workspace,
+            platform=SocialAccount.PLATFORM_X,
+            handle="brand",
+            platform_user_id="42",
+            status=SocialAccount.STATUS_ACTIVE,
+        )
+        OAuthToken.objects.create(social_account=self.account, access_token_enc="plain-token", scopes="")
+
+        # Previous snapshot: 1..100. Current list: 11..125 (10 unfollowers, 25 new followers).
+        self.previous = list(range(1, 101))
+        self.current = list(range(11, 126))
+        save_snapshot(str(self.account.id), sorted_ids(self.previous))
+
+    def _sync(self, server, **kwargs):
+        with mock.patch("core.social.follower_sync.get_x_followers_page", server):
+            return sync_x_followers_snapshot(
+                social_account_id=str(self.account.id), page_size=self.PAGE_SIZE, **kwargs
+            )
+
+    def _changes(self, change_type):
+        return sorted(
+            int(uid)
+            for uid in FollowerChange.objects.filter(
+                social_account=self.account, change_type=change_type
+            ).values_list("user_id", flat=True)
+        )
+
+    def _checkpoint(self):
+        return FollowerSyncCheckpoint.objects.get(social_account_id=self.account.id)
+
+    def test_resumes_after_429_at_random_pages(self):
+        pages = -(-len(self.current) // self.PAGE_SIZE)
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                FollowerChange.objects.filter(social_account=self.account).delete()
+                save_snapshot(str(self.account.id), sorted_ids(self.previous))
+                fail_at = random.Random(seed).sample(range(pages), 3)
+                server = FakeXFollowers(self.current, self.PAGE_SIZE, fail_at=fail_at)
+
+                result = None
+                resumed_from = None
+                for _ in range(len(fail_at) + 1):
+                    calls = len(server.requested)
+                    try:
+                        result = self._sync(server)
+                        break
+                    except XApiError as exc:
+                        self.assertEqual(exc.status_code, 429)
+                        # Partial snapshot: nothing is reported as an unfollower yet.
+                        self.assertEqual(self._changes(FollowerChange.TYPE_UNFOLLOWER), [])
+                        checkpoint = self._checkpoint()
+                        failed_token = server.requested[-1]
+                        self.assertEqual(checkpoint.next_token or None, failed_token)
+                        if calls:
+                            # A retry starts from the checkpoint, never from page 0.
+                            self.assertEqual(server.requested[calls], resumed_from)
+                        resumed_from = failed_token
+
+                self.assertIsNotNone(result)
+                self.assertTrue(result.complete)
+                self.assertTrue(result.resumed)
+                # Each page was fetched once, plus one request per injected 429.
+                self.assertEqual(len(server.requested), pages + len(fail_at))
+                self.assertEqual(self._changes(FollowerChange.TYPE_UNFOLLOWER), list(range(1, 11)))
+                self.assertEqual(self._changes(FollowerChange.TYPE_NEW_FOLLOWER), list(range(101, 126)))
+                self.assertEqual(list(load_latest_ids(str(self.account.id))), self.current)
+                self.assertFalse(FollowerSyncCheckpoint.objects.filter(social_account_id=self.account.id).exists())
+
+    def test_max_pages_leaves_partial_snapshot_without_unfollowers(self):
+        server = FakeXFollowers(self.current, self.PAGE_SIZE)
+
+        result = self._sync(server, max_pages=5)
+        self.assertFalse(result.complete)
+        self.assertEqual(result.unfollowers, 0)
+        self.assertEqual(self._changes(FollowerChange.TYPE_UNFOLLOWER), [])
+        self.assertEqual(self._checkpoint().next_token, "page-5")
+        self.assertEqual(list(load_latest_ids(str(self.account.id))), self.previous)
+
+        result = self._sync(server, max_pages=50)
+        self.assertTrue(result.complete)
+        self.assertTrue(result.resumed)
+        self.assertEqual(server.requested[5], "page-5")
+        self.assertEqual(self._changes(FollowerChange.TYPE_UNFOLLOWER), list(range(1, 11)))
+        self.assertEqual(self._changes(FollowerChange.TYPE_NEW_FOLLOWER), list(range(101, 126)))
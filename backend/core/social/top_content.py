@@ -0,0 +1,67 @@
+"""Cached top-K rankings for the top_content endpoint.
+
+Each sort mode has a composite index (social_account, -metric) on
+top_content, so computing a ranking reads K index entries. The K best posts
+per account and mode are cached as serialized rows; ``update_top_content``
+refreshes them after it writes, and a missing entry is computed on first
+read. The endpoint then costs O(K) however many posts an account has.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from django.core.cache import cache
+
+from core.social.models import TopContent
+
+SORT_MODES = ("engagement_rate", "likes_count", "reach")
+DEFAULT_SORT = "engagement_rate"
+TOP_K = 50
+RANKING_TTL = 2 * 24 * 60 * 60  # top content is refreshed daily
+
+
+def ranking_cache_key(account_id, sort_by: str) -> str:
+    return f"top_content:{account_id}:{sort_by}"
+
+
+def _serialize(post: TopContent) -> Dict[str, Any]:
+    return {
+        "id": str(post.id),
+        "platform_post_id": post.platform_post_id,
+        "post_url": post.post_url,
+        "caption": post.caption[:200] if post.caption else "",
+        "media_type": post.media_type,
+        "likes": post.likes_count,
+        "comments": post.comments_count,
+        "shares": post.shares_count,
+        "saves": post.saves_count,
+        "reach": post.reach,
+        "engagement_rate": post.engagement_rate,
+        "posted_at": post.posted_at.isoformat(),
+    }
+
+
+def compute_ranking(account_id, sort_by: str) -> List[Dict[str, Any]]:
+    posts = TopContent.objects.filter(social_account_id=account_id).order_by(f"-{sort_by}", "-posted_at")[:TOP_K]
+    return [_serialize(post) for post in posts]
+
+
+def refresh_rankings(account_id) -> None:
+    """Recompute and cache the top-K list of every sort mode for the account."""
+    cache.set_many(
+        {ranking_cache_key(account_id, mode): compute_ranking(account_id, mode) for mode in SORT_MODES},
+        timeout=RANKING_TTL,
+    )
+
+
+def top_posts(account_id, sort_by: str, limit: int) -> List[Dict[str, Any]]:
+    """Best ``limit`` (<= TOP_K) posts of the account by ``sort_by`` (one of SORT_MODES)."""
+    if sort_by not in SORT_MODES:
+        raise ValueError(f"Unsupported sort_by: {sort_by}")
+    key = ranking_cache_key(account_id, sort_by)
+    ranking = cache.get(key)
+    if ranking is None:
+        ranking = compute_ranking(account_id, sort_by)
+        cache.set(key, ranking, timeout=RANKING_TTL)
+    return ranking[:limit]
@@ -14,7 +14,14 @@ urlpatterns = [
     
     # Analytics endpoints
     path("analytics/dashboard/<uuid:workspace_id>", analytics.dashboard_metrics, name="dashboard_metrics"),
+    path("analytics/workspace-query/<uuid:workspace_id>", analytics.workspace_query, name="workspace_query"),
+    path("analytics/metrics-trend/<uuid:account_id>", analytics.metrics_trend, name="metrics_trend"),
     path("analytics/follower-changes/<uuid:account_id>", analytics.follower_changes, name="follower_changes"),
+    path(
+        "analytics/follower-changes/<uuid:account_id>/export",
+        analytics.follower_changes_export,
+        name="follower_changes_export",
+    ),
     path("analytics/top-content/<uuid:account_id>", analytics.top_content, name="top_content"),
     path("analytics/audience-insights/<uuid:account_id>", analytics.audience_insights, name="audience_insights"),
 ]
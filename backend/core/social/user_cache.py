@@ -0,0 +1,95 @@
+"""Bulk per-user enrichment cache for follower sync.
+
+When an unfollower is detected the platform no longer returns that user in the
+followers list, so the username/avatar shown in FollowerChange rows comes from
+this cache, written while the user was still a follower.
+
+Entries use a slim fixed schema (no raw API payload) and are read and written
+in batches (``get_many``/``set_many``, pipelined by django-redis) instead of one
+round trip per user. A short content hash stored with each entry lets
+unchanged users be skipped; entries are still rewritten once they are older
+than half their TTL so active followers never expire.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.core.cache import cache
+
+PROFILE_FIELDS = ("username", "profile_image_url", "verified", "followers_count")
+
+
+def user_cache_key(platform: str, user_id: str) -> str:
+    return f"user:{platform}:{user_id}"
+
+
+def slim_x_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an X API user object to the cached enrichment schema."""
+    public_metrics = user.get("public_metrics") or {}
+    return {
+        "username": user.get("username") or "",
+        "profile_image_url": user.get("profile_image_url"),
+        "verified": bool(user.get("verified", False)),
+        "followers_count": public_metrics.get("followers_count"),
+    }
+
+
+def _profile_hash(profile: Dict[str, Any]) -> str:
+    payload = "\x1f".join(str(profile.get(f)) for f in PROFILE_FIELDS)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def write_user_profiles(
+    platform: str,
+    profiles: Dict[Any, Dict[str, Any]],
+    *,
+    ttl_seconds: int,
+    batch_size: int = 1000,
+) -> Tuple[int, int]:
+    """Cache ``{user_id: profile}``; returns ``(written, unchanged)``."""
+    written = 0
+    unchanged = 0
+    now = int(time.time())
+    refresh_before = now - ttl_seconds // 2
+
+    for batch in _chunks(list(profiles.items()), batch_size):
+        keys = {user_cache_key(platform, str(uid)): profile for uid, profile in batch}
+        existing = cache.get_many(list(keys))
+
+        to_write: Dict[str, Dict[str, Any]] = {}
+        for key, profile in keys.items():
+            h = _profile_hash(profile)
+            old = existing.get(key)
+            if isinstance(old, dict) and old.get("h") == h and old.get("t", 0) >= refresh_before:
+                unchanged += 1
+                continue
+            entry = {f: profile.get(f) for f in PROFILE_FIELDS}
+            entry["h"] = h
+            entry["t"] = now
+            to_write[key] = entry
+
+        if to_write:
+            cache.set_many(to_write, timeout=ttl_seconds)
+            written += len(to_write)
+
+    return written, unchanged
+
+
+def read_user_profiles(platform: str, user_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    """Fetch cached profiles for ``user_ids`` with a single ``get_many``.
+
+    Returns ``{str(user_id): profile}``; users not in the cache are omitted.
+    """
+    keys = {user_cache_key(platform, str(uid)): str(uid) for uid in user_ids}
+    if not keys:
+        return {}
+    found = cache.get_many(list(keys))
+    return {keys[k]: v for k, v in found.items() if isinstance(v, dict)}
@@ -1,12 +1,34 @@
+import csv
+import itertools
+import json
+import uuid
 from datetime import datetime, timedelta
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.db.models import Sum, Avg, F, Q
-from core.social.models import SocialAccount, MetricsSnapshot, FollowerChange, TopContent, AudienceInsight
+from django.utils import timezone
+from core.social.models import SocialAccount, FollowerChange, AudienceInsight, MetricsRollup
+from core.social.follower_changes import (
+    DEFAULT_PAGE_SIZE,
+    EXPORT_FIELDS,
+    MAX_PAGE_SIZE,
+    change_counts_since,
+    change_total,
+    decode_cursor,
+    encode_cursor,
+    iter_follower_changes,
+    page_follower_changes,
+)
+from core.social.response_cache import cached_response
+from core.social.rollups import ROLLUP_METRICS, choose_granularity, trend_series
+from core.social.top_content import DEFAULT_SORT, SORT_MODES, TOP_K, top_posts
+from core.social.workspace_query import QueryError, QuerySpec, run_query
 from core.workspaces.models import Workspace
 
 
 @require_http_methods(["GET"])
+@cached_response("dashboard", "workspace")
 def dashboard_metrics(request, workspace_id):
     """
     Get aggregated metrics for all accounts in workspace.
@@ -25,25 +47,36 @@ def dashboard_metrics(request, workspace_id):
         "90d": timedelta(days=90),
     }
     delta = timeframe_map.get(timeframe, timedelta(hours=24))
-    since = datetime.now() - delta
+    since = timezone.now() - delta
 
     accounts = SocialAccount.objects.filter(workspace=workspace, status=SocialAccount.STATUS_ACTIVE)
-    
-    # Get latest snapshot for each account
-    latest_snapshots = []
-    for account in accounts:
-        snapshot = MetricsSnapshot.objects.filter(social_account=account).first()
-        if snapshot:
-            latest_snapshots.append({
-                "account_id": str(account.id),
-                "platform": account.platform,
-                "handle": account.handle,
-                "followers": snapshot.followers_count,
-                "reach": snapshot.reach,
-                "impressions": snapshot.impressions,
-                "engagement": snapshot.engagement_count,
-                "profile_views": snapshot.profile_views,
-            })
+
+    # Latest metrics for every account in one query (LatestMetrics join)
+    rows = list(
+        accounts.filter(latest_metrics__isnull=False).values(
+            "id",
+            "platform",
+            "handle",
+            "latest_metrics__followers_count",
+            "latest_metrics__reach",
+            "latest_metrics__impressions",
+            "latest_metrics__engagement_count",
+            "latest_metrics__profile_views",
+        )
+    )
+    latest_snapshots = [
+        {
+            "account_id": str(row["id"]),
+            "platform": row["platform"],
+            "handle": row["handle"],
+            "followers": row["latest_metrics__followers_count"],
+            "reach": row["latest_metrics__reach"],
+            "impressions": row["latest_metrics__impressions"],
+            "engagement": row["latest_metrics__engagement_count"],
+            "profile_views": row["latest_metrics__profile_views"],
+        }
+        for row in rows
+    ]
 
     # Aggregate totals
     total_followers = sum(s["followers"] for s in latest_snapshots)
@@ -51,18 +84,10 @@ def dashboard_metrics(request, workspace_id):
     total_impressions = sum(s["impressions"] for s in latest_snapshots)
     total_engagement = sum(s["engagement"] for s in latest_snapshots)
 
-    # Follower changes in timeframe
-    new_followers_count = FollowerChange.objects.filter(
-        social_account__workspace=workspace,
-        change_type=FollowerChange.TYPE_NEW_FOLLOWER,
-        timestamp__gte=since,
-    ).count()
-
-    unfollowers_count = FollowerChange.objects.filter(
-        social_account__workspace=workspace,
-        change_type=FollowerChange.TYPE_UNFOLLOWER,
-        timestamp__gte=since,
-    ).count()
+    # Follower changes in timeframe (per-day counters + exact count of the partial first day)
+    change_counts = change_counts_since(since, social_account__workspace=workspace)
+    new_followers_count = change_counts.get(FollowerChange.TYPE_NEW_FOLLOWER, 0)
+    unfollowers_count = change_counts.get(FollowerChange.TYPE_UNFOLLOWER, 0)
 
     net_followers = new_followers_count - unfollowers_count
 
@@ -76,6 +101,7 @@ def dashboard_metrics(request, workspace_id):
             "engagement": total_engagement,
         },
         "follower_changes": {
+            "since": since.isoformat(),
             "new_followers": new_followers_count,
             "unfollowers": unfollowers_count,
             "net_change": net_followers,
@@ -83,11 +109,92 @@ def dashboard_metrics(request, workspace_id):
     })
 
 
+TREND_TIMEFRAMES = {
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+    "90d": timedelta(days=90),
+    "1y": timedelta(days=365),
+}
+
+
+@require_http_methods(["GET"])
+@cached_response("metrics_trend", "account", rollups=True)
+def metrics_trend(request, account_id):
+    """
+    Get a metric time series from the pre-aggregated rollups.
+    Query params: metric (followers_count, reach, impressions, engagement_count, profile_views),
+    timeframe (24h, 7d, 30d, 90d, 1y), granularity (hour, day, week; default: coarsest
+    rollup that still gives enough points for the timeframe)
+    """
+    try:
+        account = SocialAccount.objects.get(id=account_id)
+    except SocialAccount.DoesNotExist:
+        return JsonResponse({"error": "Account not found"}, status=404)
+
+    metric = request.GET.get("metric", "followers_count")
+    if metric not in ROLLUP_METRICS:
+        return JsonResponse({"error": f"Unsupported metric: {metric}"}, status=400)
+
+    timeframe = request.GET.get("timeframe", "30d")
+    delta = TREND_TIMEFRAMES.get(timeframe, TREND_TIMEFRAMES["30d"])
+    until = timezone.now()
+    since = until - delta
+
+    granularity = request.GET.get("granularity") or choose_granularity(delta)
+    if granularity not in dict(MetricsRollup.GRANULARITY_CHOICES):
+        return JsonResponse({"error": f"Unsupported granularity: {granularity}"}, status=400)
+
+    return JsonResponse({
+        "account_id": str(account.id),
+        "platform": account.platform,
+        "handle": account.handle,
+        "metric": metric,
+        "timeframe": timeframe,
+        "granularity": granularity,
+        "series": trend_series(account.id, metric, since, until, granularity),
+    })
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def workspace_query(request, workspace_id):
+    """
+    Run a cross-account analytics query for the workspace.
+    Body: QuerySpec JSON (source, metrics, group_by, since/until or timeframe,
+    filters, order_by, limit, deltas); see core.social.workspace_query
+    """
+    if not Workspace.objects.filter(id=workspace_id).exists():
+        return JsonResponse({"error": "Workspace not found"}, status=404)
+
+    try:
+        data = json.loads(request.body)
+        if not isinstance(data, dict):
+            raise QueryError("Query spec must be a JSON object")
+        if data.get("timeframe") and not data.get("since"):
+            delta = TREND_TIMEFRAMES.get(data["timeframe"]) if isinstance(data["timeframe"], str) else None
+            if delta is None:
+                raise QueryError(f"Unsupported timeframe: {data['timeframe']}")
+            data["since"] = (timezone.now() - delta).isoformat()
+        spec = QuerySpec.from_dict(data)
+        rows = run_query(workspace_id, spec)
+    except (json.JSONDecodeError, QueryError) as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    return JsonResponse({
+        "workspace_id": str(workspace_id),
+        "source": spec.source,
+        "rows": rows,
+    })
+
+
 @require_http_methods(["GET"])
+@cached_response("follower_changes", "account")
 def follower_changes(request, account_id):
     """
-    Get detailed follower/unfollower list.
-    Query params: type (new_follower, unfollower), limit (default 50), offset (default 0)
+    Get detailed follower/unfollower list, newest first (keyset pagination).
+    Query params: type (new_follower, unfollower), limit (default 50, max 500),
+    cursor (next_cursor from the previous page), offset (deprecated, use cursor)
     """
     try:
         account = SocialAccount.objects.get(id=account_id)
@@ -95,86 +202,139 @@ def follower_changes(request, account_id):
         return JsonResponse({"error": "Account not found"}, status=404)
 
     change_type = request.GET.get("type", FollowerChange.TYPE_NEW_FOLLOWER)
-    limit = int(request.GET.get("limit", 50))
-    offset = int(request.GET.get("offset", 0))
+    if change_type not in dict(FollowerChange.TYPE_CHOICES):
+        return JsonResponse({"error": f"Unsupported type: {change_type}"}, status=400)
 
-    changes = FollowerChange.objects.filter(
-        social_account=account,
-        change_type=change_type,
-    )[offset:offset + limit]
+    try:
+        limit = min(max(int(request.GET.get("limit", DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        cursor = request.GET.get("cursor")
+        after = decode_cursor(cursor) if cursor else None
+        # Deprecated: kept for one release so offset clients keep working while they move to cursor.
+        offset = int(request.GET.get("offset", 0))
+        if offset < 0:
+            raise ValueError
+    except ValueError:
+        return JsonResponse({"error": "Invalid limit, cursor or offset"}, status=400)
+    if offset and after is not None:
+        return JsonResponse({"error": "Pass either cursor or offset (deprecated), not both"}, status=400)
 
-    total_count = FollowerChange.objects.filter(
-        social_account=account,
-        change_type=change_type,
-    ).count()
+    rows, next_after = page_follower_changes(account.id, change_type, limit=limit, after=after, offset=offset)
 
     results = []
-    for change in changes:
+    for row in rows:
         results.append({
-            "id": str(change.id),
-            "user_id": change.user_id,
-            "username": change.username,
-            "profile_pic_url": change.profile_pic_url,
-            "verified": change.verified,
-            "follower_count": change.follower_count,
-            "timestamp": change.timestamp.isoformat(),
+            "id": str(row["id"]),
+            "user_id": row["user_id"],
+            "username": row["username"],
+            "profile_pic_url": row["profile_pic_url"],
+            "verified": row["verified"],
+            "follower_count": row["follower_count"],
+            "timestamp": row["timestamp"].isoformat(),
         })
 
-    return JsonResponse({
+    data = {
         "account_id": str(account.id),
         "platform": account.platform,
         "handle": account.handle,
         "change_type": change_type,
-        "total": total_count,
+        "total": change_total(account.id, change_type),
         "limit": limit,
-        "offset": offset,
+        "next_cursor": encode_cursor(*next_after) if next_after else None,
         "results": results,
-    })
+    }
+    if "offset" in request.GET:
+        data["offset"] = offset
+        data["deprecation"] = "offset is deprecated and will be removed; pass next_cursor as cursor instead"
+    return JsonResponse(data)
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
 
 
 @require_http_methods(["GET"])
-def top_content(request, account_id):
+def follower_changes_export(request, account_id):
     """
-    Get top-performing content.
-    Query params: limit (default 10), sort_by (engagement_rate, likes_count, reach)
+    Stream the full follower change history, newest first.
+    Query params: format (csv, ndjson; default csv), type (optional, default: all types)
     """
     try:
         account = SocialAccount.objects.get(id=account_id)
     except SocialAccount.DoesNotExist:
         return JsonResponse({"error": "Account not found"}, status=404)
 
-    limit = int(request.GET.get("limit", 10))
-    sort_by = request.GET.get("sort_by", "engagement_rate")
+    change_type = request.GET.get("type") or None
+    if change_type and change_type not in dict(FollowerChange.TYPE_CHOICES):
+        return JsonResponse({"error": f"Unsupported type: {change_type}"}, status=400)
 
-    content = TopContent.objects.filter(social_account=account).order_by(f"-{sort_by}")[:limit]
+    export_format = request.GET.get("format", "csv")
+    rows = iter_follower_changes(account.id, change_type)
 
-    results = []
-    for post in content:
-        results.append({
-            "id": str(post.id),
-            "platform_post_id": post.platform_post_id,
-            "post_url": post.post_url,
-            "caption": post.caption[:200] if post.caption else "",
-            "media_type": post.media_type,
-            "likes": post.likes_count,
-            "comments": post.comments_count,
-            "shares": post.shares_count,
-            "saves": post.saves_count,
-            "reach": post.reach,
-            "engagement_rate": post.engagement_rate,
-            "posted_at": post.posted_at.isoformat(),
-        })
+    if export_format == "csv":
+        writer = csv.writer(_Echo())
+        lines = itertools.chain(
+            [writer.writerow(EXPORT_FIELDS)],
+            (writer.writerow([_export_value(row[f]) for f in EXPORT_FIELDS]) for row in rows),
+        )
+        content_type = "text/csv"
+    elif export_format == "ndjson":
+        lines = (
+            json.dumps({f: _export_value(row[f]) for f in EXPORT_FIELDS}) + "\n"
+            for row in rows
+        )
+        content_type = "application/x-ndjson"
+    else:
+        return JsonResponse({"error": f"Unsupported format: {export_format}"}, status=400)
+
+    response = StreamingHttpResponse(lines, content_type=content_type)
+    response["Content-Disposition"] = (
+        f'attachment; filename="follower-changes-{account.id}.{export_format}"'
+    )
+    return response
+
+
+@require_http_methods(["GET"])
+@cached_response("top_content", "account")
+def top_content(request, account_id):
+    """
+    Get top-performing content.
+    Query params: limit (default 10, max 50), sort_by (engagement_rate, likes_count, reach)
+    """
+    try:
+        account = SocialAccount.objects.get(id=account_id)
+    except SocialAccount.DoesNotExist:
+        return JsonResponse({"error": "Account not found"}, status=404)
+
+    sort_by = request.GET.get("sort_by", DEFAULT_SORT)
+    if sort_by not in SORT_MODES:
+        return JsonResponse({"error": f"Unsupported sort_by: {sort_by}"}, status=400)
+    try:
+        limit = min(max(int(request.GET.get("limit", 10)), 1), TOP_K)
+    except ValueError:
+        return JsonResponse({"error": "Invalid limit"}, status=400)
 
     return JsonResponse({
         "account_id": str(account.id),
         "platform": account.platform,
         "handle": account.handle,
         "sort_by": sort_by,
-        "results": results,
+        "results": top_posts(account.id, sort_by, limit),
     })
 
 
 @require_http_methods(["GET"])
+@cached_response("audience_insights", "account")
 def audience_insights(request, account_id):
     """
     Get latest audience insights (demographics, activity patterns).
@@ -0,0 +1,310 @@
+"""Declarative workspace-wide analytics queries, compiled to SQL aggregates.
+
+A QuerySpec names a source table, aggregate metrics, group-by dimensions, a
+time range and filters. ``run_query`` compiles it to a single
+``values(...).annotate(...)`` query over the workspace's accounts (joined on
+the indexed social_account FK), so cross-account numbers for workspaces with
+hundreds of accounts come out of one GROUP BY instead of per-account Python
+loops.
+
+Sources:
+
+- ``accounts``: latest_metrics, the current values of each account
+- ``rollups``: metrics_rollups at the granularity of the time dimension
+  (hour/day/week, default day)
+- ``posts``: top_content; grouping by ``post`` returns rows, not aggregates
+- ``follower_changes``: follower_change_daily_counts
+
+Metrics are ``"<agg>:<field>"`` (agg: sum, avg, min, max), returned under
+the key ``<agg>_<field>``, or ``"count"`` (matching rows, key ``rows``). Example, follower growth by
+platform per day over 30 days::
+
+    QuerySpec(source="rollups", metrics=["sum:followers_count_last"],
+              group_by=["platform", "day"], since=now - timedelta(days=30),
+              deltas=True)
+"""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import Avg, Count, F, FloatField, Max, Min, Sum
+from django.db.models.functions import Trunc
+
+from core.social.models import (
+    FollowerChangeDailyCount,
+    LatestMetrics,
+    MetricsRollup,
+    SocialAccount,
+    TopContent,
+)
+from core.social.rollups import ROLLUP_METRICS
+
+AGGREGATES = {"sum": Sum, "avg": Avg, "min": Min, "max": Max}
+TIME_DIMENSIONS = ("hour", "day", "week", "month")
+MAX_ROWS = 1000
+
+_ACCOUNT_DIMENSIONS = {
+    "account": "social_account_id",
+    "handle": "social_account__handle",
+    "platform": "social_account__platform",
+}
+_ACCOUNT_FILTERS = {
+    "account": "social_account_id__in",
+    "platform": "social_account__platform__in",
+    "status": "social_account__status__in",
+}
+_UUID_FILTERS = {"account"}
+_FILTER_VALUE_TYPES = (str, int, float)
+
+
+class QueryError(ValueError):
+    """Invalid QuerySpec (unknown source, metric, dimension or filter)."""
+
+
+@dataclass(frozen=True)
+class Source:
+    model: Any
+    metrics: Tuple[str, ...]
+    time_field: Optional[str]
+    time_dimensions: Tuple[str, ...]
+    dimensions: Dict[str, str] = field(default_factory=dict)
+    filters: Dict[str, str] = field(default_factory=dict)
+    # Grouping by this dimension selects single rows: metrics are read as-is.
+    row_dimension: Optional[str] = None
+
+
+SOURCES: Dict[str, Source] = {
+    "accounts": Source(
+        model=LatestMetrics,
+        metrics=(
+            "followers_count", "following_count", "posts_count", "reach",
+            "impressions", "engagement_count", "profile_views",
+        ),
+        time_field="timestamp",
+        time_dimensions=(),
+        row_dimension="account",
+    ),
+    "rollups": Source(
+        model=MetricsRollup,
+        metrics=("samples",)
+        + tuple(f"{m}_{agg}" for m in ROLLUP_METRICS for agg in ("min", "max", "last", "sum")),
+        time_field="bucket_start",
+        time_dimensions=("hour", "day", "week"),
+    ),
+    "posts": Source(
+        model=TopContent,
+        metrics=(
+            "likes_count", "comments_count", "shares_count", "saves_count", "reach", "engagement_rate",
+        ),
+        time_field="posted_at",
+        time_dimensions=TIME_DIMENSIONS,
+        dimensions={"post": "id", "post_url": "post_url", "media_type": "media_type"},
+        filters={"media_type": "media_type__in"},
+        row_dimension="post",
+    ),
+    "follower_changes": Source(
+        model=FollowerChangeDailyCount,
+        metrics=("count",),
+        time_field="day",
+        time_dimensions=("day", "week", "month"),
+        dimensions={"change_type": "change_type"},
+        filters={"change_type": "change_type__in"},
+    ),
+}
+
+
+@dataclass
+class QuerySpec:
+    source: str
+    metrics: List[str]
+    group_by: List[str] = field(default_factory=list)
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    # {filter name: [values]}; accounts default to status=["active"]
+    filters: Dict[str, List[Any]] = field(default_factory=dict)
+    order_by: Optional[str] = None
+    limit: Optional[int] = None
+    # Add "<metric>_delta" (change from the previous time bucket of the same group)
+    deltas: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuerySpec":
+        if not isinstance(data, dict):
+            raise QueryError("Query spec must be a JSON object")
+
+        def when(key):
+            value = data.get(key)
+            if not value:
+                return None
+            parsed = datetime.fromisoformat(value)
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt_timezone.utc)
+
+        def names(key):
+            value = data.get(key) or []
+            if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                raise QueryError(f"{key} must be a list of strings")
+            return value
+
+        if not isinstance(data.get("source"), str):
+            raise QueryError("source must be a string")
+        metrics, group_by = names("metrics"), names("group_by")
+        filters = data.get("filters") or {}
+        if not isinstance(filters, dict):
+            raise QueryError("filters must be an object")
+        filters = {k: v if isinstance(v, list) else [v] for k, v in filters.items()}
+        for name, values in filters.items():
+            if not all(isinstance(v, _FILTER_VALUE_TYPES) for v in values):
+                raise QueryError(f"Invalid values for filter {name}")
+        order_by = data.get("order_by")
+        if order_by is not None and not isinstance(order_by, str):
+            raise QueryError("order_by must be a string")
+
+        try:
+            return cls(
+                source=data["source"],
+                metrics=metrics,
+                group_by=group_by,
+                since=when("since"),
+                until=when("until"),
+                filters=filters,
+                order_by=order_by,
+                limit=int(data["limit"]) if data.get("limit") is not None else None,
+                deltas=bool(data.get("deltas", False)),
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise QueryError(f"Invalid query spec: {exc}") from exc
+
+
+def _parse_metric(metric: str, source: Source) -> Tuple[str, Optional[str], Optional[str]]:
+    """(alias, aggregate, field) for a metric spec."""
+    if metric == "count":
+        return "rows", None, None
+    agg, _, name = metric.partition(":")
+    if agg not in AGGREGATES or name not in source.metrics:
+        raise QueryError(f"Unsupported metric: {metric}")
+    return f"{agg}_{name}", agg, name
+
+
+def compile_query(workspace_id, spec: QuerySpec):
+    """Build the QuerySet for ``spec``; returns (queryset, metric aliases, time dimension)."""
+    source = SOURCES.get(spec.source)
+    if source is None:
+        raise QueryError(f"Unsupported source: {spec.source}")
+    if not spec.metrics:
+        raise QueryError("At least one metric is required")
+
+    dimensions = {**_ACCOUNT_DIMENSIONS, **source.dimensions}
+    filters = {**_ACCOUNT_FILTERS, **source.filters}
+
+    time_dims = [d for d in spec.group_by if d in TIME_DIMENSIONS]
+    if len(time_dims) > 1:
+        raise QueryError("At most one time dimension")
+    time_dim = time_dims[0] if time_dims else None
+    if time_dim and time_dim not in source.time_dimensions:
+        raise QueryError(f"Unsupported time dimension for {spec.source}: {time_dim}")
+    for name in spec.group_by:
+        if name not in dimensions and name != time_dim:
+            raise QueryError(f"Unsupported group_by: {name}")
+    if spec.deltas and not time_dim:
+        raise QueryError("deltas need a time dimension in group_by")
+    if spec.limit is not None and spec.limit < 1:
+        raise QueryError("limit must be at least 1")
+
+    qs = source.model.objects.filter(social_account__workspace_id=workspace_id)
+    spec_filters = {"status": [SocialAccount.STATUS_ACTIVE], **spec.filters}
+    for name, values in spec_filters.items():
+        if name not in filters:
+            raise QueryError(f"Unsupported filter: {name}")
+        if name in _UUID_FILTERS:
+            try:
+                values = [uuid.UUID(str(v)) for v in values]
+            except ValueError:
+                raise QueryError(f"Invalid {name} filter: expected UUIDs")
+        qs = qs.filter(**{filters[name]: values})
+    if spec.since:
+        qs = qs.filter(**{f"{source.time_field}__gte": spec.since})
+    if spec.until:
+        qs = qs.filter(**{f"{source.time_field}__lt": spec.until})
+
+    if source.model is MetricsRollup:
+        qs = qs.filter(granularity=time_dim or MetricsRollup.GRANULARITY_DAY)
+
+    # Group-by columns (plain names when the dimension is a local field).
+    local, renamed = [], {}
+    for name in spec.group_by:
+        if name == time_dim:
+            if source.model is MetricsRollup:
+                renamed[name] = F("bucket_start")
+            elif source.time_field == "day":  # DateField (UTC days)
+                if time_dim == "day":
+                    local.append("day")
+                else:
+                    renamed[name] = Trunc("day", time_dim)
+            else:
+                renamed[name] = Trunc(source.time_field, time_dim, tzinfo=dt_timezone.utc)
+        elif dimensions[name] == name:
+            local.append(name)
+        else:
+            renamed[name] = F(dimensions[name])
+    qs = qs.values(*local, **renamed)
+
+    aliases = []
+    row_level = source.row_dimension is not None and source.row_dimension in spec.group_by
+    annotations = {}
+    for metric in spec.metrics:
+        alias, agg, name = _parse_metric(metric, source)
+        if alias in annotations:
+            continue
+        aliases.append(alias)
+        if agg is None:
+            if row_level:
+                raise QueryError("count is not available when grouping by rows")
+            annotations[alias] = Count("pk")
+        elif row_level:
+            annotations[alias] = F(name)
+        elif agg == "avg":
+            annotations[alias] = Avg(name, output_field=FloatField())
+        else:
+            annotations[alias] = AGGREGATES[agg](name)
+    qs = qs.annotate(**annotations)
+
+    if spec.order_by:
+        key = spec.order_by.lstrip("-")
+        if key not in aliases and key not in spec.group_by:
+            raise QueryError(f"Unsupported order_by: {spec.order_by}")
+        qs = qs.order_by(spec.order_by)
+    elif time_dim:
+        qs = qs.order_by(*[d for d in spec.group_by if d != time_dim], time_dim)
+    else:
+        qs = qs.order_by(*spec.group_by)
+
+    limit = min(spec.limit or MAX_ROWS, MAX_ROWS)
+    return qs[:limit], aliases, time_dim
+
+
+def _add_deltas(rows: List[Dict[str, Any]], spec: QuerySpec, aliases: List[str], time_dim: str) -> None:
+    group_keys = [d for d in spec.group_by if d != time_dim]
+    previous: Dict[Tuple, Dict[str, Any]] = {}
+    for row in sorted(rows, key=lambda r: r[time_dim]):
+        group = tuple(row[k] for k in group_keys)
+        before = previous.get(group)
+        for alias in aliases:
+            row[f"{alias}_delta"] = (
+                row[alias] - before[alias]
+                if before is not None and row[alias] is not None and before[alias] is not None
+                else None
+            )
+        previous[group] = row
+
+
+def run_query(workspace_id, spec: QuerySpec) -> List[Dict[str, Any]]:
+    """Execute ``spec`` for the workspace; one dict per group."""
+    qs, aliases, time_dim = compile_query(workspace_id, spec)
+    rows = list(qs)
+    if spec.deltas:
+        _add_deltas(rows, spec, aliases, time_dim)
+    return rows
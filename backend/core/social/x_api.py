@@ -4,14 +4,17 @@ Implements the official followers list endpoint:
 GET https://api.x.com/2/users/{id}/followers
 
 Docs: https://docs.x.com/x-api/users/get-followers
+
+Requests go through core.social.platforms.XClient (shared pool, timeouts,
+retry/backoff); errors are surfaced as XApiError.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
-import requests
+from core.social.platforms import PlatformAPIError, XClient
 
 
 @dataclass
@@ -21,7 +24,10 @@ class XFollowersPage:
 
 
 class XApiError(RuntimeError):
-    pass
+    def __init__(self, message: str, *, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
 
 
 def get_x_followers_page(
@@ -32,33 +38,14 @@ def get_x_followers_page(
     max_results: int = 1000,
     timeout: int = 30,
 ) -> XFollowersPage:
-    url = f"https://api.x.com/2/users/{platform_user_id}/followers"
-
-    params: Dict[str, Any] = {
-        "max_results": max_results,
-        "user.fields": "profile_image_url,verified,public_metrics",
-    }
-    if pagination_token:
-        params["pagination_token"] = pagination_token
-
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/json",
-    }
-
-    r = requests.get(url, params=params, headers=headers, timeout=timeout)
-
-    if r.status_code == 429:
-        raise XApiError("X rate limit exceeded (HTTP 429)")
-
-    if r.status_code >= 400:
-        try:
-            payload = r.json()
-        except Exception:
-            payload = {"text": r.text}
-        raise XApiError(f"X API error {r.status_code}: {payload}")
+    client = XClient(access_token, timeout=timeout)
+    try:
+        data = client.get_followers_page(
+            platform_user_id, pagination_token=pagination_token, max_results=max_results
+        )
+    except PlatformAPIError as e:
+        raise XApiError(str(e), status_code=e.status_code, retry_after=e.retry_after) from e
 
-    data = r.json() or {}
     users = data.get("data", []) or []
     meta = data.get("meta", {}) or {}
     next_token = meta.get("next_token")